@@ -0,0 +1,146 @@
+"""
+Benchmarks for the hangman word-list loaders.
+
+Run with `python bench_hangman.py` (optionally followed by a list of
+word counts, e.g. `python bench_hangman.py 1000000 10000000`).
+Run `python bench_hangman.py frames` for the turn-rendering benchmark.
+The first row for each size is the original readlines() loader, as a
+baseline; the last loads from a compiled word index.
+Each loader runs in a fresh child process so that its peak memory
+(max RSS) can be measured in isolation.
+"""
+import os
+import random
+import string
+import subprocess
+import sys
+import tempfile
+import time
+
+from typing import List, Tuple
+
+import hangman as hm
+
+DEFAULT_SIZES = [1_000_000, 10_000_000, 100_000_000]
+
+
+def load_words_readlines(filepath: str) -> List[str]:
+    """The original load_words_from_file, kept as the baseline: it holds
+    the whole file, every raw line and every word in memory at once.
+    """
+    with open(filepath, 'r') as f:
+        lines = f.readlines()
+        words = []
+        for line in lines:
+            word = line.strip().upper()
+            if word and word.isalpha():
+                words.append(word)
+        return words
+
+
+LOADERS = {
+    "readlines (baseline)": load_words_readlines,
+    "load_words_from_file": hm.load_words_from_file,
+    "load_word_store": hm.load_word_store,
+}
+
+
+def write_word_file(path: str, n_words: int, seed: int = 0) -> None:
+    """Writes n_words random lowercase words (4-12 letters) to path."""
+    rng = random.Random(seed)
+    letters = string.ascii_lowercase
+    with open(path, "w") as f:
+        remaining = n_words
+        while remaining:
+            chunk = min(remaining, 100_000)
+            f.write("".join(
+                "".join(rng.choices(letters, k=rng.randint(4, 12))) + "\n"
+                for _ in range(chunk)
+            ))
+            remaining -= chunk
+
+
+def _max_rss_mb() -> float:
+    """Peak resident set size of this process in MB (Unix only)."""
+    # getrusage's ru_maxrss can carry over the parent's peak across
+    # fork/exec, so prefer the kernel's per-process high-water mark.
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource  # pylint: disable=import-outside-toplevel
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def measure(loader: str, path: str) -> Tuple[float, float]:
+    """Runs one loader in a child process. Returns (seconds, peak MB)."""
+    output = subprocess.run(
+        [sys.executable, __file__, "--measure", loader, path],
+        check=True, capture_output=True, text=True,
+    ).stdout.split()
+    return float(output[0]), float(output[1])
+
+
+def _print_turn_legacy(game: hm.HangmanGame, write) -> None:
+    """One turn's output the way main_game_loop used to emit it: one
+    write per print call (as with an unbuffered terminal or socket).
+    """
+    write(hm.draw_hangman(game.wrong_guesses) + "\n")
+    if game.wrong_letters:
+        write(f"Wrong Guesses: {' '.join(sorted(list(game.wrong_letters)))}\n" + "\n")
+    write("The word: " + hm.get_display_word(game.secret_word, game.correct_letters) + "\n")
+    write("-" * 30 + "\n")
+
+
+def bench_frames(n_frames: int = 200_000) -> None:
+    """Prints frames per second for the old print-per-line output
+    and for render_turn with a single write, to an unbuffered devnull.
+    """
+    game = hm.HangmanGame("HANGMAN")
+    for letter in "AZQX":
+        game.guess(letter)
+    with open(os.devnull, "wb", buffering=0) as devnull:
+        write = lambda text: devnull.write(text.encode())
+        for name, render in (("print per line", lambda: _print_turn_legacy(game, write)),
+                             ("render_turn + 1 write", lambda: write(hm.render_turn(game)))):
+            start = time.perf_counter()
+            for _ in range(n_frames):
+                render()
+            elapsed = time.perf_counter() - start
+            print(f"{name:<22} {n_frames / elapsed:>12,.0f} frames/s")
+
+
+def main(sizes: List[int]) -> None:
+    """Prints load time and peak memory for each loader and size."""
+    print(f"{'words':>12} {'loader':<22} {'file MB':>8} {'seconds':>8} {'peak MB':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_words in sizes:
+            path = os.path.join(tmp, f"words_{n_words}.txt")
+            write_word_file(path, n_words)
+            file_mb = os.path.getsize(path) / (1024 * 1024)
+            for loader in LOADERS:
+                seconds, peak_mb = measure(loader, path)
+                print(f"{n_words:>12} {loader:<22} {file_mb:>8.1f} {seconds:>8.2f} {peak_mb:>8.1f}")
+            # Cold start again, this time from a compiled index
+            index_path = hm.compile_word_index(path)
+            seconds, peak_mb = measure("load_word_store", path)
+            print(f"{n_words:>12} {'load_word_store (idx)':<22} {file_mb:>8.1f} {seconds:>8.4f} {peak_mb:>8.1f}")
+            os.remove(path)
+            os.remove(index_path)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "--measure":
+        start = time.perf_counter()
+        words = LOADERS[sys.argv[2]](sys.argv[3])
+        elapsed = time.perf_counter() - start
+        print(elapsed, _max_rss_mb())
+    elif sys.argv[1:] == ["frames"]:
+        bench_frames()
+    else:
+        main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
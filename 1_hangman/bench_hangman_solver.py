@@ -0,0 +1,46 @@
+"""
+Benchmark for the Hangman solver.
+
+Run with `python bench_hangman_solver.py [WORD_FILE] [N_EXTRA]`.
+The solver plays every word in WORD_FILE (default hangman_word_list.txt)
+to completion and reports its win rate and time per move. Pass N_EXTRA
+(e.g. 1000000) to index that many additional random words as well, to
+time moves against a large dictionary.
+"""
+import random
+import string
+import sys
+import time
+
+import hangman as hm
+import hangman_solver as hs
+
+
+def main(word_file: str, n_extra: int) -> None:
+    """Builds a solver over the word list and plays every word."""
+    words = hm.load_words_from_file(word_file)
+    if not words:
+        sys.exit(f"Error: No words loaded from {word_file}")
+    dictionary = list(words)
+    rng = random.Random(0)
+    dictionary.extend("".join(rng.choices(string.ascii_uppercase, k=rng.randint(4, 12)))
+                      for _ in range(n_extra))
+
+    start = time.perf_counter()
+    solver = hs.HangmanSolver(dictionary)
+    print(f"Indexed {len(dictionary):,} words in {time.perf_counter() - start:.2f}s")
+
+    wins = moves = 0
+    start = time.perf_counter()
+    for word in words:
+        game = hs.play_game(solver, word)
+        wins += game.is_won
+        moves += len(game.guessed_letters)
+    elapsed = time.perf_counter() - start
+    print(f"Played {len(words)} games: {wins} won ({wins / len(words):.1%}), "
+          f"{moves} moves, {elapsed / moves * 1e6:.1f} us per move")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else "hangman_word_list.txt",
+         int(sys.argv[2]) if len(sys.argv) > 2 else 0)
@@ -1,13 +1,35 @@
-import random
-import string
+from __future__ import annotations
+
+import mmap
+import os
+import site
+import struct
 import sys  # Import sys to read command-line arguments
 
-from typing import List, Optional, Set
+from array import array
+from collections.abc import Sequence
+
+# Imports for type checkers only, off the startup path (see benchmarks/test_startup.py)
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import asyncio
+    import random
+    from typing import BinaryIO, Callable, Dict, Iterable, List, Optional, Set, TextIO, Union
 
 # --- Constants ---
 
 MAX_WRONG_GUESSES = 6
 
+# Default address for server mode (python hangman.py words.txt --serve [PORT])
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 5050
+
+# Compiled word indexes are written next to the word list with this suffix.
+INDEX_SUFFIX = ".idx"
+
+# ASCII_UPPERCASE, without importing string (which imports re)
+ASCII_UPPERCASE = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
 # ASCII art stages for the hangman.
 # Index 0 is the start (0 wrong guesses), index 6 is the end (6 wrong guesses).
 HANGMAN_PICS = [
@@ -72,20 +94,100 @@ HANGMAN_PICS = [
 
 # --- Logic Functions ---
 
+def _clean_word(line: str) -> Optional[str]:
+    """Applies the word-list validation rules to a single line.
+    The line is stripped of whitespace and converted to uppercase.
+    Returns the cleaned word, or None for empty or non-alphabetic lines.
+    """
+    word = line.strip().upper()
+    if word and word.isalpha():  # Ensure it's a valid word
+        return word
+    return None
+
+
+def _clean_word_bytes(raw: bytes) -> Optional[bytes]:
+    """Same rules as _clean_word, but for a raw UTF-8 encoded line.
+    Plain ASCII words (the common case) never get decoded; anything
+    else falls back to the str rules so both loaders always agree.
+    """
+    if raw.isascii():
+        word = raw.strip()
+        if word.isalpha():
+            return word.upper()
+    text_word = _clean_word(raw.decode("utf-8"))
+    return text_word.encode("utf-8") if text_word else None
+
+
+class WordStore(Sequence):
+    """A compact, read-only sequence of words.
+
+    All words are stored back to back in a single UTF-8 buffer, and
+    word i is buffer[offsets[i]:offsets[i + 1]]. This costs a few bytes
+    per word instead of a full Python str object for each one, and
+    works with random.choice (and so get_random_word) like a list.
+    """
+
+    __slots__ = ("_buffer", "_offsets")
+
+    def __init__(self, buffer: Union[bytes, bytearray, memoryview],
+                 offsets: Union["array[int]", memoryview]) -> None:
+        self._buffer = buffer
+        self._offsets = offsets
+
+    @property
+    def buffer(self) -> Union[bytes, bytearray, memoryview]:
+        """The packed UTF-8 words."""
+        return self._buffer
+
+    @property
+    def offsets(self) -> Union["array[int]", memoryview]:
+        """The len(self) + 1 word boundaries in buffer."""
+        return self._offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("WordStore index out of range")
+        start = self._offsets[index]
+        return str(self._buffer[start:self._offsets[index + 1]], "utf-8")
+
+
+def _pack_words(lines: Iterable[bytes]) -> WordStore:
+    """Validates raw lines and packs the valid words into a WordStore."""
+    buffer = bytearray()
+    offsets = array("Q", [0])
+    for raw in lines:
+        word = _clean_word_bytes(raw)
+        if word:
+            buffer += word
+            offsets.append(len(buffer))
+    return WordStore(buffer, offsets)
+
+
 def load_words_from_file(filepath: str) -> Optional[List[str]]:
     """Loads a list of words from a text file.  Expects one word per
     line. Words are stripped of whitespace and converted to uppercase.
     Returns a list of valid words, or None if the file can't be read.
+    If an up-to-date compiled index exists (see compile_word_index) the
+    words are read from it instead, with duplicates already removed.
     """
+    index = load_word_index(filepath)
+    if index is not None:
+        return list(index.words)
     try:
         with open(filepath, 'r') as f:
-            lines = f.readlines()
-            # Process lines: strip whitespace, convert to upper,
-            # and filter out empty strings or non-alphabetic lines.
+            # Process lines one at a time: strip whitespace, convert to
+            # upper, and filter out empty strings or non-alphabetic lines.
             words = []
-            for line in lines:
-                word = line.strip().upper()
-                if word and word.isalpha():  # Ensure it's a valid word
+            for line in f:
+                word = _clean_word(line)
+                if word:
                     words.append(word)
             return words
     except FileNotFoundError:
@@ -96,11 +198,264 @@ def load_words_from_file(filepath: str) -> Optional[List[str]]:
         return None
 
 
-def get_random_word(word_list: List[str]) -> str:
+def load_word_store(filepath: str) -> Optional[WordStore]:
+    """Loads a word list into a compact WordStore.
+    Uses the same validation rules as load_words_from_file, but maps the
+    file into memory and validates it in a single streaming pass, so
+    peak memory stays close to the size of the valid words themselves.
+    If an up-to-date compiled index exists, its mapped words are
+    returned directly without parsing the source at all.
+    Returns None if the file can't be read.
+    """
+    index = load_word_index(filepath)
+    if index is not None:
+        return index.words
+    try:
+        with open(filepath, 'rb') as f:
+            try:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # Empty files can't be memory-mapped
+                return WordStore(b"", array("Q", [0]))
+            with data:
+                return _pack_words(iter(data.readline, b""))
+    except FileNotFoundError:
+        print(f"Error: The file '{filepath}' was not found.")
+        return None
+    except IOError as e:
+        print(f"Error: Could not read the file '{filepath}'. Reason: {e}")
+        return None
+
+
+# --- Compiled Word Index ---
+#
+# Layout (little-endian), each section starting on an 8-byte boundary:
+#   header        _INDEX_HEADER (source mtime/size/SHA-256 and counts)
+#   offsets       (word_count + 1) x uint64, as in WordStore
+#   masks         word_count x uint32, bit n set if letter chr(65 + n) is
+#                 in the word (bit 26 stands for any non A-Z letter)
+#   by_length     word_count x uint32 word IDs, grouped by word length
+#   length_starts (max_length + 2) x uint64, IDs of length L are
+#                 by_length[length_starts[L]:length_starts[L + 1]]
+#   buffer        the packed UTF-8 words
+
+_INDEX_MAGIC = b"HANGIDX1"
+_INDEX_HEADER = struct.Struct("<8sqq32sQQQ")
+_INDEX_MTIME_OFFSET = 8  # Where the source mtime is in the header
+
+
+def _letter_mask(word: str) -> int:
+    """Returns the letter-set bitmask of a cleaned (uppercase) word."""
+    mask = 0
+    for letter in word:
+        bit = ord(letter) - 65
+        mask |= 1 << (bit if 0 <= bit < 26 else 26)
+    return mask
+
+
+def _align8(size: int) -> int:
+    return (size + 7) & ~7
+
+
+class WordIndex:
+    """A compiled word list: the unique words plus lookup tables.
+    Created by load_word_index, usually backed by a memory-mapped file.
+    """
+
+    __slots__ = ("words", "masks", "by_length", "length_starts")
+
+    def __init__(self, words: WordStore, masks: Sequence[int],
+                 by_length: Sequence[int], length_starts: Sequence[int]) -> None:
+        self.words = words
+        self.masks = masks
+        self.by_length = by_length
+        self.length_starts = length_starts
+
+    def ids_with_length(self, length: int) -> Sequence[int]:
+        """Returns the IDs (positions in words) of all words of a length."""
+        if not 0 <= length < len(self.length_starts) - 1:
+            return []
+        return self.by_length[self.length_starts[length]:self.length_starts[length + 1]]
+
+
+def _hash_file(filepath: str) -> bytes:
+    """Returns the SHA-256 digest of a file, read in 1 MB chunks."""
+    import hashlib  # pylint: disable=import-outside-toplevel
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def compile_word_index(filepath: str) -> Optional[str]:
+    """Compiles a word list into a binary index next to it (filepath +
+    INDEX_SUFFIX), which load_words_from_file and load_word_store then
+    pick up automatically while the source file is unchanged.
+    Words are validated as in load_words_from_file and deduplicated,
+    keeping the order in which they first appear.
+    Returns the index path, or None if the file can't be read.
+    """
+    try:
+        stat = os.stat(filepath)
+        digest = _hash_file(filepath)
+        buffer = bytearray()
+        offsets = array("Q", [0])
+        masks = array("I")
+        lengths = array("I")
+        seen: Set[bytes] = set()
+        with open(filepath, 'rb') as f:
+            for raw in f:
+                word = _clean_word_bytes(raw)
+                if word and word not in seen:
+                    seen.add(word)
+                    text = word.decode("utf-8")
+                    buffer += word
+                    offsets.append(len(buffer))
+                    masks.append(_letter_mask(text))
+                    lengths.append(len(text))
+    except FileNotFoundError:
+        print(f"Error: The file '{filepath}' was not found.")
+        return None
+    except IOError as e:
+        print(f"Error: Could not read the file '{filepath}'. Reason: {e}")
+        return None
+    del seen
+
+    # Counting sort of the word IDs by length.
+    max_length = max(lengths, default=0)
+    length_starts = array("Q", bytes(8 * (max_length + 2)))
+    for length in lengths:
+        length_starts[length + 1] += 1
+    for length in range(1, max_length + 2):
+        length_starts[length] += length_starts[length - 1]
+    by_length = array("I", bytes(4 * len(lengths)))
+    next_slot = array("Q", length_starts)
+    for word_id, length in enumerate(lengths):
+        by_length[next_slot[length]] = word_id
+        next_slot[length] += 1
+
+    header = _INDEX_HEADER.pack(_INDEX_MAGIC, stat.st_mtime_ns, stat.st_size, digest,
+                                len(lengths), max_length, len(buffer))
+    index_path = filepath + INDEX_SUFFIX
+    temp_path = index_path + ".tmp"
+    try:
+        with open(temp_path, 'wb') as f:
+            for section in (header, offsets, masks, by_length, length_starts):
+                data = bytes(section)
+                f.write(data + bytes(_align8(len(data)) - len(data)))
+            f.write(buffer)
+        os.replace(temp_path, index_path)  # Readers never see a half-written index
+    except IOError as e:
+        print(f"Error: Could not write the index '{index_path}'. Reason: {e}")
+        return None
+    return index_path
+
+
+def _index_sections(word_count: int, max_length: int):
+    """Returns (start, end, format) of each table in an index, and where its buffer starts."""
+    sections = []
+    start = _align8(_INDEX_HEADER.size)
+    for count, fmt in ((word_count + 1, "Q"), (word_count, "I"),
+                       (word_count, "I"), (max_length + 2, "Q")):
+        end = start + count * struct.calcsize(fmt)
+        sections.append((start, end, fmt))
+        start = _align8(end)
+    return sections, start
+
+
+def load_word_index(filepath: str) -> Optional[WordIndex]:
+    """Returns the compiled index for a word list, memory-mapped, or None
+    if there is no index, it is out of date (or the source can't be read
+    to tell), or it is truncated or padded (its length must be exactly
+    what its header describes).
+    The index is up to date when the source's modification time and size
+    still match. If only the modification time changed (e.g. the file was
+    copied or touched), the source's SHA-256 hash decides instead, and if
+    it matches the index is updated with the new time, so the file is
+    only hashed once.
+    """
+    index_path = filepath + INDEX_SUFFIX
+    try:
+        stat = os.stat(filepath)
+        with open(index_path, 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if len(data) < _INDEX_HEADER.size:
+        data.close()
+        return None
+    magic, mtime_ns, size, digest, word_count, max_length, buffer_size = \
+        _INDEX_HEADER.unpack_from(data)
+    sections, buffer_start = _index_sections(word_count, max_length)
+    if magic != _INDEX_MAGIC or size != stat.st_size or len(data) != buffer_start + buffer_size:
+        data.close()
+        return None
+    if mtime_ns != stat.st_mtime_ns:
+        try:
+            unchanged = digest == _hash_file(filepath)
+        except OSError:  # e.g. deleted or unreadable since the stat: stale
+            unchanged = False
+        if not unchanged:
+            data.close()
+            return None
+        _update_index_mtime(index_path, stat.st_mtime_ns)
+
+    view = memoryview(data)
+    offsets, masks, by_length, length_starts = (view[start:end].cast(fmt)
+                                                for start, end, fmt in sections)
+    words = WordStore(view[buffer_start:], offsets)
+    return WordIndex(words, masks, by_length, length_starts)
+
+
+def _update_index_mtime(index_path: str, mtime_ns: int) -> None:
+    """Records a new source modification time in an index whose source
+    content is unchanged. If the index is read-only, it stays as it is
+    and the source is hashed again next time.
+    """
+    try:
+        with open(index_path, 'r+b') as f:
+            f.seek(_INDEX_MTIME_OFFSET)
+            f.write(struct.pack("<q", mtime_ns))
+    except OSError:
+        pass
+
+
+def get_random_word(word_list: Sequence[str]) -> str:
     """Selects a single random word from the provided list."""
+    import random  # pylint: disable=import-outside-toplevel
     return random.choice(word_list)
 
 
+def get_random_word_from_file(filepath: str,
+                              rng: Optional[random.Random] = None) -> Optional[str]:
+    """Selects a single random word straight from a word-list file,
+    without loading the list into memory.
+    Uses reservoir sampling over one streaming pass: the k-th valid word
+    replaces the current pick with probability 1/k, so every valid word
+    (same rules as load_words_from_file) is equally likely.
+    Returns None if the file can't be read or has no valid words.
+    """
+    import random  # pylint: disable=import-outside-toplevel
+    randrange = rng.randrange if rng else random.randrange
+    chosen: Optional[bytes] = None
+    count = 0
+    try:
+        with open(filepath, 'rb') as f:
+            for raw in f:
+                word = _clean_word_bytes(raw)
+                if word:
+                    count += 1
+                    if randrange(count) == 0:
+                        chosen = word
+    except FileNotFoundError:
+        print(f"Error: The file '{filepath}' was not found.")
+        return None
+    except IOError as e:
+        print(f"Error: Could not read the file '{filepath}'. Reason: {e}")
+        return None
+    return chosen.decode("utf-8") if chosen else None
+
+
 def draw_hangman(wrong_guesses: int) -> str:
     """Returns the ASCII art string corresponding to the number of wrong guesses."""
     if 0 <= wrong_guesses < len(HANGMAN_PICS):
@@ -123,6 +478,20 @@ def get_display_word(secret_word: str, correct_letters: Set[str]) -> str:
     return display.strip()
 
 
+def _guess_error(guess: str, all_guessed_letters: Set[str]) -> Optional[str]:
+    """
+    Validates a guess. Returns the message explaining why it's invalid,
+    or None if it's a single letter (A-Z) that hasn't been guessed yet.
+    """
+    if len(guess) != 1:
+        return "Invalid input. Please enter exactly one letter."
+    if guess not in ASCII_UPPERCASE:
+        return "Invalid input. Please enter a letter (A-Z)."
+    if guess in all_guessed_letters:
+        return f"You have already guessed '{guess}'. Try again."
+    return None
+
+
 def get_guess(all_guessed_letters: Set[str]) -> str:
     """
     Prompts the user for a single letter guess and validates it.
@@ -132,12 +501,9 @@ def get_guess(all_guessed_letters: Set[str]) -> str:
     while True:
         guess = input("Guess a letter: ")
 
-        if len(guess) != 1:
-            print("Invalid input. Please enter exactly one letter.")
-        elif guess not in string.ascii_uppercase:
-            print("Invalid input. Please enter a letter (A-Z).")
-        elif guess in all_guessed_letters:
-            print(f"You have already guessed '{guess}'. Try again.")
+        error = _guess_error(guess, all_guessed_letters)
+        if error:
+            print(error)
         else:
             return guess
 
@@ -153,63 +519,252 @@ def check_win(secret_word: str, correct_letters: Set[str]) -> bool:
     return secret_word_letters <= correct_letters
 
 
+# --- Game State ---
+
+class HangmanGame:
+    """The state of one game of Hangman, kept up to date incrementally.
+
+    Everything that depends only on the secret word (where each letter
+    occurs, how many distinct letters there are) is worked out once.
+    A guess then costs O(occurrences of that letter) instead of a pass
+    over the whole word, and the results agree with get_display_word
+    and check_win at every step.
+    """
+
+    __slots__ = ("secret_word", "correct_letters", "wrong_letters", "guessed_letters",
+                 "wrong_guesses", "wrong_letters_display", "_positions", "_display",
+                 "_remaining", "_guessed_mask")
+
+    def __init__(self, secret_word: str) -> None:
+        self.secret_word = secret_word
+        self.correct_letters: Set[str] = set()
+        self.wrong_letters: Set[str] = set()
+        self.guessed_letters: Set[str] = set()  # correct_letters | wrong_letters
+        self.wrong_guesses = 0
+        self.wrong_letters_display = ""  # e.g. "K Q Z", updated on wrong guesses
+        # Bit i of _positions[letter] is set if secret_word[i] == letter
+        self._positions: Dict[str, int] = {}
+        for i, letter in enumerate(secret_word):
+            self._positions[letter] = self._positions.get(letter, 0) | (1 << i)
+        # The display string "P _ T H _ N" as a list; letter i lives at 2 * i
+        self._display = list(" ".join("_" * len(secret_word)))
+        self._remaining = len(self._positions)  # Distinct letters still hidden
+        self._guessed_mask = 0  # Bit n set if chr(65 + n) has been guessed
+
+    def has_guessed(self, letter: str) -> bool:
+        """Returns True if the (uppercase A-Z) letter was already guessed;
+        any other character never was."""
+        bit = ord(letter) - 65
+        return 0 <= bit < 26 and bool(self._guessed_mask >> bit & 1)
+
+    def guess(self, letter: str) -> bool:
+        """
+        Applies a validated guess (a single uppercase letter A-Z).
+        Returns True if the letter is in the word.
+        Raises ValueError if the letter is invalid or was already guessed.
+        """
+        if len(letter) != 1 or letter not in ASCII_UPPERCASE:
+            raise ValueError(f"Invalid guess {letter!r}. Guesses must be a letter (A-Z).")
+        bit = 1 << (ord(letter) - 65)
+        if self._guessed_mask & bit:
+            raise ValueError(f"'{letter}' has already been guessed.")
+        self._guessed_mask |= bit
+        self.guessed_letters.add(letter)
+
+        positions = self._positions.get(letter, 0)
+        if not positions:
+            self.wrong_letters.add(letter)
+            self.wrong_guesses += 1
+            self.wrong_letters_display = " ".join(sorted(self.wrong_letters))
+            return False
+        self.correct_letters.add(letter)
+        self._remaining -= 1
+        while positions:
+            lowest = positions & -positions
+            self._display[2 * (lowest.bit_length() - 1)] = letter
+            positions ^= lowest
+        return True
+
+    @property
+    def display_word(self) -> str:
+        """The same string get_display_word would return for this state."""
+        return "".join(self._display)
+
+    @property
+    def is_won(self) -> bool:
+        """Same result as check_win for this state."""
+        return self._remaining == 0
+
+    @property
+    def is_lost(self) -> bool:
+        return self.wrong_guesses >= MAX_WRONG_GUESSES
+
+
+# --- Rendering ---
+#
+# Each step of the game is rendered to a single string so it can be sent
+# with one write call. The text is exactly what the original print calls
+# produced; the fixed parts are built once here.
+
+_FRAMES = tuple(pic + "\n" for pic in HANGMAN_PICS)
+_SEPARATOR = "-" * 30 + "\n"
+_BANNER = "************************************\n"
+
+
+def _frame(wrong_guesses: int) -> str:
+    """draw_hangman's picture, with its trailing newline."""
+    if 0 <= wrong_guesses < len(_FRAMES):
+        return _FRAMES[wrong_guesses]
+    return _FRAMES[-1]
+
+
+def render_welcome(edition: str = "CLI") -> str:
+    """Returns the welcome message shown before the first turn."""
+    return ("==============================\n"
+            f"Welcome to Hangman ({edition} Edition)!\n"
+            "==============================\n"
+            f"You have {MAX_WRONG_GUESSES} wrong guesses. Good luck!\n\n")
+
+
+def render_turn(game: HangmanGame) -> str:
+    """Returns the hangman, wrong guesses and word-in-progress for a turn."""
+    frame = _frame(game.wrong_guesses)
+    if game.wrong_letters_display:
+        frame += f"Wrong Guesses: {game.wrong_letters_display}\n\n"
+    return f"{frame}The word: {game.display_word}\n{_SEPARATOR}"
+
+
+def render_guess(game: HangmanGame, guess: str, correct: bool) -> str:
+    """Returns the feedback for a guess, plus the result if the game is over."""
+    if correct:
+        text = f"\nGood guess! '{guess}' is in the word.\n\n"
+    else:
+        text = f"\nSorry, '{guess}' is not in the word.\n\n"
+    if game.is_won:
+        text += (f"{_BANNER}YOU WIN! Congratulations!\n"
+                 f"You guessed the word: {game.secret_word}\n{_BANNER}")
+    elif game.is_lost:
+        text += (f"{_frame(game.wrong_guesses)}{_BANNER}GAME OVER. You lost.\n"
+                 f"The secret word was: {game.secret_word}\n{_BANNER}")
+    return text
+
+
 # --- Main Game Loop ---
 
-def main_game_loop(word_list: List[str]) -> None:
-    """Runs the main flow of the Hangman game using the provided word_list."""
-    print("==============================")
-    print("Welcome to Hangman (CLI Edition)!")
-    print("==============================")
-    print(f"You have {MAX_WRONG_GUESSES} wrong guesses. Good luck!\n")
+def main_game_loop(word_list: Sequence[str], out: Optional[TextIO] = None) -> None:
+    """Runs the main flow of the Hangman game using the provided word_list.
+    Each turn's output is written to `out` (default sys.stdout) with a
+    single write call.
+    """
+    out = out or sys.stdout
+    pending = render_welcome()
 
     # --- Initialize Game State ---
     secret_word = get_random_word(word_list)  # Use the passed-in list
-    correct_letters : Set = set()  # A set of letters the user has guessed correctly
-    wrong_letters : Set = set()    # A set of letters the user has guessed incorrectly
-    wrong_guesses_made = 0   # Counter for wrong guesses
+    game = HangmanGame(secret_word)  # Tracks guesses, the display word and wins
 
     # --- The Loop ---
-    game_over = False
-    while not game_over:
-        # 1. Display current state
-        print(draw_hangman(wrong_guesses_made))
+    while True:
+        # 1. Display current state (with the previous guess's feedback)
+        out.write(pending + render_turn(game))
+        out.flush()
+
+        # 2. Get user input
+        guess = get_guess(game.guessed_letters)
 
-        # Display wrong letters (if any)
-        if wrong_letters:
-            # Sort the letters for a clean display
-            print(f"Wrong Guesses: {' '.join(sorted(list(wrong_letters)))}\n")
+        # 3. Process the guess, and 4. check for Win/Loss conditions
+        pending = render_guess(game, guess, game.guess(guess))
+        if game.is_won or game.is_lost:
+            out.write(pending)
+            out.flush()
+            break
 
-        # Display the word-in-progress (e.g., P _ T H _ N)
-        print("The word: " + get_display_word(secret_word, correct_letters))
-        print("-" * 30)
 
-        # 2. Get user input
-        all_guessed = correct_letters | wrong_letters  # Combine both sets
-        guess = get_guess(all_guessed)
+# --- Server Mode ---
 
-        # 3. Process the guess
-        if guess in secret_word:
-            print(f"\nGood guess! '{guess}' is in the word.\n")
-            correct_letters.add(guess)
-        else:
-            print(f"\nSorry, '{guess}' is not in the word.\n")
-            wrong_letters.add(guess)
-            wrong_guesses_made += 1
-
-        # 4. Check for Win/Loss conditions
-        if check_win(secret_word, correct_letters):
-            print("************************************")
-            print(f"YOU WIN! Congratulations!")
-            print(f"You guessed the word: {secret_word}")
-            print("************************************")
-            game_over = True
-        elif wrong_guesses_made >= MAX_WRONG_GUESSES:
-            print(draw_hangman(wrong_guesses_made))  # Show the final hanging
-            print("************************************")
-            print("GAME OVER. You lost.")
-            print(f"The secret word was: {secret_word}")
-            print("************************************")
-            game_over = True
+async def _play_session(word_list: Sequence[str], reader: asyncio.StreamReader,
+                        writer: asyncio.StreamWriter) -> None:
+    """Plays one game of Hangman over a line-based connection.
+    Each session has its own HangmanGame; the word list is shared
+    read-only between all sessions. The text sent is the same as the
+    CLI prints, and each guess is read as one line.
+    """
+    game = HangmanGame(get_random_word(word_list))
+    pending = render_welcome("Server")
+    try:
+        while not (game.is_won or game.is_lost):
+            pending += render_turn(game)
+
+            # Prompt until we get a valid guess, just like get_guess
+            while True:
+                writer.write((pending + "Guess a letter: ").encode())
+                await writer.drain()
+                line = await reader.readline()
+                if not line:
+                    return  # Client disconnected
+                guess = line.decode(errors="replace").strip()
+                error = _guess_error(guess, game.guessed_letters)
+                if not error:
+                    break
+                pending = error + "\n"
+
+            pending = render_guess(game, guess, game.guess(guess))
+        writer.write(pending.encode())
+        await writer.drain()
+    except ConnectionError:
+        pass  # The client went away mid-game
+    except ValueError:
+        pass  # A line over the reader's limit (64 KiB): drop the client, like a disconnect
+    finally:
+        writer.close()
+
+
+async def serve(word_list: Sequence[str], host: str = SERVER_HOST,
+                port: int = SERVER_PORT) -> None:
+    """Serves independent Hangman games to any number of clients
+    (e.g. `nc localhost 5050`) on a single event loop, until cancelled.
+    """
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        await _play_session(word_list, reader, writer)
+
+    import asyncio  # pylint: disable=import-outside-toplevel
+    server = await asyncio.start_server(handle, host, port, backlog=4096)
+    async with server:
+        print(f"Serving Hangman on {host}:{port} ({len(word_list)} words)")
+        await server.serve_forever()
+
+
+# --- Batch Mode ---
+
+def _batch_letters(request: dict) -> Set[str]:
+    """A request's "letters" field, a string or list of letters, as a set."""
+    return set("".join(request.get("letters", "")))
+
+
+def batch_operations(word_list: Sequence[str]) -> Dict[str, Callable[[dict], object]]:
+    """The ops of `python hangman.py words.txt --batch`, by name, drawing
+    random words from word_list.
+    """
+    return {
+        "random_word": lambda request: get_random_word(word_list),
+        "display_word": lambda request: get_display_word(request["word"], _batch_letters(request)),
+        "check_win": lambda request: check_win(request["word"], _batch_letters(request)),
+        # The reason the guess is invalid, or null if it is a new letter
+        "validate_guess": lambda request: _guess_error(request["guess"], _batch_letters(request)),
+    }
+
+
+def run_batch(word_list: Sequence[str], in_stream: BinaryIO, out_stream: BinaryIO,
+              chunk_size: Optional[int] = None) -> int:
+    """Answers JSON requests for batch_operations(word_list) until the
+    input ends (see common/batch_mode.py), e.g. {"id": 1, "op":
+    "display_word", "word": "PYTHON", "letters": "PN"} ->
+    {"id": 1, "result": "P _ _ _ _ N"}.
+    Returns the number of requests that failed.
+    """
+    site.addsitedir(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "common"))
+    import batch_mode  # pylint: disable=import-outside-toplevel
+    return batch_mode.run_batch(batch_operations(word_list), in_stream, out_stream, chunk_size)
 
 
 # --- Entry Point ---
@@ -218,11 +773,45 @@ if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Error: No word list file provided.")
         print("Usage: python hangman_cli.py words.txt")
+        print("       python hangman_cli.py words.txt --serve [PORT]")
+        print("       python hangman_cli.py words.txt --batch < requests.jsonl")
+        print("       python hangman_cli.py --compile words.txt")
         sys.exit(1)  # Exit with an error code
 
+    # Compile a word list into a binary index, then exit
+    if sys.argv[1] == "--compile":
+        for word_file_path in sys.argv[2:]:
+            index_path = compile_word_index(word_file_path)
+            if index_path is None:
+                sys.exit(1)
+            print(f"Wrote {index_path}")
+        sys.exit(0)
+
     # The first argument (index 1) is the filepath
     word_file_path = sys.argv[1]
-    
+
+    # Server mode: one compact word list shared by every session
+    if len(sys.argv) > 2 and sys.argv[2] == "--serve":
+        server_words = load_word_store(word_file_path)
+        if not server_words:
+            print("No valid words found in the file. Cannot start server.")
+            sys.exit(1)
+        port = int(sys.argv[3]) if len(sys.argv) > 3 else SERVER_PORT
+        try:
+            import asyncio  # pylint: disable=import-outside-toplevel
+            asyncio.run(serve(server_words, SERVER_HOST, port))
+        except KeyboardInterrupt:
+            pass
+        sys.exit(0)
+
+    # Batch mode: JSON requests on stdin, JSON responses on stdout
+    if len(sys.argv) > 2 and sys.argv[2] == "--batch":
+        batch_words = load_word_store(word_file_path)
+        if not batch_words:
+            print("No valid words found in the file. Cannot start batch mode.", file=sys.stderr)
+            sys.exit(1)
+        sys.exit(1 if run_batch(batch_words, sys.stdin.buffer, sys.stdout.buffer) else 0)
+
     # Load words from the specified file
     game_words = load_words_from_file(word_file_path)
 
@@ -0,0 +1,83 @@
+"""
+Load test for the Hangman server mode.
+
+Run with `python hangman_loadtest.py [SESSIONS] [PORT]`, e.g.
+`python hangman_loadtest.py 10000`. Unless a server is already listening
+on PORT, one is started in a subprocess with hangman_word_list.txt.
+Every session plays a full game concurrently, guessing letters in a
+random order, and the time from sending a guess to receiving the next
+prompt (or the end of the game) is recorded as that guess's latency.
+At most as many sessions as the open file limit allows (for both the
+client and a local server) are connected at once; the rest wait for a
+free slot.
+"""
+import asyncio
+import os
+import random
+import site
+import string
+import sys
+import time
+
+from typing import List, Tuple
+
+import hangman as hm
+
+DEFAULT_SESSIONS = 10_000
+PROMPT = b"Guess a letter: "
+WORD_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "hangman_word_list.txt")
+
+
+async def _play(port: int, latencies: List[float], rng: random.Random,
+                limit: asyncio.Semaphore) -> None:
+    """Plays one game against the server, recording each guess's latency."""
+    letters = list(string.ascii_uppercase)
+    rng.shuffle(letters)
+    async with limit:
+        reader, writer = await asyncio.open_connection(hm.SERVER_HOST, port)
+        try:
+            await reader.readuntil(PROMPT)
+            for letter in letters:
+                start = time.perf_counter()
+                writer.write(letter.encode() + b"\n")
+                try:
+                    await reader.readuntil(PROMPT)
+                except asyncio.IncompleteReadError:
+                    latencies.append(time.perf_counter() - start)
+                    break  # The server closed the connection: game over
+                latencies.append(time.perf_counter() - start)
+        finally:
+            writer.close()
+
+
+async def run_load_test(sessions: int, port: int, concurrency: int,
+                        seed: int = 0) -> Tuple[float, List[float], List[BaseException]]:
+    """Runs the sessions, up to `concurrency` at a time. Returns the
+    seconds taken, every guess's latency and the sessions' failures."""
+    latencies: List[float] = []
+    limit = asyncio.Semaphore(concurrency)
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(_play(port, latencies, random.Random(rng.random()), limit) for _ in range(sessions)),
+        return_exceptions=True,
+    )
+    elapsed = time.perf_counter() - start
+    return elapsed, latencies, [r for r in results if isinstance(r, BaseException)]
+
+
+def main(sessions: int, port: int) -> None:
+    """Starts a local server if needed, then runs the load test and
+    prints throughput and latency."""
+    site.addsitedir(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "common"))
+    import loadtest  # pylint: disable=import-outside-toplevel
+    concurrency = loadtest.max_concurrency(sessions, loadtest.raise_open_file_limit())
+    with loadtest.local_server([sys.executable, hm.__file__, WORD_FILE, "--serve", str(port)],
+                               hm.SERVER_HOST, port, "Hangman"):
+        elapsed, latencies, failures = asyncio.run(run_load_test(sessions, port, concurrency))
+    loadtest.print_report(sessions, concurrency, elapsed, latencies, failures)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SESSIONS,
+         int(sys.argv[2]) if len(sys.argv) > 2 else hm.SERVER_PORT)
@@ -0,0 +1,203 @@
+"""
+Headless batch simulation of Hangman games, to estimate how hard each
+word is (its win rate) for a given guessing strategy.
+
+Run with e.g.
+`python hangman_simulate.py hangman_word_list.txt --games 100 --strategy random --out results.csv`
+
+Games follow the normal rules (check_win and MAX_WRONG_GUESSES). Word
+IDs are split into chunks and played on a process pool. The word list
+is loaded once into shared memory and every worker reads it from
+there, so it is never pickled. Results are written as each chunk
+finishes: CSV by default, or JSON lines if the output ends in .jsonl.
+"""
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from typing import Callable, Dict, List, Optional, Set, TextIO, Tuple
+
+import hangman as hm
+import hangman_solver as hs
+
+STRATEGIES = ("solver", "frequency", "random")
+FIELDS = ("word", "games", "wins", "win_rate", "avg_wrong_guesses")
+
+# Per-worker state, set up once by _init_worker
+_worker_words: Optional[hm.WordStore] = None
+_worker_solver: Optional[hs.HangmanSolver] = None
+_worker_shm: Optional[shared_memory.SharedMemory] = None
+
+
+def play_one(secret_word: str, choose_letter: Callable[[str, Set[str], Set[str]], str]) -> Tuple[bool, int]:
+    """
+    Plays one game. choose_letter(display_word, correct_letters, wrong_letters)
+    returns the next (unguessed) letter. Returns (won, wrong guesses made).
+    """
+    correct_letters: Set[str] = set()
+    wrong_letters: Set[str] = set()
+    while True:
+        letter = choose_letter(hm.get_display_word(secret_word, correct_letters),
+                               correct_letters, wrong_letters)
+        if letter in secret_word:
+            correct_letters.add(letter)
+        else:
+            wrong_letters.add(letter)
+        if hm.check_win(secret_word, correct_letters):
+            return True, len(wrong_letters)
+        if len(wrong_letters) >= hm.MAX_WRONG_GUESSES or len(correct_letters | wrong_letters) == 26:
+            return False, len(wrong_letters)
+
+
+def make_strategy(name: str, rng: random.Random) -> Callable[[str, Set[str], Set[str]], str]:
+    """Returns the choose_letter function for a strategy name."""
+    if name == "solver":
+        assert _worker_solver is not None
+        solver = _worker_solver
+        return lambda display, correct, wrong: solver.best_letter(display, wrong) or "A"
+    if name == "frequency":
+        return lambda display, correct, wrong: next(
+            letter for letter in hs.FREQUENCY_ORDER if letter not in correct and letter not in wrong)
+    if name == "random":
+        def random_letter(display: str, correct: Set[str], wrong: Set[str]) -> str:
+            return rng.choice([letter for letter in hs.FREQUENCY_ORDER
+                               if letter not in correct and letter not in wrong])
+        return random_letter
+    raise ValueError(f"Unknown strategy {name!r}. Choose from {', '.join(STRATEGIES)}.")
+
+
+# --- Shared Memory ---
+
+def share_word_store(words: hm.WordStore) -> shared_memory.SharedMemory:
+    """Copies a WordStore into a new shared memory block laid out as
+    [word count][offsets][buffer]. The caller must close and unlink it.
+    """
+    header = array("Q", [len(words)]).tobytes()
+    offsets = bytes(words.offsets)
+    buffer = bytes(words.buffer)
+    buffer_start = len(header) + len(offsets)
+    shm = shared_memory.SharedMemory(create=True, size=max(buffer_start + len(buffer), 1))
+    shm.buf[:len(header)] = header
+    shm.buf[len(header):buffer_start] = offsets
+    shm.buf[buffer_start:buffer_start + len(buffer)] = buffer
+    return shm
+
+
+def attach_word_store(shm: shared_memory.SharedMemory) -> hm.WordStore:
+    """Returns a WordStore that reads directly from a share_word_store block."""
+    count = shm.buf[:8].cast("Q")[0]
+    offsets_end = 8 * (count + 2)
+    offsets = shm.buf[8:offsets_end].cast("Q")
+    return hm.WordStore(shm.buf[offsets_end:offsets_end + offsets[count]], offsets)
+
+
+def _init_worker(shm_name: str, strategy: str) -> None:
+    global _worker_words, _worker_solver, _worker_shm  # pylint: disable=global-statement
+    # Workers share the parent's resource tracker, so attaching here doesn't
+    # change who unlinks the block: simulate() does, once the pool is done.
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    _worker_words = attach_word_store(_worker_shm)
+    if strategy == "solver":
+        _worker_solver = hs.HangmanSolver(_worker_words)
+
+
+def _simulate_chunk(start: int, stop: int, games: int, strategy: str, seed: int) -> List[Dict]:
+    """Plays `games` games for each word ID in [start, stop)."""
+    assert _worker_words is not None
+    rng = random.Random(seed)
+    choose_letter = make_strategy(strategy, rng)
+    rows = []
+    for word_id in range(start, stop):
+        word = _worker_words[word_id]
+        wins = wrong_total = 0
+        for _ in range(games):
+            won, wrong = play_one(word, choose_letter)
+            wins += won
+            wrong_total += wrong
+        rows.append({"word": word, "games": games, "wins": wins,
+                     "win_rate": wins / games, "avg_wrong_guesses": wrong_total / games})
+    return rows
+
+
+# --- Driver ---
+
+def simulate(words: hm.WordStore, out: TextIO, games: int = 10, strategy: str = "random",
+             workers: Optional[int] = None, chunk_size: int = 256, seed: int = 0,
+             jsonl: bool = False) -> int:
+    """
+    Simulates `games` games per word over a process pool, writing one
+    result row per word to `out` as chunks complete (so rows arrive in
+    completion order, not word order). Returns the number of rows written.
+    Raises ValueError for an unknown strategy, or games or chunk_size < 1.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy {strategy!r}. Choose from {', '.join(STRATEGIES)}.")
+    if games < 1 or chunk_size < 1:
+        raise ValueError(f"games and chunk_size must be at least 1, not {games} and {chunk_size}.")
+    writer = None if jsonl else csv.DictWriter(out, fieldnames=FIELDS)
+    if writer:
+        writer.writeheader()
+    written = 0
+    shm = share_word_store(words)
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(shm.name, strategy)) as pool:
+            futures = [pool.submit(_simulate_chunk, start, min(start + chunk_size, len(words)),
+                                   games, strategy, seed + start)
+                       for start in range(0, len(words), chunk_size)]
+            for future in as_completed(futures):
+                rows = future.result()
+                if writer:
+                    writer.writerows(rows)
+                else:
+                    out.write("".join(json.dumps(row) + "\n" for row in rows))
+                out.flush()
+                written += len(rows)
+    finally:
+        shm.close()
+        shm.unlink()
+    return written
+
+
+def _positive_int(text: str) -> int:
+    """argparse type for options that must be at least 1."""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, not {value}")
+    return value
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Estimate Hangman win rates per word.")
+    parser.add_argument("word_file")
+    parser.add_argument("--games", type=_positive_int, default=10, help="games per word (default 10)")
+    parser.add_argument("--strategy", choices=STRATEGIES, default="random")
+    parser.add_argument("--workers", type=_positive_int, default=None, help="default: one per CPU")
+    parser.add_argument("--chunk-size", type=_positive_int, default=256, help="words per task")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="-", help="output file (.csv or .jsonl), default stdout")
+    args = parser.parse_args(argv)
+
+    words = hm.load_word_store(args.word_file)
+    if not words:
+        sys.exit("No valid words found in the file. Cannot simulate.")
+    jsonl = args.out.endswith(".jsonl")
+    out = sys.stdout if args.out == "-" else open(args.out, "w", newline="")
+    try:
+        written = simulate(words, out, args.games, args.strategy, args.workers,
+                           args.chunk_size, args.seed, jsonl)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(f"Simulated {args.games} games for each of {written} words "
+          f"on {args.workers or os.cpu_count()} workers.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
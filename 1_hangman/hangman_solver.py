@@ -0,0 +1,118 @@
+"""
+A Hangman solver, for benchmarking bot players.
+
+The solver indexes a word list once. Word IDs are numbered separately
+within each word length, and every (length, position, letter) and
+(length, letter) pair maps to a bitset (a Python int) of the IDs that
+match. Narrowing the candidates after a guess is then a handful of
+bitset intersections rather than a rescan of every word.
+"""
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import hangman as hm
+
+# Fallback order when no dictionary word fits the pattern (English letter frequency)
+FREQUENCY_ORDER = "ETAOINSHRDLCUMWFGYPBVKJXQZ"
+
+
+def _bitset(ids: Iterable[int], size: int) -> int:
+    """Builds an int with bit i set for each i in ids (O(size / 8) bytes).
+    Setting bits one at a time on an int would copy it every time.
+    """
+    bits = bytearray((size + 7) // 8)
+    for i in ids:
+        bits[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(bits, "little")
+
+
+class HangmanSolver:
+    """Picks the next letter to guess for a Hangman pattern.
+
+    The best letter is the one that appears in the most remaining
+    candidate words, which maximises the chance of a correct guess.
+    """
+
+    __slots__ = ("_words", "_all", "_positions", "_contains")
+
+    def __init__(self, word_list: Sequence[str]) -> None:
+        # Word IDs grouped by length; a word's bit is its index in its group
+        self._words: Dict[int, List[str]] = {}
+        for word in word_list:
+            self._words.setdefault(len(word), []).append(word)
+
+        self._all: Dict[int, int] = {}
+        self._positions: Dict[Tuple[int, int, str], int] = {}
+        self._contains: Dict[Tuple[int, str], int] = {}
+        for length, words in self._words.items():
+            positions: Dict[Tuple[int, str], List[int]] = {}
+            contains: Dict[str, List[int]] = {}
+            for word_id, word in enumerate(words):
+                for i, letter in enumerate(word):
+                    positions.setdefault((i, letter), []).append(word_id)
+                for letter in set(word):
+                    contains.setdefault(letter, []).append(word_id)
+            size = len(words)
+            self._all[length] = (1 << size) - 1
+            for (i, letter), ids in positions.items():
+                self._positions[length, i, letter] = _bitset(ids, size)
+            for letter, ids in contains.items():
+                self._contains[length, letter] = _bitset(ids, size)
+
+    def candidates(self, pattern: str, wrong_letters: Iterable[str]) -> int:
+        """
+        Returns the bitset of words (within the pattern's length group)
+        consistent with a get_display_word pattern such as "P _ T H _ N"
+        and the set of wrong letters.
+        """
+        letters = pattern[::2]  # Drop the separating spaces
+        length = len(letters)
+        candidates = self._all.get(length, 0)
+        revealed = set(letters) - {"_"}
+        for i, shown in enumerate(letters):
+            if shown != "_":
+                candidates &= self._positions.get((length, i, shown), 0)
+            else:
+                # A revealed letter shows at every position it occurs
+                for letter in revealed:
+                    candidates &= ~self._positions.get((length, i, letter), 0)
+        for letter in wrong_letters:
+            candidates &= ~self._contains.get((length, letter), 0)
+        return candidates
+
+    def candidate_words(self, pattern: str, wrong_letters: Iterable[str]) -> List[str]:
+        """Returns the words consistent with the pattern and wrong letters."""
+        candidates = self.candidates(pattern, wrong_letters)
+        words = self._words.get(len(pattern[::2]), [])
+        return [word for word_id, word in enumerate(words) if candidates >> word_id & 1]
+
+    def best_letter(self, pattern: str, wrong_letters: Set[str]) -> Optional[str]:
+        """
+        Returns the unguessed letter that occurs in the most candidate
+        words (ties go to the more common English letter), or None once
+        every letter has been guessed.
+        """
+        guessed = set(pattern[::2]) | wrong_letters
+        length = len(pattern[::2])
+        candidates = self.candidates(pattern, wrong_letters)
+        best, best_count = None, 0
+        for letter in FREQUENCY_ORDER:
+            if letter not in guessed:
+                count = (candidates & self._contains.get((length, letter), 0)).bit_count()
+                if count > best_count:
+                    best, best_count = letter, count
+        if best is None:  # The word isn't in the dictionary: fall back on frequency
+            best = next((letter for letter in FREQUENCY_ORDER if letter not in guessed), None)
+        return best
+
+
+def play_game(solver: HangmanSolver, secret_word: str) -> hm.HangmanGame:
+    """Lets the solver play a full game against secret_word.
+    Returns the finished game (check is_won and wrong_guesses).
+    """
+    game = hm.HangmanGame(secret_word)
+    while not (game.is_won or game.is_lost):
+        letter = solver.best_letter(game.display_word, game.wrong_letters)
+        if letter is None:
+            break
+        game.guess(letter)
+    return game
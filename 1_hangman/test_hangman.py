@@ -1,5 +1,5 @@
 import sys
-from unittest.mock import patch, mock_open
+from unittest.mock import MagicMock, patch, mock_open
 import hangman as hm  # Import the game file to test its functions
 
 from typing import Set, Callable
@@ -114,3 +114,259 @@ def test_load_words_io_error() -> None:
             mock_print_call.assert_called_once()
             print_arg = mock_print_call.call_args[0][0]
             assert "Error: Could not read the file" in print_arg, "Error message for IOError was incorrect"
+
+
+def test_load_word_store_matches_list_loader(tmp_path) -> None:
+    """
+    Tests that the compact WordStore loader applies exactly the same
+    cleaning rules as load_words_from_file. A real file is used because
+    the loader memory-maps it.
+    """
+    word_file = tmp_path / "words.txt"
+    word_file.write_text("  apple\nBanana\n\nTEST\n12345\nword-with-hyphen\ncafé\nfinal")
+
+    store = hm.load_word_store(str(word_file))
+    assert store is not None
+    assert list(store) == hm.load_words_from_file(str(word_file))
+    assert list(store) == ["APPLE", "BANANA", "TEST", "CAFÉ", "FINAL"]
+    assert len(store) == 5
+    assert store[-1] == "FINAL"
+    assert hm.get_random_word(store) in store
+
+
+def test_load_word_store_empty_and_missing_file(tmp_path) -> None:
+    """
+    Tests that an empty file gives an empty store and a missing file
+    returns None with the usual error message.
+    """
+    empty_file = tmp_path / "empty.txt"
+    empty_file.write_text("")
+    assert len(hm.load_word_store(str(empty_file))) == 0
+
+    with patch('builtins.print') as mock_print_call:
+        assert hm.load_word_store(str(tmp_path / "nonexistent.txt")) is None
+        assert "Error: The file" in mock_print_call.call_args[0][0]
+
+
+def test_get_random_word_from_file_is_uniform(tmp_path) -> None:
+    """
+    Tests that reservoir sampling only ever returns valid words, and
+    that each valid word is picked roughly equally often.
+    """
+    import random
+    word_file = tmp_path / "words.txt"
+    word_file.write_text("apple\n123\nbanana\n\ncherry\nnot valid\n")
+
+    rng = random.Random(42)
+    counts = {"APPLE": 0, "BANANA": 0, "CHERRY": 0}
+    for _ in range(3000):
+        counts[hm.get_random_word_from_file(str(word_file), rng)] += 1
+    assert all(800 < n < 1200 for n in counts.values()), f"Skewed picks: {counts}"
+
+
+def test_get_random_word_from_file_no_words(tmp_path) -> None:
+    """
+    Tests that a file with no valid words, or no file at all, gives None.
+    """
+    word_file = tmp_path / "words.txt"
+    word_file.write_text("123\n\n")
+    assert hm.get_random_word_from_file(str(word_file)) is None
+
+    with patch('builtins.print'):
+        assert hm.get_random_word_from_file(str(tmp_path / "missing.txt")) is None
+
+
+def test_compiled_word_index(tmp_path) -> None:
+    """
+    Tests that a compiled index is deduplicated, has correct lookup
+    tables, and is used by the loaders only while the source is unchanged.
+    """
+    import os
+    word_file = tmp_path / "words.txt"
+    word_file.write_text("apple\nbanana\n123\nApple\nfig\nkiwi\n")
+
+    assert hm.compile_word_index(str(word_file)) == str(word_file) + hm.INDEX_SUFFIX
+    index = hm.load_word_index(str(word_file))
+    assert index is not None
+    assert list(index.words) == ["APPLE", "BANANA", "FIG", "KIWI"]
+    assert [index.words[i] for i in index.ids_with_length(4)] == ["KIWI"]
+    assert list(index.ids_with_length(99)) == []
+    assert index.masks[2] == (1 << 5) | (1 << 8) | (1 << 6)  # F, I, G
+    assert hm.load_words_from_file(str(word_file)) == ["APPLE", "BANANA", "FIG", "KIWI"]
+    assert list(hm.load_word_store(str(word_file))) == ["APPLE", "BANANA", "FIG", "KIWI"]
+
+    # Touching the file keeps the index valid, since its hash still matches,
+    # and the index records the new time so the next load doesn't hash again
+    stat = os.stat(word_file)
+    os.utime(word_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert hm.load_word_index(str(word_file)) is not None
+    with patch('hangman._hash_file') as mock_hash:
+        assert hm.load_word_index(str(word_file)) is not None
+    mock_hash.assert_not_called()
+
+    # If the source can't be hashed to check a new time, the index is stale
+    os.utime(word_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+    with patch('hangman._hash_file', side_effect=PermissionError("denied")):
+        assert hm.load_word_index(str(word_file)) is None
+    assert hm.load_word_index(str(word_file)) is not None
+
+    # A truncated or padded index is rejected, even with a valid header
+    index_file = tmp_path / ("words.txt" + hm.INDEX_SUFFIX)
+    compiled = index_file.read_bytes()
+    for damaged in (compiled[:-3], compiled + b"X"):
+        index_file.write_bytes(damaged)
+        assert hm.load_word_index(str(word_file)) is None
+    assert hm.load_words_from_file(str(word_file)) == ["APPLE", "BANANA", "APPLE", "FIG", "KIWI"]
+    index_file.write_bytes(compiled)
+
+    # Changing the contents makes the index stale
+    word_file.write_text("plum\n")
+    assert hm.load_word_index(str(word_file)) is None
+    assert hm.load_words_from_file(str(word_file)) == ["PLUM"]
+
+
+def test_hangman_game_matches_logic_functions() -> None:
+    """
+    Tests that the incremental HangmanGame state always agrees with
+    get_display_word and check_win after every guess.
+    """
+    game = hm.HangmanGame("APPLE")
+    correct: Set[str] = set()
+    assert game.display_word == "_ _ _ _ _"
+
+    for letter in "PZAELQ":
+        is_correct = game.guess(letter)
+        assert is_correct == (letter in "APPLE")
+        if is_correct:
+            correct.add(letter)
+        assert game.has_guessed(letter)
+        assert game.display_word == hm.get_display_word("APPLE", correct)
+        assert game.is_won == hm.check_win("APPLE", correct)
+
+    assert game.is_won and not game.is_lost
+    assert game.wrong_letters == {'Z', 'Q'} and game.wrong_guesses == 2
+    assert game.guessed_letters == {'P', 'Z', 'A', 'E', 'L', 'Q'}
+
+    for other in "@a1 Ü":  # Characters outside A-Z, both sides of the range
+        assert not game.has_guessed(other)
+
+
+def test_hangman_game_rejects_bad_guesses() -> None:
+    """
+    Tests that repeated or invalid guesses raise ValueError and that
+    the game is lost after MAX_WRONG_GUESSES wrong guesses.
+    """
+    game = hm.HangmanGame("CAT")
+    game.guess('C')
+    for bad_guess in ['C', 'c', 'AB', '']:
+        try:
+            game.guess(bad_guess)
+            assert False, f"Expected ValueError for {bad_guess!r}"
+        except ValueError:
+            pass
+
+    for letter in "ZXWVUQ"[:hm.MAX_WRONG_GUESSES]:
+        assert not game.guess(letter)
+    assert game.is_lost and not game.is_won
+
+
+def test_server_session_plays_a_game() -> None:
+    """
+    Tests one server-mode session end to end over a real localhost
+    connection, including re-prompting after an invalid guess.
+    """
+    import asyncio
+
+    async def play() -> str:
+        server = await asyncio.start_server(
+            lambda r, w: hm._play_session(["DOG"], r, w), "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"D\nD\nX\nO\nG\n")
+            transcript = (await reader.read()).decode()
+            writer.close()
+            return transcript
+
+    transcript = asyncio.run(play())
+    assert "You have already guessed 'D'. Try again." in transcript
+    assert "Sorry, 'X' is not in the word." in transcript
+    assert "The word: D _ _" in transcript
+    assert "YOU WIN! Congratulations!" in transcript
+
+
+
+def test_server_session_drops_overlong_line() -> None:
+    """
+    Tests that a line over the stream reader's 64 KiB limit ends the
+    session quietly, without an unhandled exception in the server.
+    """
+    import asyncio
+
+    async def play() -> list:
+        errors: list = []
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: errors.append(context))
+        server = await asyncio.start_server(
+            lambda r, w: hm._play_session(["DOG"], r, w), "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"A" * 100_000 + b"\n")
+            await reader.read()  # Returns once the server closes the connection
+            writer.close()
+            await asyncio.sleep(0.01)
+        return errors
+
+    assert asyncio.run(play()) == []
+
+def test_main_game_loop_writes_one_frame_per_turn() -> None:
+    """
+    Tests that each turn is written with a single write call, and that
+    the frame text matches what the individual print calls produced.
+    """
+    out = MagicMock()
+    with patch('builtins.input', side_effect=['Z', 'H', 'I']):
+        hm.main_game_loop(["HI"], out=out)
+
+    frames = [call.args[0] for call in out.write.call_args_list]
+    assert len(frames) == 4  # Three turns, plus the final result
+    assert frames[0].startswith("==============================\nWelcome to Hangman")
+    assert frames[1] == (
+        "\nSorry, 'Z' is not in the word.\n\n"
+        + hm.draw_hangman(1) + "\n"
+        + "Wrong Guesses: Z\n\n"
+        + "The word: _ _\n"
+        + "-" * 30 + "\n"
+    )
+    assert "YOU WIN! Congratulations!\nYou guessed the word: HI\n" in frames[3]
+
+
+def test_run_batch() -> None:
+    """
+    Tests batch mode: one JSON response per request, in order, with
+    requests split across input chunks and failures reported per request.
+    """
+    import io
+    import json
+
+    requests = (b'{"id": 1, "op": "display_word", "word": "PYTHON", "letters": "PN"}\n'
+                b'{"id": 2, "op": "check_win", "word": "DOG", "letters": ["D", "O", "G"]}\n'
+                b'\n'
+                b'{"id": 3, "op": "random_word"}\n'
+                b'{"id": 4, "op": "validate_guess", "guess": "D", "letters": "D"}\n'
+                b'{"id": 5, "op": "check_win"}\n'
+                b'{"id": 6, "op": "fly"}\n'
+                b'not json')
+    out = io.BytesIO()
+    assert hm.run_batch(["DOG"], io.BytesIO(requests), out, chunk_size=7) == 3
+
+    responses = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert responses[:4] == [
+        {"id": 1, "result": "P _ _ _ _ N"},
+        {"id": 2, "result": True},
+        {"id": 3, "result": "DOG"},
+        {"id": 4, "result": "You have already guessed 'D'. Try again."},
+    ]
+    assert responses[4] == {"id": 5, "error": "Missing field 'word'."}
+    assert responses[5]["id"] == 6 and "Unknown op 'fly'" in responses[5]["error"]
+    assert responses[6]["id"] is None and "Invalid JSON" in responses[6]["error"]
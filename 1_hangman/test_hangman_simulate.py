@@ -0,0 +1,62 @@
+import io
+import json
+
+from array import array
+
+import pytest
+
+import hangman as hm
+import hangman_simulate as sim
+
+
+def test_play_one_follows_game_rules() -> None:
+    """
+    Tests that a simulated game is won or lost under the usual rules.
+    """
+    in_order = lambda display, correct, wrong: next(
+        letter for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ" if letter not in correct | wrong)
+    assert sim.play_one("BAD", in_order) == (True, 1)  # C is the only miss
+    assert sim.play_one("ZZZ", in_order) == (False, hm.MAX_WRONG_GUESSES)
+
+
+def test_shared_word_store_round_trip() -> None:
+    """
+    Tests that a WordStore copied into shared memory reads back the same.
+    """
+    words = hm.WordStore(bytearray(b"CATDOGAPPLE"), array("Q", [0, 3, 6, 11]))
+    shm = sim.share_word_store(words)
+    try:
+        shared = sim.attach_word_store(shm)
+        assert list(shared) == ["CAT", "DOG", "APPLE"]
+        del shared
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def test_simulate_writes_one_row_per_word() -> None:
+    """
+    Tests a small end-to-end simulation on a single worker process.
+    """
+    words = hm.WordStore(bytearray(b"CATDOGAPPLE"), array("Q", [0, 3, 6, 11]))
+    out = io.StringIO()
+    assert sim.simulate(words, out, games=3, strategy="solver", workers=1,
+                        chunk_size=2, jsonl=True) == 3
+    rows = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert sorted(row["word"] for row in rows) == ["APPLE", "CAT", "DOG"]
+    assert all(row["games"] == 3 and row["win_rate"] == 1.0 for row in rows)
+
+
+@pytest.mark.parametrize("option", ["--games", "--workers", "--chunk-size"])
+def test_main_rejects_non_positive_counts(tmp_path, capsys, option) -> None:
+    """
+    Tests that a count below 1 is a usage error, before the output file is created.
+    """
+    out_file = tmp_path / "results.csv"
+    with pytest.raises(SystemExit) as exc_info:
+        sim.main(["hangman_word_list.txt", option, "0", "--out", str(out_file)])
+    assert exc_info.value.code == 2
+    assert "must be at least 1" in capsys.readouterr().err
+    assert not out_file.exists()
+    with pytest.raises(ValueError, match="at least 1"):
+        sim.simulate(hm.WordStore(b"CAT", array("Q", [0, 3])), io.StringIO(), games=0)
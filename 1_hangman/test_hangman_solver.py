@@ -0,0 +1,47 @@
+import os
+
+import hangman as hm
+import hangman_solver as hs
+
+
+WORDS = ["CAT", "COT", "CUT", "DOG", "TOAD", "APPLE"]
+
+
+def test_candidates_follow_pattern_and_wrong_letters() -> None:
+    """
+    Tests that candidate filtering matches a brute-force scan of the words.
+    """
+    solver = hs.HangmanSolver(WORDS)
+    assert solver.candidate_words("_ _ _", set()) == ["CAT", "COT", "CUT", "DOG"]
+    assert solver.candidate_words("C _ T", set()) == ["CAT", "COT", "CUT"]
+    assert solver.candidate_words("C _ T", {'A', 'U'}) == ["COT"]
+    assert solver.candidate_words("_ O _", set()) == ["COT", "DOG"]
+    # A revealed letter can't also hide behind an underscore
+    assert solver.candidate_words("_ P _ _ _", set()) == []
+    assert solver.candidate_words("_ P P _ _", set()) == ["APPLE"]
+    assert solver.candidate_words("_ _ _ _ _ _ _", set()) == []
+
+
+def test_best_letter() -> None:
+    """
+    Tests that the solver picks the letter shared by the most candidates,
+    and never repeats a guess.
+    """
+    solver = hs.HangmanSolver(WORDS)
+    assert solver.best_letter("_ _ _", set()) in {'C', 'T'}
+    assert solver.best_letter("C _ T", set()) in {'A', 'O', 'U'}
+    assert solver.best_letter("C _ T", {'A', 'O'}) == 'U'
+    # No candidates left: fall back to letter frequency
+    assert solver.best_letter("_ _ _ _ _ _ _", {'E'}) == 'T'
+
+
+def test_play_game_wins_every_word() -> None:
+    """
+    Tests that the solver wins every game on the shipped word list.
+    """
+    word_file = os.path.join(os.path.dirname(hm.__file__), "hangman_word_list.txt")
+    words = hm.load_words_from_file(word_file)
+    solver = hs.HangmanSolver(words)
+    for word in words:
+        game = hs.play_game(solver, word)
+        assert game.is_won, f"Solver lost on {word}"
@@ -0,0 +1,35 @@
+"""
+Benchmark for the number-guessing bot.
+
+Run with `python bench_number_guess.py [GAMES]` (default 1,000,000).
+Plays GAMES headless games of BinarySearchBot for each range size, up
+to 2**256, and reports games per second. Exits with an error if the bot
+ever needs more than max_guesses() for a range.
+"""
+import sys
+import time
+
+import number_guess as ng
+
+RANGES = [10**3, 10**6, 2**32, 2**64, 2**256]
+
+
+def main(games: int) -> None:
+    print(f"{'range':>12} {'games':>10} {'avg':>8} {'worst':>6} {'bound':>6} {'games/s':>12}")
+    failed = False
+    for size in RANGES:
+        # Fewer games for huge ranges, which take ~log2(size) guesses each
+        n = max(games * 10 // size.bit_length(), 1)
+        start = time.perf_counter()
+        total, worst = ng.play_batch(n, 0, size - 1)
+        elapsed = time.perf_counter() - start
+        bound = ng.max_guesses(0, size - 1)
+        label = f"2^{size.bit_length() - 1}" if size & (size - 1) == 0 else f"{size:,}"
+        print(f"{label:>12} {n:>10,} {total / n:>8.2f} {worst:>6} {bound:>6} {n / elapsed:>12,.0f}")
+        failed |= worst > bound
+    if failed:
+        sys.exit("Error: The bot needed more guesses than the binary search bound.")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
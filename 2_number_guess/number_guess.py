@@ -1,69 +1,334 @@
+from __future__ import annotations
 
+import os
+import site
+import sys
+import time
+
+# Imports for type checkers only, off the startup path (see benchmarks/test_startup.py)
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import asyncio
+    import random
+    from typing import BinaryIO, Callable, Dict, List, Optional, Tuple
 
 # --- Constants ---
 MIN_NUMBER = 0
 MAX_NUMBER = 999
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 5051
+MAX_LINE = 1024  # Longest guess line the server accepts, in bytes
 
 # --- Logic Functions ---
 
-def get_secret_number(min_val: int, max_val:int) -> int:
-    """Returns a random integer within the inclusive range."""
-    return 6
+def get_secret_number(min_val: int, max_val: int, rng: Optional[random.Random] = None) -> int:
+    """
+    Returns a random integer within the inclusive range.
+    Works for ranges of any size (e.g. up to 2**256), since Python ints
+    are arbitrary precision. Pass rng for reproducible secrets.
+    """
+    if rng is None:
+        import random as rng  # pylint: disable=import-outside-toplevel
+    return rng.randint(min_val, max_val)
 
-def check_guess(guess: int, secret:int) -> str:
+def check_guess(guess: int, secret: int) -> str:
     """
     Compares the guess to the secret number and returns a hint.
     Returns: "less", "greater", or "equal".
     """
-    return ""
+    if guess < secret:
+        return "less"
+    if guess > secret:
+        return "greater"
+    return "equal"
 
-def get_user_guess(min_val: int, max_val:int):
+def get_user_guess(min_val: int, max_val: int) -> int:
     """
     Prompts the user for a guess and validates it.
     Loops until a valid integer within the specified range is entered.
     Returns the valid integer guess.
     """
     while True:
-        guess_str = input(f"Enter your guess ({min_val}-{max_val}): ")
-        return 5
+        guess_str = input(render_prompt(min_val, max_val))
+        guess, error = _parse_guess(guess_str, min_val, max_val)
+        if guess is not None:
+            return guess
+        print(error)
+
+def _parse_guess(guess_str: str, min_val: int, max_val: int) -> Tuple[Optional[int], str]:
+    """Returns (the guess, "") for valid input, else (None, the error message)."""
+    try:
+        guess = int(guess_str)
+    except ValueError:
+        return None, f"'{guess_str}' is not a valid whole number. Please try again."
+    if not min_val <= guess <= max_val:
+        return None, f"{guess} is out of range. Please enter a number from {min_val} to {max_val}."
+    return guess, ""
+
+def max_guesses(min_val: int, max_val: int) -> int:
+    """
+    The most guesses a binary search can need for the inclusive range:
+    ceil(log2(n + 1)) for n possible numbers, which is n.bit_length().
+    """
+    return (max_val - min_val + 1).bit_length()
+
+# --- Bot Player ---
+
+class BinarySearchBot:
+    """Guesses the middle of the numbers still possible, so it always
+    wins within max_guesses(min_val, max_val) guesses."""
+
+    __slots__ = ("low", "high", "guesses")
+
+    def __init__(self, min_val: int, max_val: int) -> None:
+        self.reset(min_val, max_val)
+
+    def reset(self, min_val: int, max_val: int) -> None:
+        """Starts a new game over the inclusive range."""
+        self.low = min_val
+        self.high = max_val
+        self.guesses = 0
+
+    def next_guess(self) -> int:
+        """Returns the next guess (the midpoint of the remaining range)."""
+        self.guesses += 1
+        return (self.low + self.high) // 2
+
+    def feedback(self, guess: int, result: str) -> None:
+        """Narrows the range using check_guess's hint for a guess."""
+        if result == "less":
+            self.low = guess + 1
+        elif result == "greater":
+            self.high = guess - 1
+        else:
+            self.low = self.high = guess
+
+def play_bot_game(bot: BinarySearchBot, secret: int, min_val: int, max_val: int) -> int:
+    """Lets the bot play one game to the end. Returns the number of guesses."""
+    bot.reset(min_val, max_val)
+    while True:
+        guess = bot.next_guess()
+        result = check_guess(guess, secret)
+        if result == "equal":
+            return bot.guesses
+        bot.feedback(guess, result)
+
+def play_batch(games: int, min_val: int, max_val: int, seed: int = 0) -> Tuple[int, int]:
+    """
+    Plays `games` headless games of the bot against random secrets.
+    Returns (total guesses, most guesses in any one game).
+    """
+    import random  # pylint: disable=import-outside-toplevel
+    rng = random.Random(seed)
+    bot = BinarySearchBot(min_val, max_val)
+    total = worst = 0
+    for _ in range(games):
+        guesses = play_bot_game(bot, get_secret_number(min_val, max_val, rng), min_val, max_val)
+        total += guesses
+        if guesses > worst:
+            worst = guesses
+    return total, worst
+
+# --- Rendering ---
+# The game's text, shared by the CLI and the server.
+
+def render_welcome(min_val: int, max_val: int) -> str:
+    return ("===================================\n"
+            " Welcome to the Number Guessing Game! \n"
+            "===================================\n"
+            f"I'm thinking of a number between {min_val} and {max_val} (inclusive).\n"
+            "Try to guess it in as few attempts as possible.\n\n")
+
+def render_prompt(min_val: int, max_val: int) -> str:
+    return f"Enter your guess ({min_val}-{max_val}): "
+
+def render_result(guess: int, result: str, guess_count: int) -> str:
+    """The reply to a checked guess; result is check_guess's hint."""
+    if result == "equal":
+        return ("\n**************************************************\n"
+                f"YOU WIN! '{guess}' was the secret number!\n"
+                f"You guessed it in {guess_count} attempts.\n"
+                "**************************************************\n")
+    if result == "less":
+        hint = f"Your guess ({guess}) is LESS than the secret number. Try higher!\n"
+    else:
+        hint = f"Your guess ({guess}) is GREATER than the secret number. Try lower!\n"
+    return hint + "-" * 30 + "\n"  # Separator for the next round
 
 # --- Main Game Loop ---
 def main_game_loop():
     """Runs the main flow of the Number Guessing Game."""
-    print("===================================")
-    print(" Welcome to the Number Guessing Game! ")
-    print("===================================")
-    print(f"I'm thinking of a number between {MIN_NUMBER} and {MAX_NUMBER} (inclusive).")
-    print("Try to guess it in as few attempts as possible.\n")
+    print(render_welcome(MIN_NUMBER, MAX_NUMBER), end="")
 
     # --- Initialize Game State ---
     secret_num = get_secret_number(MIN_NUMBER, MAX_NUMBER)
     guess_count = 0
-    
+
     # --- The Loop ---
     while True:
         # 1. Get user input (validation is handled inside the function)
         user_guess = get_user_guess(MIN_NUMBER, MAX_NUMBER)
         guess_count += 1 # Count this as an attempt
-        
+
         # 2. Process the guess
         result = check_guess(user_guess, secret_num)
-        
-        # 3. Check for Win/Loss conditions
+
+        # 3. Report it, and stop once the guess is right
+        print(render_result(user_guess, result, guess_count), end="")
         if result == "equal":
-            print("\n**************************************************")
-            print(f"YOU WIN! '{user_guess}' was the secret number!")
-            print(f"You guessed it in {guess_count} attempts.")
-            print("**************************************************")
             break  # Exit the while loop
-        elif result == "less":
-            print(f"Your guess ({user_guess}) is LESS than the secret number. Try higher!")
-        elif result == "greater":
-            print(f"Your guess ({user_guess}) is GREATER than the secret number. Try lower!")
-        
-        print("-" * 30) # Separator for the next round
+
+# --- Server Mode ---
+
+class GuessSession:
+    """
+    One client's game in server mode: the connection's protocol and its
+    whole game state in a few slots, so tens of thousands of sessions stay
+    cheap. Input arrives as lines; replies are the same text as the CLI.
+
+    It implements the asyncio.Protocol methods without subclassing it,
+    so asyncio is only imported when a server starts.
+    """
+
+    __slots__ = ("transport", "min_val", "max_val", "secret", "guess_count", "partial")
+
+    def __init__(self, min_val: int, max_val: int) -> None:
+        self.transport: Optional[asyncio.Transport] = None
+        self.min_val = min_val
+        self.max_val = max_val
+        self.secret = get_secret_number(min_val, max_val)
+        self.guess_count = 0
+        self.partial = b""  # An incomplete line, waiting for its newline
+
+    def connection_made(self, transport) -> None:
+        self.transport = transport
+        transport.write((render_welcome(self.min_val, self.max_val)
+                         + render_prompt(self.min_val, self.max_val)).encode())
+
+    def data_received(self, data: bytes) -> None:
+        lines = (self.partial + data).split(b"\n")
+        self.partial = lines.pop()
+        if len(self.partial) > MAX_LINE:
+            self.transport.close()
+            return
+        replies: List[str] = []
+        for line in lines:
+            reply, done = self.handle_line(line.decode(errors="replace").strip())
+            replies.append(reply)
+            if done:
+                self.transport.write("".join(replies).encode())
+                self.transport.close()
+                return
+        if replies:
+            self.transport.write("".join(replies).encode())
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self.transport = None
+
+    def eof_received(self) -> None:
+        return None  # Let the transport close itself
+
+    def pause_writing(self) -> None:
+        pass  # Replies are small; nothing to throttle
+
+    def resume_writing(self) -> None:
+        pass
+
+    def handle_line(self, guess_str: str) -> Tuple[str, bool]:
+        """Plays one line of input. Returns (the reply, whether the game is over)."""
+        guess, error = _parse_guess(guess_str, self.min_val, self.max_val)
+        if guess is None:
+            return error + "\n" + render_prompt(self.min_val, self.max_val), False
+        self.guess_count += 1
+        result = check_guess(guess, self.secret)
+        reply = render_result(guess, result, self.guess_count)
+        if result == "equal":
+            return reply, True
+        return reply + render_prompt(self.min_val, self.max_val), False
+
+async def serve(host: str = SERVER_HOST, port: int = SERVER_PORT,
+                min_val: int = MIN_NUMBER, max_val: int = MAX_NUMBER) -> None:
+    """Serves independent games to any number of clients (e.g.
+    `nc localhost 5051`) on a single event loop, until cancelled.
+    """
+    import asyncio  # pylint: disable=import-outside-toplevel
+    loop = asyncio.get_running_loop()
+    server = await loop.create_server(lambda: GuessSession(min_val, max_val), host, port, backlog=4096)
+    async with server:
+        print(f"Serving the Number Guessing Game on {host}:{port} ({min_val}-{max_val})")
+        await server.serve_forever()
+
+def simulate(games: int, max_val: int) -> None:
+    """Plays bot games headlessly over MIN_NUMBER..max_val and prints a summary.
+    Raises ValueError if games < 1, since there would be nothing to average."""
+    if games < 1:
+        raise ValueError(f"Need at least 1 game to simulate, not {games}.")
+    start = time.perf_counter()
+    total, worst = play_batch(games, MIN_NUMBER, max_val)
+    elapsed = time.perf_counter() - start
+    print(f"{games} games over {MIN_NUMBER}-{max_val}: {total / games:.2f} guesses on average, "
+          f"{worst} at most (bound {max_guesses(MIN_NUMBER, max_val)}), "
+          f"{games / elapsed:,.0f} games/s")
+
+
+# --- Batch Mode ---
+
+def _batch_int(request: dict, field: str, default: Optional[int] = None) -> int:
+    """A request's field, which must be a JSON whole number (not a bool or string)."""
+    value = request[field] if default is None else request.get(field, default)
+    if type(value) is not int:  # pylint: disable=unidiomatic-typecheck
+        raise ValueError(f"{field!r} must be a whole number, not {value!r}.")
+    return value
+
+def _batch_range(request: dict) -> Tuple[int, int]:
+    """A request's "min" and "max", defaulting to MIN_NUMBER and MAX_NUMBER."""
+    return _batch_int(request, "min", MIN_NUMBER), _batch_int(request, "max", MAX_NUMBER)
+
+def _batch_check(request: dict) -> str:
+    """A "check" request: "guess" and "secret" must be whole numbers in the range, as for a typed guess."""
+    min_val, max_val = _batch_range(request)
+    numbers = []
+    for field in ("guess", "secret"):
+        number, error = _parse_guess(str(_batch_int(request, field)), min_val, max_val)
+        if number is None:
+            raise ValueError(error)
+        numbers.append(number)
+    return check_guess(*numbers)
+
+# The ops of `python number_guess.py --batch`
+BATCH_OPERATIONS: Dict[str, Callable[[dict], object]] = {
+    "secret": lambda request: get_secret_number(*_batch_range(request)),
+    "check": _batch_check,
+    "max_guesses": lambda request: max_guesses(*_batch_range(request)),
+}
+
+def run_batch(in_stream: BinaryIO, out_stream: BinaryIO, chunk_size: Optional[int] = None) -> int:
+    """
+    Answers JSON requests for BATCH_OPERATIONS until the input ends, e.g.
+    {"id": 1, "op": "check", "guess": 250, "secret": 500} -> {"id": 1, "result": "less"}
+    (see common/batch_mode.py). Returns the number of requests that failed.
+    """
+    site.addsitedir(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "common"))
+    import batch_mode  # pylint: disable=import-outside-toplevel
+    return batch_mode.run_batch(BATCH_OPERATIONS, in_stream, out_stream, chunk_size)
 
 # --- Entry Point ---
 if __name__ == "__main__":
-    main_game_loop()
-
+    # `python number_guess.py --simulate GAMES [MAX]` plays bot games instead
+    if len(sys.argv) in (3, 4) and sys.argv[1] == "--simulate":
+        try:
+            simulate(int(sys.argv[2]), int(sys.argv[3]) if len(sys.argv) == 4 else MAX_NUMBER)
+        except ValueError as e:
+            sys.exit(f"Error: {e}")
+    # `python number_guess.py --serve [PORT]` serves games over TCP
+    elif len(sys.argv) in (2, 3) and sys.argv[1] == "--serve":
+        import asyncio  # pylint: disable=import-outside-toplevel
+        try:
+            asyncio.run(serve(port=int(sys.argv[2]) if len(sys.argv) == 3 else SERVER_PORT))
+        except KeyboardInterrupt:
+            print("\nServer stopped.")
+    # `python number_guess.py --batch` answers JSON requests from stdin
+    elif len(sys.argv) == 2 and sys.argv[1] == "--batch":
+        sys.exit(1 if run_batch(sys.stdin.buffer, sys.stdout.buffer) else 0)
+    else:
+        main_game_loop()
@@ -0,0 +1,96 @@
+"""
+Load test for the Number Guessing Game server mode.
+
+Run with `python number_guess_loadtest.py [SESSIONS] [PORT]`, e.g.
+`python number_guess_loadtest.py 50000`. Unless a server is already
+listening on PORT, one is started in a subprocess. Every session is a
+BinarySearchBot client playing a full game, and the time from sending a
+guess to receiving the server's reply is recorded as that guess's latency.
+
+At most CONCURRENCY sessions (by default, as many as the open file limit
+allows, for both the client and a local server) are connected at once;
+the rest wait for a free slot. Beyond ~25,000 concurrent connections,
+clients spread over several loopback source addresses (127.0.0.2, ...),
+since one address only has ~28,000 ephemeral ports.
+"""
+import asyncio
+import os
+import re
+import site
+import sys
+import time
+
+from typing import List, Tuple
+
+import number_guess as ng
+
+DEFAULT_SESSIONS = 50_000
+PROMPT = b": "  # The end of the server's "Enter your guess (MIN-MAX): " prompt
+CLIENTS_PER_SOURCE_ADDRESS = 25_000
+RESULT = re.compile(rb"\((-?\d+)\) is (LESS|GREATER)|YOU WIN")
+
+
+async def _play(number: int, port: int, latencies: List[float], limit: asyncio.Semaphore) -> int:
+    """Plays one game with a BinarySearchBot. Returns the number of guesses."""
+    local_addr = None
+    if number >= CLIENTS_PER_SOURCE_ADDRESS:
+        local_addr = (f"127.0.0.{2 + number // CLIENTS_PER_SOURCE_ADDRESS}", 0)
+    async with limit:
+        reader, writer = await asyncio.open_connection(ng.SERVER_HOST, port, local_addr=local_addr)
+        bot = ng.BinarySearchBot(ng.MIN_NUMBER, ng.MAX_NUMBER)
+        try:
+            await reader.readuntil(PROMPT)
+            while True:
+                guess = bot.next_guess()
+                start = time.perf_counter()
+                writer.write(b"%d\n" % guess)
+                try:
+                    reply = await reader.readuntil(PROMPT)
+                except asyncio.IncompleteReadError as error:
+                    reply = error.partial  # The server closed the connection: game over
+                latencies.append(time.perf_counter() - start)
+                match = RESULT.search(reply)
+                if match is None:
+                    raise ValueError(f"Unexpected reply: {reply!r}")
+                if match.group(2) is None:
+                    return bot.guesses
+                bot.feedback(guess, "less" if match.group(2) == b"LESS" else "greater")
+        finally:
+            writer.close()
+
+
+async def run_load_test(sessions: int, port: int,
+                        concurrency: int) -> Tuple[float, List[float], List[BaseException], int]:
+    """Runs the sessions, up to `concurrency` at a time. Returns the
+    seconds taken, every guess's latency, the sessions' failures and how
+    many games took more guesses than max_guesses allows."""
+    latencies: List[float] = []
+    limit = asyncio.Semaphore(concurrency)
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(_play(number % concurrency, port, latencies, limit) for number in range(sessions)),
+        return_exceptions=True,
+    )
+    elapsed = time.perf_counter() - start
+    failures = [r for r in results if isinstance(r, BaseException)]
+    bound = ng.max_guesses(ng.MIN_NUMBER, ng.MAX_NUMBER)
+    return elapsed, latencies, failures, sum(1 for r in results if isinstance(r, int) and r > bound)
+
+
+def main(sessions: int, port: int) -> None:
+    """Starts a local server if needed, then runs the load test and
+    prints throughput and latency."""
+    site.addsitedir(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "common"))
+    import loadtest  # pylint: disable=import-outside-toplevel
+    concurrency = loadtest.max_concurrency(sessions, loadtest.raise_open_file_limit())
+    with loadtest.local_server([sys.executable, os.path.abspath(ng.__file__), "--serve", str(port)],
+                               ng.SERVER_HOST, port, "Number Guessing Game"):
+        elapsed, latencies, failures, over_bound = asyncio.run(run_load_test(sessions, port, concurrency))
+    bound = ng.max_guesses(ng.MIN_NUMBER, ng.MAX_NUMBER)
+    loadtest.print_report(sessions, concurrency, elapsed, latencies, failures, (0.50, 0.99, 0.999),
+                          f", {over_bound} games over the {bound}-guess bound")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SESSIONS,
+         int(sys.argv[2]) if len(sys.argv) > 2 else ng.SERVER_PORT)
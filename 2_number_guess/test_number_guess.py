@@ -67,3 +67,161 @@ def test_get_user_guess_range_then_valid():
             guess = ng.get_user_guess(0, 999)
             # The function should loop until it gets '500'
             assert guess == 500, "Should reject -5 and 1000, and return 500"
+
+
+def test_get_secret_number_in_range():
+    """
+    Tests that secrets stay inside the inclusive range, including ranges
+    far beyond 64 bits.
+    """
+    for _ in range(200):
+        assert 0 <= ng.get_secret_number(0, 9) <= 9
+    huge = 2**256
+    secret = ng.get_secret_number(huge, 2 * huge)
+    assert huge <= secret <= 2 * huge
+    assert ng.get_secret_number(7, 7) == 7
+
+
+def test_get_secret_number_seeded():
+    """Tests that passing the same seeded Random gives the same secret."""
+    import random
+    assert ng.get_secret_number(0, 2**256, random.Random(1)) == \
+        ng.get_secret_number(0, 2**256, random.Random(1))
+
+
+def test_max_guesses():
+    """Tests the binary search bound, ceil(log2(n + 1)) for n numbers."""
+    assert ng.max_guesses(0, 0) == 1
+    assert ng.max_guesses(0, 999) == 10
+    assert ng.max_guesses(1, 1023) == 10
+    assert ng.max_guesses(0, 1023) == 11  # 1024 numbers need one more than log2(1024)
+    assert ng.max_guesses(0, 2**256 - 1) == 257
+
+
+def test_bot_never_exceeds_bound():
+    """Tests the bot against every possible secret in a few ranges."""
+    bot = ng.BinarySearchBot(0, 0)
+    for min_val, max_val in [(0, 0), (0, 999), (5, 1028), (-50, 50)]:
+        bound = ng.max_guesses(min_val, max_val)
+        for secret in range(min_val, max_val + 1):
+            assert ng.play_bot_game(bot, secret, min_val, max_val) <= bound
+
+
+def test_bot_huge_range():
+    """Tests the bot at the top of a 2^256 range."""
+    bot = ng.BinarySearchBot(0, 2**256)
+    for secret in (0, 2**255 + 12345, 2**256):
+        assert ng.play_bot_game(bot, secret, 0, 2**256) <= ng.max_guesses(0, 2**256)
+
+
+def test_play_batch():
+    """Tests the headless batch mode."""
+    total, worst = ng.play_batch(1000, 0, 999, seed=3)
+    assert 1000 <= total <= 10 * 1000
+    assert worst <= 10
+    assert ng.play_batch(1000, 0, 999, seed=3) == (total, worst)
+
+def test_simulate_needs_a_game(capsys):
+    """Tests that simulating no games is an error, not a ZeroDivisionError."""
+    for games in (0, -5):
+        try:
+            ng.simulate(games, 100)
+            assert False, f"simulate({games}) should raise ValueError"
+        except ValueError as e:
+            assert "at least 1 game" in str(e)
+    ng.simulate(3, 100)
+    assert capsys.readouterr().out.startswith(f"3 games over {ng.MIN_NUMBER}-100:")
+
+
+def test_main_game_loop_transcript(capsys):
+    """Tests the CLI text for a short game, including an invalid guess."""
+    with patch('number_guess.get_secret_number', return_value=42):
+        with patch('builtins.input', side_effect=['x', '10', '50', '42']):
+            ng.main_game_loop()
+    out = capsys.readouterr().out
+    assert out.startswith("===================================\n Welcome to the Number Guessing Game! \n")
+    assert "'x' is not a valid whole number. Please try again.\n" in out
+    assert "Your guess (10) is LESS than the secret number. Try higher!\n" + "-" * 30 + "\n" in out
+    assert "Your guess (50) is GREATER than the secret number. Try lower!\n" in out
+    assert "YOU WIN! '42' was the secret number!\nYou guessed it in 3 attempts.\n" in out
+
+
+def test_server_session_plays_a_game():
+    """
+    Tests one server-mode session end to end over a real localhost
+    connection, with guesses split across packets and an invalid line.
+    """
+    import asyncio
+
+    async def play() -> str:
+        loop = asyncio.get_running_loop()
+        session = ng.GuessSession(0, 999)
+        session.secret = 42
+        server = await loop.create_server(lambda: session, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"abc\n10")
+            await writer.drain()
+            await asyncio.sleep(0.01)
+            writer.write(b"00\n500\n42\n")
+            transcript = (await reader.read()).decode()
+            writer.close()
+            return transcript
+
+    transcript = asyncio.run(play())
+    assert transcript.startswith(ng.render_welcome(0, 999) + ng.render_prompt(0, 999))
+    assert "'abc' is not a valid whole number." in transcript
+    assert "1000 is out of range." in transcript
+    assert "Your guess (500) is GREATER" in transcript
+    assert transcript.endswith("You guessed it in 2 attempts.\n" + "*" * 50 + "\n")
+
+
+def test_run_batch():
+    """
+    Tests batch mode: one JSON response per request, in order, with
+    requests split across input chunks and failures reported per request.
+    """
+    import io
+    import json
+
+    requests = (b'{"id": 1, "op": "check", "guess": 250, "secret": 500}\n'
+                b'{"id": 2, "op": "secret", "min": 7, "max": 7}\n'
+                b'\n'
+                b'{"id": 3, "op": "max_guesses", "max": 1022}\n'
+                b'{"id": 4, "op": "check", "guess": 1}\n'
+                b'[1, 2]')
+    out = io.BytesIO()
+    assert ng.run_batch(io.BytesIO(requests), out, chunk_size=5) == 2
+
+    responses = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert responses == [
+        {"id": 1, "result": "less"},
+        {"id": 2, "result": 7},
+        {"id": 3, "result": 10},
+        {"id": 4, "error": "Missing field 'secret'."},
+        {"id": None, "error": "A request must be a JSON object."},
+    ]
+
+
+def test_run_batch_checks_types():
+    """
+    Tests that batch "check" only accepts whole numbers in range, so
+    strings aren't compared as text and bools aren't numbers.
+    """
+    import io
+    import json
+
+    requests = (b'{"id": 1, "op": "check", "guess": "5", "secret": "30"}\n'
+                b'{"id": 2, "op": "check", "guess": true, "secret": 1}\n'
+                b'{"id": 3, "op": "check", "guess": 5, "secret": 5000}\n'
+                b'{"id": 4, "op": "check", "guess": 5, "secret": 30}\n')
+    out = io.BytesIO()
+    assert ng.run_batch(io.BytesIO(requests), out) == 3
+    responses = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert responses == [
+        {"id": 1, "error": "'guess' must be a whole number, not '5'."},
+        {"id": 2, "error": "'guess' must be a whole number, not True."},
+        {"id": 3, "error": "5000 is out of range. Please enter a number from 0 to 999."},
+        {"id": 4, "result": "less"},
+    ]
@@ -0,0 +1,71 @@
+"""
+Benchmark for bulk Roman numeral conversion.
+
+Run with `python bench_roman_numerals.py [N]` (default 10,000,000).
+Compares a naive greedy loop, to_roman one call at a time, and
+to_roman_many on a list (and on a NumPy array, if NumPy is installed).
+Then writes N numerals to a temporary file and reports how many lines
+per second from_roman_stream parses, in text and binary mode.
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from typing import Callable, List
+
+import roman_numerals as rn
+
+ROMAN_MAP = [
+    (1000, 'M'), (900, 'CM'), (500, 'D'), (400, 'CD'), (100, 'C'), (90, 'XC'),
+    (50, 'L'), (40, 'XL'), (10, 'X'), (9, 'IX'), (5, 'V'), (4, 'IV'), (1, 'I'),
+]
+
+
+def greedy_to_roman(number: int) -> str:
+    """The textbook greedy conversion, for comparison."""
+    result = ""
+    for value, symbol in ROMAN_MAP:
+        while number >= value:
+            result += symbol
+            number -= value
+    return result
+
+
+def _time(name: str, n: int, convert: Callable[[], object]) -> None:
+    start = time.perf_counter()
+    convert()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<26} {elapsed:>8.2f}s {n / elapsed:>14,.0f} per second")
+
+
+def main(n: int) -> None:
+    rng = random.Random(0)
+    numbers: List[int] = [rng.randint(1, rn.MAX_ROMAN) for _ in range(n)]
+    print(f"Converting {n:,} random integers in 1-{rn.MAX_ROMAN}")
+    _time("greedy loop", n, lambda: [greedy_to_roman(x) for x in numbers])
+    _time("to_roman per call", n, lambda: [rn.to_roman(x) for x in numbers])
+    _time("to_roman_many (list)", n, lambda: rn.to_roman_many(numbers))
+    try:
+        import numpy as np  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        print("to_roman_many (NumPy)      skipped: NumPy is not installed")
+    else:
+        array = np.array(numbers, dtype=np.int32)
+        _time("to_roman_many (NumPy)", n, lambda: rn.to_roman_many(array))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "numerals.txt")
+        with open(path, "w") as f:
+            for start in range(0, n, 100_000):
+                f.write("\n".join(rn.to_roman_many(numbers[start:start + 100_000])) + "\n")
+        del numbers
+        print(f"\nParsing {n:,} lines ({os.path.getsize(path) / 2**20:.0f} MB)")
+        for mode in ("r", "rb"):
+            with open(path, mode) as f:
+                _time(f"from_roman_stream ('{mode}')", n, lambda: sum(1 for _ in rn.from_roman_stream(f)))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
@@ -1,19 +1,315 @@
+from __future__ import annotations
+
+import os
+import site
 import sys
 
-def to_roman(number: int):
+# Imports for type checkers only, off the startup path (see benchmarks/test_startup.py)
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import IO, AnyStr, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+MAX_ROMAN = 3999
+CHUNK_SIZE = 1 << 16  # Bytes read at a time in pipe mode
+_RANGE_ERROR = "Input must be an integer between 1 and 3999."
+
+# The Roman numeral for each decimal digit, by place value.
+_THOUSANDS = ("", "M", "MM", "MMM")
+_HUNDREDS = ("", "C", "CC", "CCC", "CD", "D", "DC", "DCC", "DCCC", "CM")
+_TENS = ("", "X", "XX", "XXX", "XL", "L", "LX", "LXX", "LXXX", "XC")
+_ONES = ("", "I", "II", "III", "IV", "V", "VI", "VII", "VIII", "IX")
+
+# Lookup table of every numeral, built on first use: _table[n] is n in
+# Roman numerals (and _table[0] is unused).
+_table: Optional[Tuple[str, ...]] = None
+_numpy_table = None
+# The reverse of _table, with both str and bytes keys (for binary files)
+_reverse_table: Optional[Dict[Union[str, bytes], int]] = None
+
+
+def _roman_table() -> Tuple[str, ...]:
+    """Returns the lookup table, building it the first time."""
+    global _table  # pylint: disable=global-statement
+    if _table is None:
+        _table = tuple(
+            _THOUSANDS[n // 1000] + _HUNDREDS[n // 100 % 10] + _TENS[n // 10 % 10] + _ONES[n % 10]
+            for n in range(MAX_ROMAN + 1)
+        )
+    return _table
+
+
+def to_roman(number: int) -> str:
     """Converts an integer 1-3999 inclusive to its Roman numeral
     representation.
 
     Args:
-        number: The integer to convert.
+        number: The integer to convert, or any integer-like value that
+            supports operator.index (e.g. a NumPy integer), but not a bool.
 
     Returns:
         A string representing the Roman numeral.
 
+    Raises:
+        ValueError: If number is not an integer between 1 and 3999.
     """
-    
-    return '0'
+    if type(number) is not int:  # pylint: disable=unidiomatic-typecheck
+        number = _as_integer(number)
+    if not 0 < number <= MAX_ROMAN:
+        raise ValueError(_RANGE_ERROR)
+    return _roman_table()[number]
 
-if __name__ == "__main__":
+
+def _as_integer(number) -> int:
+    """Returns operator.index(number), raising ValueError for bools and
+    anything that isn't integer-like."""
+    if isinstance(number, bool):
+        raise ValueError(_RANGE_ERROR)
+    import operator  # pylint: disable=import-outside-toplevel
+    try:
+        return operator.index(number)
+    except TypeError:
+        raise ValueError(_RANGE_ERROR) from None
+
+
+def to_roman_many(numbers: Iterable[int]):
+    """Converts many integers 1-3999 to Roman numerals at once.
+
+    Args:
+        numbers: Any iterable of integers, or a NumPy integer array.
+
+    Returns:
+        A list of strings, or for a NumPy array, a NumPy string array of
+        the same shape (converted with one vectorized table lookup).
+
+    Raises:
+        ValueError: If numbers is not iterable, or any value is not an
+            integer between 1 and 3999 (a bool isn't one, as in to_roman).
+    """
+    # Only an existing ndarray can take the NumPy path, and it can only
+    # exist if NumPy is already imported, so we never import it ourselves.
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(numbers, np.ndarray):
+        return _to_roman_array(np, numbers)
+
+    try:
+        values = numbers if isinstance(numbers, list) else list(numbers)
+    except TypeError:
+        raise ValueError(f"Expected an iterable of integers, not {type(numbers).__name__}.") from None
+    try:
+        if values and (min(values) < 1 or max(values) > MAX_ROMAN):
+            raise ValueError(_RANGE_ERROR)
+        if _has_true(values):  # False can't pass the range check, but True == 1 can
+            raise ValueError(_RANGE_ERROR)
+        return list(map(_roman_table().__getitem__, values))
+    except TypeError:  # Non-numbers, or numbers that can't be an index
+        raise ValueError(_RANGE_ERROR) from None
+
+
+def _has_true(values: list) -> bool:
+    """Whether values holds True itself, not just a value equal to it like 1.
+    list.index finds each candidate at C speed, so a list with no 1s costs
+    a single scan."""
+    i = -1
+    while True:
+        try:
+            i = values.index(True, i + 1)
+        except ValueError:
+            return False
+        if values[i] is True:
+            return True
+
+
+def _to_roman_array(np, numbers):
+    """The NumPy path of to_roman_many."""
+    global _numpy_table  # pylint: disable=global-statement
+    if numbers.dtype.kind not in "iu":
+        raise ValueError(_RANGE_ERROR)
+    if numbers.size and (numbers.min() < 1 or numbers.max() > MAX_ROMAN):
+        raise ValueError(_RANGE_ERROR)
+    if _numpy_table is None:
+        _numpy_table = np.array(_roman_table())
+    return _numpy_table[numbers]
+
+
+def _roman_reverse_table() -> Dict[Union[str, bytes], int]:
+    """Returns the numeral -> integer table, building it the first time."""
+    global _reverse_table  # pylint: disable=global-statement
+    if _reverse_table is None:
+        table = _roman_table()
+        _reverse_table = {table[n]: n for n in range(1, MAX_ROMAN + 1)}
+        _reverse_table.update({table[n].encode("ascii"): n for n in range(1, MAX_ROMAN + 1)})
+    return _reverse_table
+
+
+def from_roman(numeral: str) -> int:
+    """Converts a Roman numeral to an integer.
+
+    Only canonical numerals, exactly as to_roman writes them, are
+    accepted: forms like 'IIII', 'VX' or 'iv' are rejected. Every valid
+    numeral is a key in a precomputed table, so parsing is a single
+    dictionary lookup with no backtracking.
+
+    Args:
+        numeral: The Roman numeral to convert, e.g. 'MCMXCIV'.
+
+    Returns:
+        The integer value, between 1 and 3999.
+
+    Raises:
+        ValueError: If numeral is not a canonical Roman numeral.
+    """
+    value = _roman_reverse_table().get(numeral) if isinstance(numeral, str) else None
+    if value is None:
+        raise ValueError(f"{numeral!r} is not a valid Roman numeral (I to MMMCMXCIX).")
+    return value
+
+
+def from_roman_stream(file_obj: IO[AnyStr]) -> Iterator[int]:
+    """Parses newline-delimited Roman numerals from a file, lazily.
+
+    Works with text or binary files. Surrounding whitespace and blank
+    lines are ignored. Lines
+    are read one at a time, so memory use stays constant however large
+    the file is.
+
+    Args:
+        file_obj: An open file, or any iterable of lines.
+
+    Yields:
+        The integer value of each numeral, in order.
+
+    Raises:
+        ValueError: On the first line that isn't a canonical numeral.
+    """
+    lookup = _roman_reverse_table().get
+    for line_number, line in enumerate(file_obj, 1):
+        numeral = line.strip()
+        value = lookup(numeral)
+        if value is None:
+            if not numeral:
+                continue
+            raise ValueError(f"Line {line_number}: {numeral!r} is not a valid Roman numeral.")
+        yield value
+
+
+def repl() -> None:
+    """Runs the interactive converter until the user types 'quit'."""
     print("Welcome to the Roman Numeral Converter!")
     print("Enter a number to convert, or type 'quit' to exit.")
+
+    while True:
+        try:
+            user_input = input("Enter a number: ")
+        except EOFError:
+            print()
+            break
+
+        if user_input.strip().lower() == 'quit':
+            print("Goodbye!")
+            break
+
+        try:
+            decimal_number = int(user_input)
+            roman_numeral = to_roman(decimal_number)
+            print(f"The Roman numeral for {decimal_number} is {roman_numeral}")
+        except ValueError:
+            # Not an integer, or outside the valid range (1-3999)
+            print(f"Error: {_RANGE_ERROR} Please enter a valid number or 'quit'.")
+
+
+def convert_stream(in_stream: BinaryIO, out_stream: BinaryIO) -> int:
+    """Converts newline-delimited integers to Roman numerals, one per line.
+
+    Input is read in chunks of up to CHUNK_SIZE bytes and each chunk's
+    results are written with a single write, so large inputs run at
+    I/O speed. Blank lines are skipped. Stops at the first invalid
+    line, after writing everything before it.
+
+    Args:
+        in_stream: A binary input stream, e.g. sys.stdin.buffer.
+        out_stream: A binary output stream, e.g. sys.stdout.buffer.
+
+    Returns:
+        0 on success, or 1 if an invalid line was found (an error
+        message is printed to stderr).
+    """
+    read = getattr(in_stream, "read1", in_stream.read)
+    line_number = 0
+    partial = b""
+    while True:
+        chunk = read(CHUNK_SIZE)
+        lines = (partial + chunk).split(b"\n")
+        partial = lines.pop() if chunk else b""  # Keep an unfinished last line
+        try:
+            numerals = to_roman_many([int(line) for line in lines if line.strip()])
+        except ValueError:
+            # Find the bad line; everything before it is still converted
+            for line in lines:
+                line_number += 1
+                if not line.strip():
+                    continue
+                try:
+                    numeral = to_roman(int(line))
+                except ValueError:
+                    out_stream.flush()
+                    print(f"Error: line {line_number}: {line.strip().decode(errors='replace')!r}. "
+                          f"{_RANGE_ERROR}", file=sys.stderr)
+                    return 1
+                out_stream.write(numeral.encode() + b"\n")
+        else:
+            if numerals:
+                out_stream.write(("\n".join(numerals) + "\n").encode())
+            line_number += len(lines)
+        out_stream.flush()
+        if not chunk:
+            return 0
+
+
+# The ops of `python roman_numerals.py --batch`
+BATCH_OPERATIONS: Dict[str, Callable[[dict], object]] = {
+    "to_roman": lambda request: to_roman(request["number"]),
+    "to_roman_many": lambda request: to_roman_many(request["numbers"]),
+    "from_roman": lambda request: from_roman(request["numeral"]),
+}
+
+
+def run_batch(in_stream: BinaryIO, out_stream: BinaryIO, chunk_size: Optional[int] = None) -> int:
+    """Answers JSON requests for BATCH_OPERATIONS until the input ends.
+
+    For example, {"id": 1, "op": "to_roman", "number": 1994} gets the
+    response line {"id": 1, "result": "MCMXCIV"} (see common/batch_mode.py).
+
+    Args:
+        in_stream: A binary input stream, e.g. sys.stdin.buffer.
+        out_stream: A binary output stream, e.g. sys.stdout.buffer.
+        chunk_size: Bytes to read at a time (default: the shared mode's).
+
+    Returns:
+        The number of requests that failed.
+    """
+    site.addsitedir(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "common"))
+    import batch_mode  # pylint: disable=import-outside-toplevel
+    return batch_mode.run_batch(BATCH_OPERATIONS, in_stream, out_stream, chunk_size)
+
+
+def main() -> None:
+    """Runs the REPL for a terminal, or converts piped input as a filter,
+    e.g. `seq 1 3999 | python roman_numerals.py`. With --batch, answers
+    JSON requests instead (see run_batch).
+    """
+    try:
+        if sys.argv[1:] == ["--batch"]:
+            sys.exit(1 if run_batch(sys.stdin.buffer, sys.stdout.buffer) else 0)
+        if sys.stdin.isatty():
+            repl()
+        else:
+            sys.exit(convert_stream(sys.stdin.buffer, sys.stdout.buffer))
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`). As the Python docs suggest,
+        # point stdout at devnull so the flush at exit doesn't fail again.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
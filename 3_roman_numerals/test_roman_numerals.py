@@ -1,5 +1,9 @@
+import io
+import os
+import subprocess
 import sys
-from roman_numerals import to_roman
+from unittest.mock import patch
+from roman_numerals import convert_stream, from_roman, from_roman_stream, repl, run_batch, to_roman, to_roman_many
 
 def test_single_digits():
     """Tests the conversion of single-digit numbers."""
@@ -62,9 +66,150 @@ def test_error_handling():
         assert False, "Test for string input failed: expected ValueError"
     except ValueError:
         pass  # Test passed
+
+    for value in (True, False, 5.0):
+        try:
+            to_roman(value)
+            assert False, f"Test for {value!r} failed: expected ValueError"
+        except ValueError:
+            pass  # Test passed
+
+    class IntegerLike:  # Like a NumPy integer: not an int, but has __index__
+        def __index__(self):
+            return 14
+    assert to_roman(IntegerLike()) == 'XIV', "Test for an integer-like value failed"
     
     print("test_error_handling passed.")
 
+def test_to_roman_many():
+    """Tests bulk conversion of lists and other iterables."""
+    print("Running test_to_roman_many...")
+    assert to_roman_many([1, 4, 1994, 3999]) == ['I', 'IV', 'MCMXCIV', 'MMMCMXCIX'], "List conversion failed"
+    assert to_roman_many(range(1, 4)) == ['I', 'II', 'III'], "Range conversion failed"
+    assert to_roman_many([]) == [], "Empty list conversion failed"
+    assert to_roman_many(range(1, 4000)) == [to_roman(n) for n in range(1, 4000)], "Bulk and single conversions differ"
+
+    for bad_input in ([1, 0], [4000], [-1], ["abc"], [2.5], [True], [5, True], (n == 1 for n in range(3)),
+                      [False], 5, None):
+        try:
+            to_roman_many(bad_input)
+            assert False, f"Test for {bad_input} failed: expected ValueError"
+        except ValueError:
+            pass  # Test passed
+    print("test_to_roman_many passed.")
+
+def test_to_roman_many_numpy():
+    """Tests bulk conversion of NumPy integer arrays (skipped without NumPy)."""
+    import pytest
+    np = pytest.importorskip("numpy")
+    print("Running test_to_roman_many_numpy...")
+    result = to_roman_many(np.array([[1, 9], [14, 3999]]))
+    assert result.shape == (2, 2), "Result should keep the input shape"
+    assert result.tolist() == [['I', 'IX'], ['XIV', 'MMMCMXCIX']], "NumPy conversion failed"
+
+    for bad_input in (np.array([0, 1]), np.array([4000]), np.array([1.0])):
+        try:
+            to_roman_many(bad_input)
+            assert False, f"Test for {bad_input} failed: expected ValueError"
+        except ValueError:
+            pass  # Test passed
+    print("test_to_roman_many_numpy passed.")
+
+def test_from_roman():
+    """Tests parsing Roman numerals, including rejecting non-canonical forms."""
+    print("Running test_from_roman...")
+    assert from_roman('I') == 1, "Test for I failed"
+    assert from_roman('XIV') == 14, "Test for XIV failed"
+    assert from_roman('MCMXCIV') == 1994, "Test for MCMXCIV failed"
+    assert from_roman('MMMCMXCIX') == 3999, "Test for MMMCMXCIX failed"
+    assert all(from_roman(to_roman(n)) == n for n in range(1, 4000)), "Round trip failed"
+
+    for bad_input in ['IIII', 'VX', 'IC', 'MMMM', 'iv', '', ' X', 'ABC', 4]:
+        try:
+            from_roman(bad_input)
+            assert False, f"Test for {bad_input!r} failed: expected ValueError"
+        except ValueError:
+            pass  # Test passed
+    print("test_from_roman passed.")
+
+def test_from_roman_stream():
+    """Tests streaming numerals from text and binary files."""
+    print("Running test_from_roman_stream...")
+    text_file = io.StringIO("I\nIV\n\n  XL \nMMXXV\n")
+    assert list(from_roman_stream(text_file)) == [1, 4, 40, 2025], "Text stream failed"
+    binary_file = io.BytesIO(b"IX\r\nMCM\r\n")
+    assert list(from_roman_stream(binary_file)) == [9, 1900], "Binary stream failed"
+
+    try:
+        list(from_roman_stream(io.StringIO("I\nII\nIIII\n")))
+        assert False, "Test for IIII in a stream failed: expected ValueError"
+    except ValueError as e:
+        assert "Line 3" in str(e), "Error should give the line number"
+    print("test_from_roman_stream passed.")
+
+def test_repl():
+    """Tests the interactive converter with mocked input."""
+    print("Running test_repl...")
+    with patch('builtins.input', side_effect=['1', '12', '5000', 'abc', '2025', 'quit']):
+        with patch('builtins.print') as mock_print:
+            repl()
+    printed = [call.args[0] for call in mock_print.call_args_list]
+    assert "The Roman numeral for 12 is XII" in printed, "Conversion of 12 failed"
+    assert "The Roman numeral for 2025 is MMXXV" in printed, "Conversion of 2025 failed"
+    assert printed.count("Error: Input must be an integer between 1 and 3999. "
+                         "Please enter a valid number or 'quit'.") == 2, "Invalid input not reported"
+    assert printed[-1] == "Goodbye!", "Should say goodbye on quit"
+    print("test_repl passed.")
+
+def test_convert_stream():
+    """Tests the pipe mode, including input split across chunks."""
+    print("Running test_convert_stream...")
+    out = io.BytesIO()
+    with patch('roman_numerals.CHUNK_SIZE', 3):
+        assert convert_stream(io.BytesIO(b"1\n2\n\n1994\n3999"), out) == 0, "Stream should succeed"
+    assert out.getvalue() == b"I\nII\nMCMXCIV\nMMMCMXCIX\n", "Stream conversion failed"
+
+    out = io.BytesIO()
+    with patch('sys.stderr', new_callable=io.StringIO) as mock_stderr:
+        assert convert_stream(io.BytesIO(b"5\n0\n6\n"), out) == 1, "Stream should fail on 0"
+    assert out.getvalue() == b"V\n", "Lines before the error should be converted"
+    assert "line 2" in mock_stderr.getvalue(), "Error should give the line number"
+    print("test_convert_stream passed.")
+
+def test_filter_closed_output():
+    """Tests that the filter exits quietly when its reader stops early, like `| head -1`."""
+    print("Running test_filter_closed_output...")
+    process = subprocess.Popen([sys.executable, "roman_numerals.py"],
+                               cwd=os.path.dirname(os.path.abspath(__file__)),
+                               stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    process.stdin.write(b"1994\n")
+    process.stdin.flush()
+    assert process.stdout.readline() == b"MCMXCIV\n", "First line should be converted"
+    process.stdout.close()
+    _, err = process.communicate(b"1\n" * 100_000, timeout=60)
+    assert process.returncode == 1, "A closed output should exit with status 1"
+    assert b"Traceback" not in err, "A closed output should not print a traceback"
+    print("test_filter_closed_output passed.")
+
+def test_run_batch():
+    """Tests the JSON batch mode, including requests split across chunks."""
+    print("Running test_run_batch...")
+    requests = (b'{"id": 1, "op": "to_roman", "number": 1994}\n'
+                b'{"id": 2, "op": "from_roman", "numeral": "MMXXV"}\n\n'
+                b'{"id": 3, "op": "to_roman_many", "numbers": [4, 9]}\n'
+                b'{"id": 4, "op": "to_roman", "number": 4000}\n'
+                b'{"id": 5, "op": "from_roman"}')
+    out = io.BytesIO()
+    assert run_batch(io.BytesIO(requests), out, chunk_size=4) == 2, "Two requests should fail"
+    assert out.getvalue().splitlines() == [
+        b'{"id": 1, "result": "MCMXCIV"}',
+        b'{"id": 2, "result": 2025}',
+        b'{"id": 3, "result": ["IV", "IX"]}',
+        b'{"id": 4, "error": "Input must be an integer between 1 and 3999."}',
+        b'{"id": 5, "error": "Missing field \'numeral\'."}',
+    ], "Batch responses are wrong"
+    print("test_run_batch passed.")
+
 if __name__ == "__main__":
     try:
         test_single_digits()
@@ -72,6 +217,13 @@ if __name__ == "__main__":
         test_subtractive_numerals()
         test_combined_numerals()
         test_error_handling()
+        test_to_roman_many()
+        test_from_roman()
+        test_from_roman_stream()
+        test_repl()
+        test_convert_stream()
+        test_filter_closed_output()
+        test_run_batch()
         print("\nAll tests passed successfully!")
     except AssertionError as e:
         print(f"\nOne or more tests failed: {e}")
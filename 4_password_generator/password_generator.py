@@ -1,7 +1,41 @@
-import random
-import secrets
-import string
-from typing import List
+from __future__ import annotations
+
+import functools
+import math
+import os
+import site
+import sys
+from array import array
+from collections import namedtuple
+
+# Imports for type checkers only, off the startup path (see benchmarks/test_startup.py)
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from typing import BinaryIO, Callable, Deque, Dict, Iterable, List, MutableSequence, Optional, Tuple
+
+# The character classes, as in the string module (which isn't imported,
+# since it imports re)
+ASCII_LOWERCASE = "abcdefghijklmnopqrstuvwxyz"
+ASCII_UPPERCASE = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+DIGITS = "0123456789"
+PUNCTUATION = r"""!"#$%&'()*+,-./:;<=>?@[\]^_`{|}~"""
+WHITESPACE = " \t\n\r\x0b\x0c"
+
+# Characters that are easy to misread; pass as `exclude` to leave them out
+AMBIGUOUS_CHARACTERS = "0O1lI"
+
+# Word list used by estimate_strength to spot dictionary words (one per line,
+# the same format as the Hangman exercise's list)
+DEFAULT_DICTIONARY = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                  os.pardir, "1_hangman", "hangman_word_list.txt")
+
+# Words from the most common leaked passwords, always checked as well
+COMMON_PASSWORD_WORDS = (
+    "password", "admin", "login", "welcome", "letmein", "dragon", "monkey",
+    "master", "shadow", "sunshine", "princess", "football", "baseball", "iloveyou",
+    "trustno", "superman", "batman", "starwars", "secret", "hello", "freedom", "whatever",
+)
 
 
 # --- Core Logic Function ---
@@ -24,52 +58,605 @@ def generate_password(length: int, use_lower: bool, use_upper: bool, use_digits:
         ValueError: If no character types are selected or if the length
                     is too short to include one of each selected type.
     """
-    
-    character_pool: List[str] = []
-    guaranteed_chars: List[str] = []
+    # The policy (character pool and per-type tables) is built once per
+    # combination of options and then reused from the cache.
+    return policy_for(use_lower, use_upper, use_digits, use_symbols).generate(length)
 
-    # 1. Build the character pool and select one guaranteed char from each chosen set
-    if use_lower:
-        character_pool.extend(string.ascii_lowercase)
-        guaranteed_chars.append(secrets.choice(string.ascii_lowercase))
-        
-    if use_upper:
-        character_pool.extend(string.ascii_uppercase)
-        guaranteed_chars.append(secrets.choice(string.ascii_uppercase))
-        
-    if use_digits:
-        character_pool.extend(string.digits)
-        guaranteed_chars.append(secrets.choice(string.digits))
-        
-    if use_symbols:
-        character_pool.extend(string.punctuation)
-        guaranteed_chars.append(secrets.choice(string.punctuation))
-
-    # 2. Validation Checks
-    if not character_pool:
-        # This error is *also* checked in main(), but it's good practice
-        # to have the core function be robust on its own.
-        raise ValueError("Cannot generate password. At least one character type must be selected.")
-
-    if length < len(guaranteed_chars):
-        raise ValueError(
-            f"Password length ({length}) is too short. "
-            f"It must be at least {len(guaranteed_chars)} to include one of each selected character type."
-        )
-
-    # 3. Fill the rest of the password
-    remaining_length = length - len(guaranteed_chars)
-    
-    # Add random characters from the *full* pool to fill the remaining length
-    # This list comprehension is a more "Pythonic" way to write a for-loop
-    other_chars = [secrets.choice(character_pool) for _ in range(remaining_length)]
 
-    # 4. Combine guaranteed chars with other chars and shuffle
-    password_list = guaranteed_chars + other_chars
-    random.shuffle(password_list)
+def generate_passwords(n: int, length: int, use_lower: bool = True, use_upper: bool = True,
+                       use_digits: bool = True, use_symbols: bool = True) -> List[str]:
+    """
+    Generates n passwords at once, each with the same guarantees as
+    generate_password. See PasswordPolicy.generate_many.
+
+    Raises:
+        ValueError: For the same reasons as generate_password, or if n < 0.
+    """
+    return policy_for(use_lower, use_upper, use_digits, use_symbols).generate_many(n, length)
+
+
+# --- Secure Random Draws ---
+
+# Translation tables for _draw, keyed by pool: see _rejection_table
+_rejection_tables: Dict[str, Tuple[bytes, bytes, int]] = {}
+
+
+def _rejection_table(pool: str) -> Tuple[bytes, bytes, int]:
+    """
+    Returns (table, rejected, limit) for drawing uniform characters from
+    pool (at most 256 single-byte characters) with random bytes.
+    Bytes below limit (a multiple of len(pool)) map to pool[byte % len(pool)];
+    the rest are rejected, so there is no modulo bias.
+    """
+    tables = _rejection_tables.get(pool)
+    if tables is None:
+        size = len(pool)
+        limit = 256 - 256 % size
+        table = bytes(ord(pool[b % size]) if b < limit else 0 for b in range(256))
+        tables = _rejection_tables[pool] = (table, bytes(range(limit, 256)), limit)
+    return tables
+
+
+def _draw(pool: str, count: int) -> bytes:
+    """
+    Returns count characters chosen uniformly and independently from pool,
+    using batched secrets.token_bytes calls rather than one call per character.
+    """
+    import secrets  # pylint: disable=import-outside-toplevel
+    table, rejected, limit = _rejection_table(pool)
+    drawn = b""
+    while len(drawn) < count:
+        needed = count - len(drawn)
+        # Ask for enough bytes that one round almost always suffices
+        raw = secrets.token_bytes(needed * 256 // limit + 32)
+        drawn += raw.translate(table, rejected)
+    return drawn[:count]
+
+
+def _draw_indices(bound: int, count: int) -> bytes:
+    """Returns count uniform random integers in range(bound), bound <= 256, as bytes."""
+    return _draw("".join(map(chr, range(bound))), count)
+
+
+def _secure_shuffle(items: MutableSequence) -> None:
+    """
+    Shuffles items in place with the Fisher-Yates algorithm. Swap indices
+    come from one batch of secrets.token_bytes, using rejection sampling
+    for each bound so every ordering is equally likely.
+    """
+    import secrets  # pylint: disable=import-outside-toplevel
+    buffer = secrets.token_bytes(2 * len(items) + 16)
+    used = 0
+    for i in range(len(items) - 1, 0, -1):
+        bound = i + 1
+        if bound > 256:
+            j = secrets.randbelow(bound)
+        else:
+            limit = 256 - 256 % bound
+            while True:
+                if used == len(buffer):
+                    buffer, used = secrets.token_bytes(len(items) + 16), 0
+                byte = buffer[used]
+                used += 1
+                if byte < limit:
+                    break
+            j = byte % bound
+        items[i], items[j] = items[j], items[i]
+
+
+# --- Password Policies ---
+
+class PasswordPolicy:
+    """
+    A reusable set of password rules: the character classes to draw from,
+    the minimum number of characters from each, and characters to exclude.
+
+    All tables (the combined pool and each class after exclusions) are
+    worked out once when the policy is created. Policies are immutable and
+    hashable, so they can be cached and shared (see policy_for).
+
+    Args:
+        classes: (characters, minimum count) pairs, e.g.
+                 [(ASCII_LOWERCASE, 1), (DIGITS, 2)].
+        exclude: Characters never to use, e.g. AMBIGUOUS_CHARACTERS.
+
+    Raises:
+        ValueError: If there are no classes, a class is empty after
+                    exclusions, a minimum is negative, or a character
+                    is outside Latin-1.
+    """
+
+    __slots__ = ("classes", "exclude", "pool", "min_length")
+
+    def __init__(self, classes: Iterable[Tuple[str, int]], exclude: str = "") -> None:
+        excluded = set(exclude)
+        normalized = []
+        for chars, minimum in classes:
+            # Drop excluded and repeated characters, keeping the order
+            kept = "".join(dict.fromkeys(c for c in chars if c not in excluded))
+            if not kept:
+                raise ValueError(f"Character class {chars!r} is empty after exclusions.")
+            if minimum < 0:
+                raise ValueError(f"Minimum count for {chars!r} can't be negative ({minimum}).")
+            if max(map(ord, kept)) > 255:
+                raise ValueError(f"Character class {chars!r} must only use Latin-1 characters.")
+            normalized.append((kept, minimum))
+        if not normalized:
+            raise ValueError("Cannot generate password. At least one character type must be selected.")
+
+        self.classes: Tuple[Tuple[str, int], ...] = tuple(normalized)
+        self.exclude = "".join(sorted(excluded))
+        self.pool = "".join(dict.fromkeys("".join(chars for chars, _ in normalized)))
+        self.min_length = sum(minimum for _, minimum in normalized)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PasswordPolicy):
+            return NotImplemented
+        return (self.classes, self.exclude) == (other.classes, other.exclude)
+
+    def __hash__(self) -> int:
+        return hash((self.classes, self.exclude))
+
+    def __repr__(self) -> str:
+        return f"PasswordPolicy({list(self.classes)!r}, exclude={self.exclude!r})"
+
+    def _check_length(self, length: int) -> None:
+        if length < self.min_length:
+            if all(minimum == 1 for _, minimum in self.classes):
+                reason = "to include one of each selected character type"
+            else:
+                reason = "to include the minimum number of each character type"
+            raise ValueError(
+                f"Password length ({length}) is too short. "
+                f"It must be at least {self.min_length} {reason}."
+            )
+
+    def generate(self, length: int) -> str:
+        """
+        Generates one password: the required characters from each class,
+        the rest from the whole pool, shuffled with a CSPRNG.
+
+        Raises:
+            ValueError: If length is less than min_length.
+        """
+        self._check_length(length)
+        chars = bytearray()
+        for class_chars, minimum in self.classes:
+            chars += _draw(class_chars, minimum)
+        chars += _draw(self.pool, length - self.min_length)
+        _secure_shuffle(chars)
+        return chars.decode("latin-1")
+
+    def generate_many(self, n: int, length: int) -> List[str]:
+        """
+        Generates n passwords, with randomness drawn in bulk.
+
+        The filler characters are independent and uniform, so placing each
+        required character at a uniformly random position gives the same
+        distribution as a full shuffle, without shuffling every password.
+
+        Raises:
+            ValueError: If length is less than min_length, or n < 0.
+        """
+        self._check_length(length)
+        if n < 0:
+            raise ValueError(f"Cannot generate a negative number of passwords ({n}).")
+
+        fill_length = length - self.min_length
+        fill = _draw(self.pool, n * fill_length).decode("latin-1")
+        passwords = [fill[i:i + fill_length] for i in range(0, n * fill_length, fill_length)] \
+            if fill_length else [""] * n
+
+        # Insert each required character at a random position in turn
+        placed = fill_length
+        for class_chars, minimum in self.classes:
+            for _ in range(minimum):
+                required = _draw(class_chars, n).decode("latin-1")
+                placed += 1  # Possible positions in the password so far
+                if placed <= 256:
+                    positions: Iterable[int] = _draw_indices(placed, n)
+                else:
+                    import secrets  # pylint: disable=import-outside-toplevel
+                    positions = [secrets.randbelow(placed) for _ in range(n)]
+                passwords = [pw[:pos] + char + pw[pos:]
+                             for pw, char, pos in zip(passwords, required, positions)]
+        return passwords
+
+
+@functools.lru_cache(maxsize=128)
+def policy_for(use_lower: bool = True, use_upper: bool = True, use_digits: bool = True,
+               use_symbols: bool = True, exclude: str = "", min_each: int = 1) -> PasswordPolicy:
+    """
+    Returns the (cached) policy for the standard character types, with
+    at least min_each character of every selected type.
+
+    Raises:
+        ValueError: If no character types are selected.
+    """
+    classes = [(chars, min_each) for chars, used in ((ASCII_LOWERCASE, use_lower),
+                                                     (ASCII_UPPERCASE, use_upper),
+                                                     (DIGITS, use_digits),
+                                                     (PUNCTUATION, use_symbols)) if used]
+    return PasswordPolicy(classes, exclude)
+
+# --- Strength Estimation ---
+
+class StrengthEstimate(namedtuple("StrengthEstimate", ("entropy_bits", "weaknesses"))):
+    """
+    The result of estimate_strength:
+    - entropy_bits (float): Estimated guesses needed, as a power of two.
+    - weaknesses (Tuple[str, ...]): e.g. ("dictionary word 'dragon'", "sequence '123'").
+    (A collections.namedtuple, since typing.NamedTuple would import typing.)
+    """
+
+    __slots__ = ()
+
+
+class DictionaryIndex:
+    """
+    The (lowercase) words from a word list, for substring lookups.
+    Only words of MIN_WORD_LENGTH or more are kept, sorted and packed
+    into one UTF-8 buffer: word i is buffer[offsets[i]:offsets[i + 1]],
+    as in the Hangman exercise's WordStore. That costs a few bytes per
+    word rather than a str object and a hash-table slot each. Words that
+    share their first MIN_WORD_LENGTH letters are adjacent, so prefixes
+    maps each such prefix to a small range of word ids to binary search;
+    a prefix that isn't there rules out a starting position in one
+    probe. The longest word length bounds the substrings worth checking.
+    """
+
+    MIN_WORD_LENGTH = 4
+
+    __slots__ = ("_buffer", "_offsets", "_prefix_starts", "prefixes", "max_length")
+
+    def __init__(self, words: Iterable[str]) -> None:
+        unique = sorted({
+            word for word in (w.strip().lower() for w in words)
+            if len(word) >= self.MIN_WORD_LENGTH and word.isalpha()})
+        self._buffer = "".join(unique).encode("utf-8")
+        self._offsets = array("Q", [0])
+        # prefixes[p] = k: the words starting with p are ids
+        # _prefix_starts[k] up to (not including) _prefix_starts[k + 1]
+        self.prefixes: Dict[str, int] = {}
+        self._prefix_starts = array("Q")
+        for i, word in enumerate(unique):
+            self._offsets.append(self._offsets[-1] + len(word.encode("utf-8")))
+            prefix = word[:self.MIN_WORD_LENGTH]
+            if prefix not in self.prefixes:
+                self.prefixes[prefix] = len(self._prefix_starts)
+                self._prefix_starts.append(i)
+        self._prefix_starts.append(len(unique))
+        self.max_length = max(map(len, unique), default=0)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and len(word) in self.match_ends(word, 0)
+
+    def match_ends(self, text: str, start: int) -> List[int]:
+        """
+        Every end, in increasing order, where text[start:end] is a word.
+        Each longer substring only searches the words that begin with the
+        shorter one, so this costs little more than a single lookup.
+        """
+        k = self.prefixes.get(text[start:start + self.MIN_WORD_LENGTH])
+        if k is None:
+            return []
+        buffer, offsets = self._buffer, self._offsets
+        lo, hi = self._prefix_starts[k], self._prefix_starts[k + 1]
+        word = buffer[offsets[lo]:offsets[lo + 1]]  # Kept as the first word >= key
+        ends = []
+        for end in range(start + self.MIN_WORD_LENGTH, min(len(text), start + self.max_length) + 1):
+            key = text[start:end].encode("utf-8")
+            if not word.startswith(key):
+                # The words before lo are below the shorter key, so below
+                # this one too: search the rest (UTF-8 bytes sort like the
+                # str). If the first word >= key doesn't start with it, no
+                # word does, nor with any longer key.
+                lo += 1
+                high = hi
+                while lo < high:
+                    mid = (lo + high) // 2
+                    if buffer[offsets[mid]:offsets[mid + 1]] < key:
+                        lo = mid + 1
+                    else:
+                        high = mid
+                if lo == hi:
+                    break
+                word = buffer[offsets[lo]:offsets[lo + 1]]
+                if not word.startswith(key):
+                    break
+            if len(word) == len(key):
+                ends.append(end)
+        return ends
+
+
+@functools.lru_cache(maxsize=8)
+def load_dictionary(filepath: str = DEFAULT_DICTIONARY) -> DictionaryIndex:
+    """Loads (once) a word-list file, plus COMMON_PASSWORD_WORDS, into a
+    DictionaryIndex.
+
+    Raises:
+        OSError: If the file can't be read, rather than quietly checking
+                 against far fewer words.
+    """
+    with open(filepath, "r") as f:
+        return DictionaryIndex([*f, *COMMON_PASSWORD_WORDS])
+
+
+# Common character substitutions, undone before looking for dictionary words.
+# '1' stands for either 'i' or 'l', so there is one table for each reading.
+_UNLEET_TABLES = tuple(str.maketrans("4@310$5+7", f"aae{one}ossst") for one in "il")
+_KEYBOARD_ROWS = ("1234567890", "qwertyuiop", "asdfghjkl", "zxcvbnm")
+# Every pair of keys next to each other in a row, e.g. "qw" and "wq"
+_KEYBOARD_NEIGHBOURS = frozenset(
+    row[i] + row[i + step] for row in _KEYBOARD_ROWS
+    for i in range(len(row)) for step in (-1, 1) if 0 <= i + step < len(row)
+)
+
+
+_WHITESPACE = frozenset(WHITESPACE)
+_CHARSETS = tuple((frozenset(chars), len(chars)) for chars in
+                  (ASCII_LOWERCASE, ASCII_UPPERCASE, DIGITS, PUNCTUATION))
+
+
+def _charset_size(password: str) -> int:
+    """The size of the smallest standard pool that could produce password."""
+    chars = set(password)
+    size = sum(charset_size for charset, charset_size in _CHARSETS if not charset.isdisjoint(chars))
+    if not password.isascii() or not _WHITESPACE.isdisjoint(chars):
+        size += 100  # Anything else: spaces, accents, emoji...
+    return max(size, 1)
+
+
+def _runs(links: List[bool], min_chars: int = 3) -> Iterable[Tuple[int, int]]:
+    """
+    links[i] says whether characters i and i + 1 belong together (e.g. the
+    second follows the first in the alphabet). Yields the (start, end)
+    character ranges of every maximal linked run of at least min_chars.
+    """
+    if True not in links:
+        return
+    start = 0  # First character of the current run
+    for i, linked in enumerate(links + [False]):
+        if not linked:
+            if i + 1 - start >= min_chars:
+                yield start, i + 1
+            start = i + 1
+
+
+def estimate_strength(password: str, dictionary: Optional[DictionaryIndex] = None) -> StrengthEstimate:
+    """
+    Estimates a password's entropy and flags weak patterns: dictionary
+    words (also with common substitutions such as '4' for 'a'), sequences
+    ('abc', '987'), repeats ('aaa') and keyboard walks ('qwer').
+
+    Each character costs log2(pool size) bits, unless it is part of a
+    pattern, which costs roughly what it takes to guess that pattern
+    (e.g. log2(dictionary size) for a whole word). The estimate is the
+    cheapest way to cover the whole password, found by dynamic programming.
+
+    Args:
+        password: The password to check.
+        dictionary: Words to look for; defaults to load_dictionary().
+
+    Returns:
+        A StrengthEstimate of (entropy_bits, weaknesses).
+
+    Raises:
+        OSError: If the default dictionary is needed and can't be read.
+    """
+    dictionary = dictionary if dictionary is not None else load_dictionary()
+    n = len(password)
+    char_bits = math.log2(_charset_size(password))
+    lower = password.lower()
+
+    # (start, end, bits, description) for every weak pattern found
+    matches: List[Tuple[int, int, float, str]] = []
+    if len(dictionary):
+        word_bits = math.log2(len(dictionary))
+        prefixes, min_length = dictionary.prefixes, dictionary.MIN_WORD_LENGTH
+        readings = dict.fromkeys(lower.translate(table) for table in _UNLEET_TABLES)
+        candidates = [(lower, 0.0)] + [(reading, 1.0) for reading in readings if reading != lower]
+        for candidate, extra_bits in candidates:
+            for i in range(n - min_length + 1):
+                if candidate[i:i + min_length] not in prefixes:
+                    continue
+                for end in dictionary.match_ends(candidate, i):
+                    case_bits = 0.0 if password[i:end].islower() else 1.0
+                    matches.append((i, end, word_bits + extra_bits + case_bits,
+                                    f"dictionary word '{password[i:end]}'"))
+
+    codes = [ord(c) for c in password]
+    steps = [b - a for a, b in zip(codes, codes[1:])]
+    for step in (1, -1):
+        for start, end in _runs([s == step for s in steps]):
+            matches.append((start, end, char_bits + math.log2(end - start) + 1,
+                            f"sequence '{password[start:end]}'"))
+    for start, end in _runs([s == 0 for s in steps]):
+        matches.append((start, end, char_bits + math.log2(end - start),
+                        f"repeat '{password[start:end]}'"))
+    walk = [lower[i:i + 2] in _KEYBOARD_NEIGHBOURS for i in range(n - 1)]
+    for start, end in _runs(walk, min_chars=4):
+        matches.append((start, end, math.log2(36) + math.log2(end - start) + 1,
+                        f"keyboard walk '{password[start:end]}'"))
+
+    if not matches:
+        return StrengthEstimate(round(n * char_bits, 2), ())
+
+    # best[i] is the cheapest cost of password[:i]
+    best = [0.0] + [math.inf] * n
+    ending_at: Dict[int, List[Tuple[int, float]]] = {}
+    for start, end, bits, _ in matches:
+        ending_at.setdefault(end, []).append((start, bits))
+    for i in range(1, n + 1):
+        best[i] = best[i - 1] + char_bits
+        for start, bits in ending_at.get(i, ()):
+            best[i] = min(best[i], best[start] + bits)
+
+    weaknesses = tuple(dict.fromkeys(description for *_, description in matches))
+    return StrengthEstimate(round(best[n], 2), weaknesses)
+
+
+# --- Bulk Output ---
+
+def _generate_chunk(policy: PasswordPolicy, n: int, length: int) -> bytes:
+    """Generates n passwords as newline-terminated lines (runs in a worker).
+    Each worker process draws from the OS CSPRNG through secrets on its
+    own, so there is no shared random state to copy or reseed after fork.
+    """
+    return ("\n".join(policy.generate_many(n, length)) + "\n").encode("latin-1") if n else b""
+
+
+def stream_passwords(policy: PasswordPolicy, count: int, length: int, out: BinaryIO,
+                     workers: Optional[int] = None, chunk_size: int = 50_000) -> None:
+    """
+    Writes count passwords to out, one per line, generated in chunks of
+    chunk_size on a process pool (workers=1 runs in this process instead).
+    Only a few chunks per worker are in flight at once and each is
+    written as soon as it is ready, in order, so memory use stays flat
+    however large count is.
+
+    Raises:
+        ValueError: If the policy can't make passwords of this length,
+                    count < 0 (as from generate_passwords), or workers or
+                    chunk_size is less than 1.
+    """
+    _check_stream_args(policy, count, length, workers, chunk_size)
+    chunks = [min(chunk_size, count - start) for start in range(0, count, chunk_size)]
+    if workers == 1:
+        for n in chunks:
+            out.write(_generate_chunk(policy, n, length))
+        out.flush()
+        return
+
+    from collections import deque  # pylint: disable=import-outside-toplevel
+    from concurrent.futures import ProcessPoolExecutor  # pylint: disable=import-outside-toplevel
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        max_in_flight = 2 * workers
+        pending: Deque[Future] = deque()
+        try:
+            for n in chunks:
+                if len(pending) >= max_in_flight:
+                    out.write(pending.popleft().result())
+                pending.append(pool.submit(_generate_chunk, policy, n, length))
+            while pending:
+                out.write(pending.popleft().result())
+        except BaseException:
+            # e.g. BrokenPipeError: don't wait for chunks nobody will read
+            pool.shutdown(cancel_futures=True)
+            raise
+    out.flush()
+
+
+def _check_stream_args(policy: PasswordPolicy, count: int, length: int,
+                       workers: Optional[int], chunk_size: int) -> None:
+    """Raises ValueError for arguments stream_passwords can't use."""
+    if count < 0:
+        raise ValueError(f"Cannot generate a negative number of passwords ({count}).")
+    if workers is not None and workers < 1:
+        raise ValueError(f"Need at least 1 worker, not {workers}.")
+    if chunk_size < 1:
+        raise ValueError(f"Chunks need at least 1 password, not {chunk_size}.")
+    policy.generate_many(0, length)  # Fail early if the length is invalid
+
+
+def _positive_int(text: str) -> int:
+    """argparse type for options that must be at least 1."""
+    import argparse  # pylint: disable=import-outside-toplevel
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, not {value}")
+    return value
+
+
+def cli(argv: List[str]) -> int:
+    """
+    Non-interactive mode, for bulk generation, e.g.
+    `python password_generator.py --count 10000000 --length 24 --out passwords.txt`
+    Returns the exit status.
+    """
+    import argparse  # pylint: disable=import-outside-toplevel
+    parser = argparse.ArgumentParser(description="Generate passwords in bulk.")
+    parser.add_argument("--count", type=int, default=1, help="number of passwords (default 1)")
+    parser.add_argument("--length", type=int, default=16, help="password length (default 16)")
+    parser.add_argument("--out", default="-", help="output file (default stdout)")
+    parser.add_argument("--no-lower", action="store_true", help="leave out lowercase letters")
+    parser.add_argument("--no-upper", action="store_true", help="leave out uppercase letters")
+    parser.add_argument("--no-digits", action="store_true", help="leave out numbers")
+    parser.add_argument("--no-symbols", action="store_true", help="leave out symbols")
+    parser.add_argument("--exclude-ambiguous", action="store_true",
+                        help=f"leave out {AMBIGUOUS_CHARACTERS}")
+    parser.add_argument("--workers", type=_positive_int, default=None,
+                        help="processes (default: one per CPU)")
+    parser.add_argument("--chunk-size", type=_positive_int, default=50_000, help="passwords per task")
+    parser.add_argument("--batch", action="store_true",
+                        help="answer JSON requests from stdin instead (see run_batch)")
+    args = parser.parse_args(argv)
+    if args.batch:
+        return 1 if run_batch(sys.stdin.buffer, sys.stdout.buffer) else 0
+
+    try:
+        policy = policy_for(not args.no_lower, not args.no_upper, not args.no_digits,
+                            not args.no_symbols, AMBIGUOUS_CHARACTERS if args.exclude_ambiguous else "")
+        # Check before opening --out, which truncates it
+        _check_stream_args(policy, args.count, args.length, args.workers, args.chunk_size)
+        if args.out == "-":
+            stream_passwords(policy, args.count, args.length, sys.stdout.buffer,
+                             args.workers, args.chunk_size)
+        else:
+            with open(args.out, "wb") as out:
+                stream_passwords(policy, args.count, args.length, out, args.workers, args.chunk_size)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`). As the Python docs suggest,
+        # point stdout at devnull so the flush at exit doesn't fail again.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    return 0
+
+
+# --- Batch Mode ---
+
+def _batch_generate(request: dict):
+    """
+    A "generate" request: "length" (default 16), the character types
+    "lower", "upper", "digits" and "symbols" (default true), and
+    "exclude_ambiguous" (default false). Returns one password, or a list
+    of "count" passwords if that is given.
+    """
+    policy = policy_for(request.get("lower", True), request.get("upper", True),
+                        request.get("digits", True), request.get("symbols", True),
+                        AMBIGUOUS_CHARACTERS if request.get("exclude_ambiguous") else "")
+    length = request.get("length", 16)
+    if "count" in request:
+        return policy.generate_many(request["count"], length)
+    return policy.generate(length)
+
+
+# The ops of `python password_generator.py --batch`
+BATCH_OPERATIONS: Dict[str, Callable[[dict], object]] = {
+    "generate": _batch_generate,
+    "strength": lambda request: estimate_strength(request["password"])._asdict(),
+}
+
+
+def run_batch(in_stream: BinaryIO, out_stream: BinaryIO, chunk_size: Optional[int] = None) -> int:
+    """
+    Answers JSON requests for BATCH_OPERATIONS until the input ends, e.g.
+    `python password_generator.py --batch < requests.jsonl`, where
+    {"id": 1, "op": "generate", "length": 12} gets {"id": 1, "result": "<a password>"}
+    (see common/batch_mode.py). Returns the number of requests that failed.
+    """
+    site.addsitedir(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "common"))
+    import batch_mode  # pylint: disable=import-outside-toplevel
+    return batch_mode.run_batch(BATCH_OPERATIONS, in_stream, out_stream, chunk_size)
 
-    # 5. Convert the list of characters back into a final string
-    return "".join(password_list)
 
 # --- User Input Helper Functions ---
 
@@ -140,4 +727,6 @@ def main() -> None:
         print(f"\n❌ Error: {e}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if len(sys.argv) > 1:
+        sys.exit(cli(sys.argv[1:]))
+    main()
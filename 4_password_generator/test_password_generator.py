@@ -1,10 +1,27 @@
+import io
+import json
+import math
+import os
 import string
+import subprocess
+import sys
 import pytest
 from unittest.mock import patch
 
 # Import the functions we want to test from your .py file
 from password_generator import (
+    AMBIGUOUS_CHARACTERS,
+    DictionaryIndex,
+    PasswordPolicy,
+    _secure_shuffle,
+    cli,
+    estimate_strength,
     generate_password,
+    generate_passwords,
+    load_dictionary,
+    policy_for,
+    run_batch,
+    stream_passwords,
     get_yes_no_input,
     get_int_input
 )
@@ -28,3 +45,248 @@ def test_get_yes_no_input_yes(mock_input):
     """Test that 'y' returns True."""
     assert get_yes_no_input("Test prompt?") is True
 
+
+## ---------------------------------
+## Tests for generate_passwords()
+## ---------------------------------
+
+def _chi_squared(counts, expected):
+    """Pearson's chi-squared statistic for observed counts."""
+    return sum((count - expected) ** 2 / expected for count in counts)
+
+
+def test_generate_passwords_count_length_and_classes():
+    """Test that every bulk password has the right length and character types."""
+    passwords = generate_passwords(500, 8, True, True, True, True)
+    assert len(passwords) == 500
+    for pw in passwords:
+        assert len(pw) == 8
+        assert any(c in string.ascii_lowercase for c in pw)
+        assert any(c in string.ascii_uppercase for c in pw)
+        assert any(c in string.digits for c in pw)
+        assert any(c in string.punctuation for c in pw)
+
+
+def test_generate_passwords_minimum_length_and_errors():
+    """Test the minimum length, n == 0 and invalid arguments."""
+    pw = generate_passwords(1, 2, False, True, True, False)[0]
+    assert len(pw) == 2 and any(c.isupper() for c in pw) and any(c.isdigit() for c in pw)
+    assert generate_passwords(0, 10) == []
+    with pytest.raises(ValueError):
+        generate_passwords(5, 10, False, False, False, False)
+    with pytest.raises(ValueError):
+        generate_passwords(5, 3, True, True, True, True)
+    with pytest.raises(ValueError):
+        generate_passwords(-1, 10)
+
+
+def test_generate_passwords_characters_are_uniform():
+    """
+    Chi-squared test that characters are uniform over a single class.
+    With 25 degrees of freedom the statistic is above 60 with probability
+    well under 1 in 10,000 when the generator is uniform.
+    """
+    text = "".join(generate_passwords(2000, 20, True, False, False, False))
+    counts = [text.count(c) for c in string.ascii_lowercase]
+    assert _chi_squared(counts, len(text) / 26) < 60
+
+
+def test_generate_passwords_positions_are_uniform():
+    """
+    Chi-squared test that guaranteed characters aren't stuck in fixed
+    places: digits should be equally likely at every position.
+    """
+    passwords = generate_passwords(20000, 10, False, True, True, False)
+    counts = [sum(pw[i].isdigit() for pw in passwords) for i in range(10)]
+    assert _chi_squared(counts, sum(counts) / 10) < 35  # 9 degrees of freedom
+
+## ---------------------------------
+## Tests for PasswordPolicy
+## ---------------------------------
+
+def test_policy_exclusions_and_minimum_counts():
+    """Test that excluded characters never appear and class minimums are met."""
+    policy = PasswordPolicy([(string.ascii_letters, 2), (string.digits, 3)], exclude=AMBIGUOUS_CHARACTERS)
+    assert policy.min_length == 5
+    for pw in [policy.generate(6) for _ in range(200)] + policy.generate_many(200, 6):
+        assert len(pw) == 6
+        assert not set(pw) & set(AMBIGUOUS_CHARACTERS)
+        assert sum(c.isdigit() for c in pw) >= 3
+        assert sum(c.isalpha() for c in pw) >= 2
+
+
+def test_policy_custom_class_and_zero_minimum():
+    """Test a custom character class, and a class with no minimum."""
+    policy = PasswordPolicy([("ab", 0), ("XYZ", 1)])
+    assert policy.pool == "abXYZ"
+    assert policy.generate(1) in "XYZ"
+    assert set("".join(policy.generate_many(100, 4))) <= set("abXYZ")
+
+
+def test_policy_is_hashable_and_cached():
+    """Test that equal policies hash equally and policy_for reuses them."""
+    first = PasswordPolicy([("abc", 1)], exclude="c")
+    second = PasswordPolicy([("abc", 1)], exclude="c")
+    assert first == second and hash(first) == hash(second)
+    assert len({first, second}) == 1
+    assert policy_for(True, False, True, False) is policy_for(True, False, True, False)
+
+
+def test_policy_errors():
+    """Test that invalid policies and lengths raise ValueError."""
+    with pytest.raises(ValueError):
+        PasswordPolicy([])
+    with pytest.raises(ValueError):
+        PasswordPolicy([("01", 1)], exclude="01")
+    with pytest.raises(ValueError):
+        PasswordPolicy([("abc", -1)])
+    with pytest.raises(ValueError, match="at least 4"):
+        PasswordPolicy([("abc", 2), ("123", 2)]).generate(3)
+
+
+def test_secure_shuffle_is_uniform():
+    """Chi-squared test that all 6 orderings of 3 items are equally likely."""
+    counts = {}
+    for _ in range(6000):
+        items = [0, 1, 2]
+        _secure_shuffle(items)
+        counts[tuple(items)] = counts.get(tuple(items), 0) + 1
+    assert len(counts) == 6
+    assert _chi_squared(counts.values(), 1000) < 25  # 5 degrees of freedom
+
+
+## ---------------------------------
+## Tests for the bulk CLI mode
+## ---------------------------------
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_stream_passwords(workers):
+    """Test that streaming writes exactly count passwords, in and out of process."""
+    out = io.BytesIO()
+    stream_passwords(policy_for(True, True, False, False), 25, 6, out, workers=workers, chunk_size=7)
+    lines = out.getvalue().decode().splitlines()
+    assert len(lines) == 25
+    assert all(len(pw) == 6 and pw.isalpha() for pw in lines)
+
+
+def test_cli_writes_file(tmp_path):
+    """Test the --count/--length/--out options."""
+    out_file = tmp_path / "passwords.txt"
+    assert cli(["--count", "10", "--length", "12", "--no-symbols", "--workers", "1",
+                "--out", str(out_file)]) == 0
+    lines = out_file.read_text().splitlines()
+    assert len(lines) == 10
+    assert all(len(pw) == 12 and pw.isalnum() for pw in lines)
+
+
+def test_cli_rejects_short_length(capsys):
+    """Test that an impossible length is reported with a non-zero exit status."""
+    assert cli(["--count", "1", "--length", "2", "--workers", "1"]) == 1
+    assert "too short" in capsys.readouterr().err
+
+
+def test_cli_rejects_negative_count(capsys):
+    """Test that a negative count is an error, not an empty success."""
+    assert cli(["--count", "-3", "--workers", "1"]) == 1
+    assert "negative number of passwords (-3)" in capsys.readouterr().err
+    with pytest.raises(ValueError, match="negative"):
+        stream_passwords(policy_for(), -1, 8, io.BytesIO(), workers=1)
+
+
+@pytest.mark.parametrize("option", ["--workers", "--chunk-size"])
+@pytest.mark.parametrize("value", ["0", "-1"])
+def test_cli_rejects_non_positive_workers_and_chunk_size(tmp_path, capsys, option, value):
+    """Test that --workers and --chunk-size below 1 are errors, and leave --out alone."""
+    out_file = tmp_path / "passwords.txt"
+    out_file.write_text("keep\n")
+    with pytest.raises(SystemExit) as exc_info:
+        cli(["--count", "5", option, value, "--out", str(out_file)])
+    assert exc_info.value.code == 2
+    assert "must be at least 1" in capsys.readouterr().err
+    assert out_file.read_text() == "keep\n"
+    assert cli(["--count", "-1", "--out", str(out_file)]) == 1
+    assert out_file.read_text() == "keep\n"
+    for kwargs in ({"workers": 0}, {"chunk_size": 0}, {"chunk_size": -1}):
+        with pytest.raises(ValueError, match="at least 1"):
+            stream_passwords(policy_for(), 5, 8, io.BytesIO(), **kwargs)
+
+
+def test_cli_quiet_on_broken_pipe():
+    """Test that piping into a reader that quits early (like `head`) exits without a traceback."""
+    process = subprocess.Popen([sys.executable, "password_generator.py", "--count", "1000000",
+                                "--chunk-size", "1000"],
+                               cwd=os.path.dirname(os.path.abspath(__file__)),
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    process.stdout.readline()
+    process.stdout.close()
+    _, err = process.communicate(timeout=60)
+    assert process.returncode == 1
+    assert b"Traceback" not in err
+
+
+def test_run_batch():
+    """Test the JSON batch mode, with requests split across input chunks."""
+    requests = (b'{"id": 1, "op": "generate", "length": 10, "symbols": false}\n'
+                b'{"id": 2, "op": "generate", "count": 3, "length": 8}\n\n'
+                b'{"id": 3, "op": "strength", "password": "password"}\n'
+                b'{"id": 4, "op": "generate", "length": 2}\n'
+                b'{"id": 5, "op": "strength"}')
+    out = io.BytesIO()
+    assert run_batch(io.BytesIO(requests), out, chunk_size=9) == 2
+    responses = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [response["id"] for response in responses] == [1, 2, 3, 4, 5]
+    assert len(responses[0]["result"]) == 10 and responses[0]["result"].isalnum()
+    assert [len(pw) for pw in responses[1]["result"]] == [8, 8, 8]
+    assert responses[2]["result"]["weaknesses"] == ["dictionary word 'password'"]
+    assert "too short" in responses[3]["error"]
+    assert responses[4]["error"] == "Missing field 'password'."
+
+
+## ---------------------------------
+## Tests for estimate_strength()
+## ---------------------------------
+
+def test_estimate_strength_random_password():
+    """Test that a random password has no weaknesses and full entropy."""
+    estimate = estimate_strength("xK#9mQ!v2Lp$")
+    assert estimate.weaknesses == ()
+    assert estimate.entropy_bits == pytest.approx(12 * math.log2(94), abs=0.01)
+
+
+@pytest.mark.parametrize("password, weakness", [
+    ("password", "dictionary word 'password'"),
+    ("P4ssw0rd!", "dictionary word 'P4ssw0rd'"),
+    ("adm1n", "dictionary word 'adm1n'"),  # '1' read as 'i'
+    ("we1c0me", "dictionary word 'we1c0me'"),  # '1' read as 'l'
+    ("dragon123", "sequence '123'"),
+    ("xyzcba", "sequence 'cba'"),
+    ("zzzz", "repeat 'zzzz'"),
+    ("asdfgh", "keyboard walk 'asdfgh'"),
+])
+def test_estimate_strength_flags_patterns(password, weakness):
+    """Test that each kind of weak pattern is flagged and lowers the estimate."""
+    estimate = estimate_strength(password)
+    assert weakness in estimate.weaknesses
+    assert estimate.entropy_bits < len(password) * math.log2(26)
+
+
+def test_estimate_strength_custom_dictionary():
+    """Test a caller-supplied dictionary, and the empty password."""
+    dictionary = DictionaryIndex(["zebra", "cat"])  # 'cat' is too short to count
+    assert estimate_strength("zebra", dictionary).weaknesses == ("dictionary word 'zebra'",)
+    assert estimate_strength("cat", dictionary).weaknesses == ()
+    assert estimate_strength("", dictionary) == (0.0, ())
+
+
+def test_dictionary_index_lookups_and_missing_file(tmp_path):
+    """Test DictionaryIndex membership, and that a missing word list is an error."""
+    dictionary = DictionaryIndex(["Zebra\n", "apple", "café", "apple", "cat", "b4d!"])
+    assert len(dictionary) == 3
+    assert all(word in dictionary for word in ("apple", "café", "zebra"))
+    assert not any(word in dictionary for word in ("appl", "apples", "cat", "b4d!", "", "zzzzz", 5))
+    assert "nothing" not in DictionaryIndex([])
+    words = DictionaryIndex(["pass", "passage", "password", "passwords", "passwork"])
+    assert words.match_ends("xpasswordsx", 1) == [5, 9, 10]
+    assert words.match_ends("xpasswordsx", 0) == []
+    with pytest.raises(OSError):
+        load_dictionary(str(tmp_path / "missing.txt"))
@@ -0,0 +1,209 @@
+"""
+Benchmarks for the Newton-Raphson solvers.
+
+Run with `python bench_newton_raphson.py [N]` (default 1,000,000).
+Sweeps N starting points over [-10, 10] for x^3 - x - 1, one
+newton_raphson_find_root call at a time and with the vectorized
+newton_raphson_find_roots (if NumPy is installed).
+
+Run `python bench_newton_raphson.py polynomials [N]` (default 1,000,000)
+to solve N random cubics, one newton_raphson_find_root call per equation
+and in batch with solve_polynomials (which needs NumPy).
+
+Run `python bench_newton_raphson.py derivatives [N]` (default 10,000) to
+compare f evaluations and time for N solves with a hand-written df,
+automatic differentiation (df=None) and central finite differences.
+
+Run `python bench_newton_raphson.py hard` to compare the total function
+evaluations of newton_raphson_find_root (started mid-bracket) and
+find_root_bracketed over a suite of functions that trouble Newton's method.
+
+Run `python bench_newton_raphson.py trace [N]` (default 200,000) to time N
+solves without a trace and with an IterationTrace.
+"""
+import contextlib
+import io
+import math
+import sys
+import time
+
+import newton_raphson as nr
+
+
+def bench_sweep(n: int) -> None:
+    guesses = [-10 + 20 * i / max(n - 1, 1) for i in range(n)]
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):  # Silence failure messages
+        for guess in guesses:
+            nr.newton_raphson_find_root(nr.func, nr.deriv, guess, nr.TOLERANCE, nr.MAX_ITERATIONS)
+    scalar = time.perf_counter() - start
+    print(f"{'scalar loop':<24} {scalar:>8.2f}s {n / scalar:>14,.0f} starts/s")
+
+    try:
+        import numpy as np  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        print("vectorized               skipped: NumPy is not installed")
+        return
+    array = np.array(guesses)
+    start = time.perf_counter()
+    nr.newton_raphson_find_roots(nr.func, nr.deriv, array, nr.TOLERANCE, nr.MAX_ITERATIONS)
+    vectorized = time.perf_counter() - start
+    print(f"{'vectorized (NumPy)':<24} {vectorized:>8.2f}s {n / vectorized:>14,.0f} starts/s")
+
+
+def bench_polynomials(n: int) -> None:
+    try:
+        import numpy as np  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        sys.exit("solve_polynomials needs NumPy, which is not installed.")
+    rng = np.random.default_rng(0)
+    coefficients = np.column_stack([np.ones(n), rng.uniform(-5, 5, (n, 3))])
+
+    start = time.perf_counter()
+    solved = 0
+    with contextlib.redirect_stdout(io.StringIO()):  # Silence failure messages
+        for a, b, c, d in coefficients.tolist():
+            root, _ = nr.newton_raphson_find_root(
+                lambda x: ((a * x + b) * x + c) * x + d,
+                lambda x: (3 * a * x + 2 * b) * x + c,
+                0.0, nr.TOLERANCE, nr.MAX_ITERATIONS)
+            solved += root is not None
+    loop = time.perf_counter() - start
+    print(f"{'loop per equation':<24} {loop:>8.2f}s {n / loop:>14,.0f} equations/s ({solved:,} solved)")
+
+    for label, workers in (("solve_polynomials, 1 CPU", 1), ("solve_polynomials, pool", None)):
+        start = time.perf_counter()
+        _, _, status = nr.solve_polynomials(coefficients, 0.0, workers=workers)
+        elapsed = time.perf_counter() - start
+        solved = int((status == nr.STATUS_CONVERGED).sum())
+        print(f"{label:<24} {elapsed:>8.2f}s {n / elapsed:>14,.0f} equations/s ({solved:,} solved)")
+
+
+def finite_difference(f, h: float = 1e-6):
+    """The derivative of f by central differences: two calls of f per use."""
+    return lambda x: (f(x + h) - f(x - h)) / (2 * h)
+
+
+def bench_derivatives(n: int) -> None:
+    calls = 0
+
+    def cheap(x):
+        nonlocal calls
+        calls += 1
+        return x**3 - x - 1
+
+    def expensive(x):  # A 200-term series, so each call costs far more than a step
+        nonlocal calls
+        calls += 1
+        total = -1.0
+        for k in range(1, 201):
+            total += nr.sin(k * x) / (k * k)
+        return total + x
+
+    def expensive_deriv(x):
+        total = 1.0
+        for k in range(1, 201):
+            total += math.cos(k * x) / k
+        return total
+
+    def black_box(x):  # Fixed work per call that doesn't touch x, e.g. loading a model
+        nonlocal calls
+        calls += 1
+        sum(range(5000))
+        return x**3 - x - 1
+
+    guesses = [0.5 + i / n for i in range(n)]
+    for name, f, df in (("x^3 - x - 1", cheap, nr.deriv), ("200-term series", expensive, expensive_deriv),
+                        ("black box", black_box, nr.deriv)):
+        if f is not cheap:
+            guesses = guesses[:max(n // 20, 1)]
+        for label, derivative in (("hand-written df", df), ("autodiff (df=None)", None),
+                                  ("finite differences", finite_difference(f))):
+            calls = 0
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                for guess in guesses:
+                    nr.newton_raphson_find_root(f, derivative, guess, nr.TOLERANCE, nr.MAX_ITERATIONS)
+            elapsed = time.perf_counter() - start
+            print(f"{name:<16} {label:<20} {calls / len(guesses):>6.1f} f calls/solve "
+                  f"{elapsed / len(guesses) * 1e6:>9.1f} us/solve")
+
+
+def _cbrt(x):
+    return x ** (1 / 3) if x >= 0 else -(-x) ** (1 / 3)
+
+
+# (name, f, df, lower, upper): every f changes sign on [lower, upper]
+HARD_FUNCTIONS = [
+    ("x^3 - x - 1", nr.func, nr.deriv, -10.0, 10.0),
+    ("atan(x)", math.atan, lambda x: 1 / (1 + x * x), -5.0, 20.0),
+    ("cbrt(x - 0.3)", lambda x: _cbrt(x - 0.3), lambda x: _cbrt(x - 0.3) / (3 * (x - 0.3)), -1.0, 2.0),
+    ("(x - 1)^3", lambda x: (x - 1) ** 3, lambda x: 3 * (x - 1) ** 2, -3.0, 2.5),
+    ("x^10 - 1", lambda x: x**10 - 1, lambda x: 10 * x**9, 0.0, 1.5),
+    ("tanh(10(x - 0.3))", lambda x: math.tanh(10 * (x - 0.3)),
+     lambda x: 10 / math.cosh(10 * (x - 0.3)) ** 2, -2.0, 3.0),
+    ("x exp(-x) - 0.2", lambda x: x * math.exp(-x) - 0.2, lambda x: (1 - x) * math.exp(-x), 0.0, 1.0),
+    ("cos(x) - x", lambda x: math.cos(x) - x, lambda x: -math.sin(x) - 1, 0.0, 1.0),
+    ("sin(x) on [3, 41]", math.sin, math.cos, 3.0, 41.0),
+    ("1000(x - pi)", lambda x: 1000 * (x - math.pi), lambda x: 1000.0, 0.0, 5.0),
+]
+
+
+def bench_hard() -> None:
+    calls = 0
+
+    def counted(g):
+        def wrapper(x):
+            nonlocal calls
+            calls += 1
+            return g(x)
+        return wrapper
+
+    totals = [0, 0]
+    solved = [0, 0]
+    print(f"{'function':<20} {'newton evals':>12} {'result':<10} {'hybrid evals':>12} {'result':<14}")
+    for name, f, df, lower, upper in HARD_FUNCTIONS:
+        calls = 0
+        with contextlib.redirect_stdout(io.StringIO()):
+            try:
+                root, _ = nr.newton_raphson_find_root(counted(f), counted(df), (lower + upper) / 2,
+                                                      nr.TOLERANCE, nr.MAX_ITERATIONS)
+            except (ZeroDivisionError, OverflowError, ValueError):
+                root = None
+        newton_result = "failed" if root is None or not lower <= root <= upper else "ok"
+        newton_calls = calls
+        result = nr.find_root_bracketed(f, df, lower, upper)
+        totals[0] += newton_calls
+        totals[1] += result.evaluations
+        solved[0] += newton_result == "ok"
+        solved[1] += result.root is not None
+        print(f"{name:<20} {newton_calls:>12} {newton_result:<10} {result.evaluations:>12} {result.reason:<14}")
+    print(f"{'total':<20} {totals[0]:>12} {f'{solved[0]} solved':<10} "
+          f"{totals[1]:>12} {solved[1]} solved")
+
+
+def bench_trace(n: int) -> None:
+    guesses = [0.5 + 3 * i / n for i in range(n)]
+    for label, trace in (("trace=None", None), ("IterationTrace", nr.IterationTrace())):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for guess in guesses:
+                nr.newton_raphson_find_root(nr.func, nr.deriv, guess, nr.TOLERANCE, nr.MAX_ITERATIONS, trace)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<16} {elapsed:>8.2f}s {elapsed / n * 1e9:>8.0f} ns/solve")
+    print(f"traced {trace.solves:,} solves, {trace.iterations:,} iterations, "
+          f"{trace.converged:,} converged, slowest {trace.max_ns / 1000:.1f} us")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["trace"]:
+        bench_trace(int(sys.argv[2]) if len(sys.argv) > 2 else 200_000)
+    elif sys.argv[1:] == ["hard"]:
+        bench_hard()
+    elif sys.argv[1:2] == ["derivatives"]:
+        bench_derivatives(int(sys.argv[2]) if len(sys.argv) > 2 else 10_000)
+    elif sys.argv[1:2] == ["polynomials"]:
+        bench_polynomials(int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000)
+    else:
+        bench_sweep(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -1,8 +1,34 @@
+from __future__ import annotations
+
 import math
+import os
+import site
+import sys
+import time
+
+from array import array
+from collections import namedtuple
+
+# Imports for type checkers only, off the startup path (see benchmarks/test_startup.py)
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import BinaryIO, Callable, Dict, List, Tuple, Optional, Union
 
 # --- Constants ---
 TOLERANCE = 1e-7  # How close to the root we need to be.
 MAX_ITERATIONS = 100 # Safety limit to prevent infinite loops.
+ZERO_DERIVATIVE = 1e-12  # |f'(x)| below this counts as a horizontal tangent.
+
+# Status codes returned per starting point by newton_raphson_find_roots.
+STATUS_CONVERGED = 0
+STATUS_ZERO_DERIVATIVE = 1
+STATUS_MAX_ITERATIONS = 2
+
+# Reasons find_root_bracketed stopped.
+REASON_CONVERGED = "converged"            # |f(x)| < tolerance
+REASON_INTERVAL = "interval"              # The bracket shrank to floating-point resolution
+REASON_NO_SIGN_CHANGE = "no sign change"  # f(lower) and f(upper) have the same sign
+REASON_MAX_ITERATIONS = "max iterations"
 
 # --- Core Functions ---
 
@@ -20,54 +46,603 @@ def deriv(x: float) -> float:
     """
     return 3 * x**2 - 1
 
-from typing import Callable, Tuple, Optional
+# --- Automatic Differentiation ---
+
+class Dual:
+    """
+    A dual number val + der*e (where e*e = 0), for forward-mode automatic
+    differentiation. Evaluating f(Dual(x, 1.0)) with ordinary arithmetic
+    gives f(x) in val and f'(x) in der, exactly (no step size), in one
+    call of f. Use the exp, log, sin, cos and sqrt below in place of the
+    math module's for functions that need them.
+    """
+
+    __slots__ = ("val", "der")
+
+    def __init__(self, val: float, der: float = 0.0) -> None:
+        self.val = val
+        self.der = der
+
+    def __repr__(self) -> str:
+        return f"Dual({self.val!r}, {self.der!r})"
+
+    def __add__(self, other: Union["Dual", float]) -> "Dual":
+        if isinstance(other, Dual):
+            return Dual(self.val + other.val, self.der + other.der)
+        return Dual(self.val + other, self.der)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Union["Dual", float]) -> "Dual":
+        if isinstance(other, Dual):
+            return Dual(self.val - other.val, self.der - other.der)
+        return Dual(self.val - other, self.der)
+
+    def __rsub__(self, other: float) -> "Dual":
+        return Dual(other - self.val, -self.der)
+
+    def __mul__(self, other: Union["Dual", float]) -> "Dual":
+        if isinstance(other, Dual):
+            return Dual(self.val * other.val, self.der * other.val + self.val * other.der)
+        return Dual(self.val * other, self.der * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: Union["Dual", float]) -> "Dual":
+        if isinstance(other, Dual):
+            return Dual(self.val / other.val,
+                        (self.der * other.val - self.val * other.der) / (other.val * other.val))
+        return Dual(self.val / other, self.der / other)
+
+    def __rtruediv__(self, other: float) -> "Dual":
+        return Dual(other / self.val, -other * self.der / (self.val * self.val))
+
+    def __pow__(self, power: Union["Dual", float]) -> "Dual":
+        if isinstance(power, Dual):  # x^y = exp(y log x)
+            return exp(power * log(self))
+        return Dual(self.val ** power, power * self.val ** (power - 1) * self.der)
+
+    def __rpow__(self, base: float) -> "Dual":
+        value = base ** self.val
+        return Dual(value, value * math.log(base) * self.der)
+
+    def __neg__(self) -> "Dual":
+        return Dual(-self.val, -self.der)
+
+    def __pos__(self) -> "Dual":
+        return self
+
+    def __abs__(self) -> "Dual":
+        return -self if self.val < 0 else self
+
+    # Comparisons use the value, so piecewise functions still work
+    def __lt__(self, other: Union["Dual", float]) -> bool:
+        return self.val < (other.val if isinstance(other, Dual) else other)
+
+    def __le__(self, other: Union["Dual", float]) -> bool:
+        return self.val <= (other.val if isinstance(other, Dual) else other)
+
+    def __gt__(self, other: Union["Dual", float]) -> bool:
+        return self.val > (other.val if isinstance(other, Dual) else other)
+
+    def __ge__(self, other: Union["Dual", float]) -> bool:
+        return self.val >= (other.val if isinstance(other, Dual) else other)
+
+def exp(x):
+    """math.exp that also accepts a Dual."""
+    if isinstance(x, Dual):
+        value = math.exp(x.val)
+        return Dual(value, value * x.der)
+    return math.exp(x)
+
+def log(x):
+    """math.log (natural log) that also accepts a Dual."""
+    if isinstance(x, Dual):
+        return Dual(math.log(x.val), x.der / x.val)
+    return math.log(x)
+
+def sin(x):
+    """math.sin that also accepts a Dual."""
+    if isinstance(x, Dual):
+        return Dual(math.sin(x.val), math.cos(x.val) * x.der)
+    return math.sin(x)
+
+def cos(x):
+    """math.cos that also accepts a Dual."""
+    if isinstance(x, Dual):
+        return Dual(math.cos(x.val), -math.sin(x.val) * x.der)
+    return math.cos(x)
+
+def sqrt(x):
+    """math.sqrt that also accepts a Dual."""
+    if isinstance(x, Dual):
+        value = math.sqrt(x.val)
+        return Dual(value, x.der / (2 * value))
+    return math.sqrt(x)
+
+def value_and_derivative(f: Callable, x: float) -> Tuple[float, float]:
+    """
+    Returns (f(x), f'(x)) from a single call of f, by forward-mode
+    automatic differentiation. f must be written with ordinary arithmetic
+    (and the Dual-aware functions above), e.g. func works as it is.
+    """
+    result = f(Dual(x, 1.0))
+    if isinstance(result, Dual):
+        return result.val, result.der
+    return result, 0.0  # f ignored x: a constant
+
+# --- Tracing ---
+
+class IterationTrace:
+    """
+    Records what newton_raphson_find_root does, for profiling. Pass one as
+    trace= to any number of solves.
+
+    Every iteration's x_n, f(x_n), f'(x_n) and step (x_n+1 - x_n, or NaN
+    when no step was taken) go into preallocated ring buffers, so only the
+    last `capacity` iterations are kept and recording never allocates.
+    Counters cover every solve: solves, converged, iterations and the
+    total and slowest wall time in nanoseconds.
+    """
+
+    __slots__ = ("capacity", "x", "fx", "dfx", "step", "solve", "count",
+                 "solves", "converged", "iterations", "total_ns", "max_ns")
+
+    def __init__(self, capacity: int = 4096) -> None:
+        if capacity < 1:
+            raise ValueError(f"An IterationTrace needs room for at least 1 iteration, not {capacity}.")
+        self.capacity = capacity
+        self.x = array("d", bytes(8 * capacity))
+        self.fx = array("d", bytes(8 * capacity))
+        self.dfx = array("d", bytes(8 * capacity))
+        self.step = array("d", bytes(8 * capacity))
+        self.solve = array("Q", bytes(8 * capacity))  # Which solve (from 1) each entry is
+        self.count = 0  # Iterations recorded so far, including overwritten ones
+        self.solves = self.converged = self.iterations = self.total_ns = self.max_ns = 0
+
+    def record(self, x: float, fx: float, dfx: float, step: float) -> None:
+        slot = self.count % self.capacity
+        self.x[slot] = x
+        self.fx[slot] = fx
+        self.dfx[slot] = dfx
+        self.step[slot] = step
+        self.solve[slot] = self.solves
+        self.count += 1
+
+    def finish(self, iterations: int, converged: bool, start_ns: int) -> None:
+        """Updates the counters at the end of a solve started at start_ns."""
+        elapsed = time.perf_counter_ns() - start_ns
+        self.iterations += iterations
+        self.converged += converged
+        self.total_ns += elapsed
+        self.max_ns = max(self.max_ns, elapsed)
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def records(self) -> List[Tuple[int, float, float, float, float]]:
+        """The retained entries, oldest first, as (solve, x, fx, dfx, step)."""
+        start = self.count - len(self)
+        slots = [i % self.capacity for i in range(start, self.count)]
+        return [(self.solve[k], self.x[k], self.fx[k], self.dfx[k], self.step[k]) for k in slots]
+
 
 def newton_raphson_find_root(
     f: Callable[[float], float],
-    df: Callable[[float], float],
+    df: Optional[Callable[[float], float]],
     initial_guess: float,
     tolerance: float,
-    max_iter: int
+    max_iter: int,
+    trace: Optional[IterationTrace] = None
 ) -> Tuple[Optional[float], int]:
     """
     Finds a root of a function using the Newton-Raphson iterative method.
 
     This is a "pure" function: it takes functions as arguments and returns a value.
     - f: The function to solve (e.g., func)
-    - df: The derivative of the function (e.g., deriv)
+    - df: The derivative of the function (e.g., deriv), or None to get it
+      by automatic differentiation (see Dual)
     - initial_guess (float): Where to start the search.
     - tolerance (float): The stopping criterion.
     - max_iter (int): The maximum number of iterations to attempt.
+    - trace (IterationTrace): Optionally, where to record each iteration.
+      Without one, tracing costs a single None check per iteration.
     
     Returns: The (float) root if found within max_iter, otherwise None.
     """
     x_n = initial_guess  # Our starting point, x_0
+    if trace is not None:
+        trace.solves += 1
+        start_ns = time.perf_counter_ns()
 
     for i in range(max_iter):
-        fx = f(x_n)
-        dfx = df(x_n)
+        if df is None:
+            fx, dfx = value_and_derivative(f, x_n)
+        else:
+            fx = f(x_n)
+            dfx = df(x_n)
 
         # Check for convergence: if f(x_n) is very close to 0, we found the root.
         if abs(fx) < tolerance:
+            if trace is not None:
+                trace.record(x_n, fx, dfx, math.nan)
+                trace.finish(i, True, start_ns)
             # Return the root and the number of iterations it took
             return x_n, i
 
         # Check for division by zero (horizontal tangent), which fails the method.
         # We check against a very small number, not just literal 0.
-        if abs(dfx) < 1e-12:
+        if abs(dfx) < ZERO_DERIVATIVE:
+            if trace is not None:
+                trace.record(x_n, fx, dfx, math.nan)
+                trace.finish(i, False, start_ns)
             print(f"\nError: Derivative was zero at x = {x_n}. Failed to converge.")
             return None, i
 
         # The Newton-Raphson formula: x_n+1 = x_n - f(x_n) / f'(x_n)
         x_n_plus_1 = x_n - (fx / dfx)
+        if trace is not None:
+            trace.record(x_n, fx, dfx, x_n_plus_1 - x_n)
         
         # Update our current guess for the next loop iteration
         x_n = x_n_plus_1
 
+    if trace is not None:
+        trace.finish(max_iter, False, start_ns)
     # If the loop completes, we failed to converge within max_iterations
     print(f"\nError: Failed to converge after {max_iter} iterations.")
     return None, max_iter
 
+def newton_raphson_find_roots(f: Callable, df: Callable, initial_guesses, tolerance: float, max_iter: int):
+    """
+    Vectorized Newton-Raphson: runs newton_raphson_find_root from every
+    starting point in an array at once, using NumPy (which must be installed).
+
+    All starting points ("lanes") iterate together. Lanes that converge or
+    hit a near-zero derivative are dropped from the working arrays, so later
+    iterations only compute the lanes still running. Each lane follows
+    exactly the same rules as newton_raphson_find_root.
+
+    - f, df: The function and its derivative. They are called with NumPy
+      arrays, so they must work element-wise (e.g. func and deriv do).
+    - initial_guesses: An array (any shape) or sequence of starting points.
+    - tolerance, max_iter: As for newton_raphson_find_root.
+
+    Returns: (roots, iterations, status), arrays shaped like initial_guesses.
+    roots is NaN where no root was found; status holds STATUS_CONVERGED,
+    STATUS_ZERO_DERIVATIVE or STATUS_MAX_ITERATIONS for each lane.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    guesses = np.asarray(initial_guesses, dtype=float)
+    shape = guesses.shape
+    x_n = guesses.ravel().copy()
+    roots = np.full(x_n.size, np.nan)
+    iterations = np.full(x_n.size, max_iter, dtype=np.int64)
+    status = np.full(x_n.size, STATUS_MAX_ITERATIONS, dtype=np.int8)
+    lanes = np.arange(x_n.size)  # Which original lane each x_n entry is
+
+    for i in range(max_iter):
+        if lanes.size == 0:
+            break
+        fx = np.broadcast_to(np.asarray(f(x_n), dtype=float), x_n.shape)
+        dfx = np.broadcast_to(np.asarray(df(x_n), dtype=float), x_n.shape)
+
+        # Converged lanes: record the root and the iteration count
+        converged = np.abs(fx) < tolerance
+        done = lanes[converged]
+        roots[done] = x_n[converged]
+        iterations[done] = i
+        status[done] = STATUS_CONVERGED
+
+        # Horizontal tangent: give up on those lanes
+        flat = ~converged & (np.abs(dfx) < ZERO_DERIVATIVE)
+        iterations[lanes[flat]] = i
+        status[lanes[flat]] = STATUS_ZERO_DERIVATIVE
+
+        # Newton step for the lanes still running
+        running = ~(converged | flat)
+        lanes = lanes[running]
+        x_n = x_n[running] - fx[running] / dfx[running]
+
+    return roots.reshape(shape), iterations.reshape(shape), status.reshape(shape)
+
+# --- Bracketed Hybrid Solver ---
+
+class RootResult(namedtuple("RootResult", ("root", "iterations", "evaluations", "reason"))):
+    """
+    The outcome of find_root_bracketed:
+    - root (Optional[float]): None unless a root was found.
+    - iterations (int)
+    - evaluations (int): Calls of f and df (an autodiff call counts once).
+    - reason (str): One of the REASON_* constants.
+    """
+
+    __slots__ = ()
+
+def find_root_bracketed(
+    f: Callable[[float], float],
+    df: Optional[Callable[[float], float]],
+    lower: float,
+    upper: float,
+    tolerance: float = TOLERANCE,
+    max_iter: int = MAX_ITERATIONS
+) -> RootResult:
+    """
+    Finds a root of f between lower and upper with Newton-Raphson,
+    safeguarded by bisection, so it always converges if f changes sign.
+
+    The bracket [lower, upper] always contains a sign change. A Newton
+    step is taken when it lands inside the bracket and is at most half
+    the size of the previous step; otherwise (a flat tangent, a wild
+    jump or slow progress) the bracket is bisected instead. Either way
+    the bracket shrinks every iteration. Nothing is printed.
+
+    - f: The function to solve.
+    - df: Its derivative, or None for automatic differentiation (see Dual).
+    - lower, upper: The bracket; f(lower) and f(upper) must differ in sign.
+    - tolerance, max_iter: As for newton_raphson_find_root.
+
+    Returns: A RootResult. The root is found when the reason is
+    REASON_CONVERGED or REASON_INTERVAL.
+    """
+    a, b = min(lower, upper), max(lower, upper)
+    fa, fb = f(a), f(b)
+    evaluations = 2
+    if abs(fa) < tolerance:
+        return RootResult(a, 0, evaluations, REASON_CONVERGED)
+    if abs(fb) < tolerance:
+        return RootResult(b, 0, evaluations, REASON_CONVERGED)
+    if (fa < 0) == (fb < 0):
+        return RootResult(None, 0, evaluations, REASON_NO_SIGN_CHANGE)
+
+    x = a + (b - a) / 2
+    step = step_before = b - a
+    for i in range(max_iter):
+        if df is None:
+            fx, dfx = value_and_derivative(f, x)
+        else:
+            fx = f(x)
+        evaluations += 1
+        if abs(fx) < tolerance:
+            return RootResult(x, i, evaluations, REASON_CONVERGED)
+        if df is not None:
+            dfx = df(x)
+            evaluations += 1
+
+        # Keep the sign change inside [a, b]
+        if (fx < 0) == (fa < 0):
+            a, fa = x, fx
+        else:
+            b = x
+
+        step_before, step = step, (fx / dfx if abs(dfx) >= ZERO_DERIVATIVE else math.inf)
+        newton = x - step
+        if not a < newton < b or abs(2 * step) > abs(step_before):
+            step = x - (a + (b - a) / 2)  # Bisect
+            newton = x - step
+        if newton == x or not a < newton < b:
+            # The bracket can't shrink any more in floating point
+            return RootResult(x, i + 1, evaluations, REASON_INTERVAL)
+        x = newton
+
+    return RootResult(None, max_iter, evaluations, REASON_MAX_ITERATIONS)
+
+# --- Batch Polynomial Solving ---
+
+POLYNOMIAL_CHUNK_SIZE = 65_536  # Equations per task in solve_polynomials
+
+def polyval_with_derivative(coefficients, x):
+    """
+    Evaluates many polynomials p and their derivatives p' at once, with
+    Horner's method: one pass over the coefficient columns, no powers.
+
+    - coefficients: An (n, degree + 1) array, highest power first (as in
+      numpy.polyval), one polynomial per row.
+    - x: An array of n points, one per row.
+
+    Returns: (p(x), p'(x)) as two arrays of n values.
+    """
+    p = coefficients[:, 0].copy()
+    dp = x * 0.0
+    for k in range(1, coefficients.shape[1]):
+        dp = dp * x + p
+        p = p * x + coefficients[:, k]
+    return p, dp
+
+def _solve_polynomial_rows(coefficients, x_n, tolerance: float, max_iter: int):
+    """
+    The Newton iteration of solve_polynomials for one block of rows, with
+    the same rules and lane compaction as newton_raphson_find_roots.
+    Returns (roots, iterations, status) arrays.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    roots = np.full(x_n.size, np.nan)
+    iterations = np.full(x_n.size, max_iter, dtype=np.int64)
+    status = np.full(x_n.size, STATUS_MAX_ITERATIONS, dtype=np.int8)
+    lanes = np.arange(x_n.size)
+
+    for i in range(max_iter):
+        if lanes.size == 0:
+            break
+        fx, dfx = polyval_with_derivative(coefficients, x_n)
+
+        converged = np.abs(fx) < tolerance
+        done = lanes[converged]
+        roots[done] = x_n[converged]
+        iterations[done] = i
+        status[done] = STATUS_CONVERGED
+
+        flat = ~converged & (np.abs(dfx) < ZERO_DERIVATIVE)
+        iterations[lanes[flat]] = i
+        status[lanes[flat]] = STATUS_ZERO_DERIVATIVE
+
+        running = ~(converged | flat)
+        lanes = lanes[running]
+        coefficients = coefficients[running]
+        x_n = x_n[running] - fx[running] / dfx[running]
+
+    return roots, iterations, status
+
+def _batch_views(buf, rows: int, cols: int):
+    """
+    Views of a solve_polynomials shared memory block, laid out as
+    [coefficients][initial guesses][roots][iterations][status].
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    sizes = (rows * cols * 8, rows * 8, rows * 8, rows * 8, rows)
+    offsets = [sum(sizes[:k]) for k in range(len(sizes) + 1)]
+    views = [np.frombuffer(buf[offsets[k]:offsets[k + 1]], dtype=dtype)
+             for k, dtype in enumerate((np.float64, np.float64, np.float64, np.int64, np.int8))]
+    views[0] = views[0].reshape(rows, cols)
+    return views
+
+# Per-worker state, set up once by _init_polynomial_worker
+_worker_shm = None
+_worker_views = None
+
+def _init_polynomial_worker(shm_name: str, rows: int, cols: int) -> None:
+    global _worker_shm, _worker_views  # pylint: disable=global-statement
+    from multiprocessing import shared_memory  # pylint: disable=import-outside-toplevel
+
+    # Workers share the parent's resource tracker, so attaching here doesn't
+    # change who unlinks the block: solve_polynomials does.
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    _worker_views = _batch_views(_worker_shm.buf, rows, cols)
+
+def _solve_polynomial_chunk(start: int, stop: int, tolerance: float, max_iter: int) -> None:
+    """Solves rows [start, stop) of the shared block, writing results in place."""
+    coefficients, guesses, roots, iterations, status = _worker_views
+    results = _solve_polynomial_rows(coefficients[start:stop], guesses[start:stop].copy(),
+                                     tolerance, max_iter)
+    roots[start:stop], iterations[start:stop], status[start:stop] = results
+
+def solve_polynomials(coefficients, initial_guesses, tolerance: float = TOLERANCE,
+                      max_iter: int = MAX_ITERATIONS, workers: Optional[int] = None,
+                      chunk_size: int = POLYNOMIAL_CHUNK_SIZE):
+    """
+    Finds a root of each of many polynomials with Newton-Raphson, using
+    NumPy (which must be installed) and a process pool.
+
+    Each row is an independent equation p(x) = 0, evaluated with
+    polyval_with_derivative, so no f or df needs to be written by hand.
+    The rows are split into chunks of chunk_size and solved on a pool of
+    worker processes. Inputs and outputs live in one shared memory block
+    that every worker reads and writes directly, so no arrays are pickled.
+    A batch that fits in one chunk is solved in this process instead.
+
+    - coefficients: An (n, degree + 1) array, highest power first.
+    - initial_guesses: n starting points, or a single one for every row.
+    - tolerance, max_iter: As for newton_raphson_find_root.
+    - workers: Number of processes (default: one per CPU).
+
+    Returns: (roots, iterations, status), arrays of n values, as for
+    newton_raphson_find_roots.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    coefficients = np.asarray(coefficients, dtype=float)
+    if coefficients.ndim != 2 or coefficients.shape[1] == 0:
+        raise ValueError("coefficients must be a 2-D array with one polynomial per row.")
+    rows, cols = coefficients.shape
+    guesses = np.broadcast_to(np.asarray(initial_guesses, dtype=float), (rows,))
+
+    if rows <= chunk_size or workers == 1:
+        return _solve_polynomial_rows(coefficients, guesses.copy(), tolerance, max_iter)
+
+    from concurrent.futures import ProcessPoolExecutor  # pylint: disable=import-outside-toplevel
+    from multiprocessing import shared_memory  # pylint: disable=import-outside-toplevel
+
+    # Per row: the coefficients, guess, root and iteration count (8 bytes
+    # each) plus a 1-byte status
+    shm = shared_memory.SharedMemory(create=True, size=rows * (8 * cols + 25))
+    views = None
+    try:
+        views = _batch_views(shm.buf, rows, cols)
+        views[0][:] = coefficients
+        views[1][:] = guesses
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_polynomial_worker,
+                                 initargs=(shm.name, rows, cols)) as pool:
+            futures = [pool.submit(_solve_polynomial_chunk, start, min(start + chunk_size, rows),
+                                   tolerance, max_iter)
+                       for start in range(0, rows, chunk_size)]
+            for future in futures:
+                future.result()
+        return tuple(view.copy() for view in views[2:])
+    finally:
+        views = None  # Release the buffer exports so the block can be closed
+        shm.close()
+        shm.unlink()
+
+# --- Batch Mode ---
+
+def _batch_function(request: dict) -> Tuple[Callable[[float], float], Callable[[float], float]]:
+    """
+    A request's function and derivative: the polynomial with the
+    "coefficients" given (highest power first, as in
+    polyval_with_derivative), evaluated with Horner's method, or func
+    and deriv if there are none.
+    """
+    if "coefficients" not in request:
+        return func, deriv
+    coefficients = [float(c) for c in request["coefficients"]]
+    if not coefficients:
+        raise ValueError("The coefficients must not be empty.")
+    degree = len(coefficients) - 1
+    derivative = [c * (degree - k) for k, c in enumerate(coefficients[:-1])]
+
+    def p(x: float) -> float:
+        value = 0.0
+        for c in coefficients:
+            value = value * x + c
+        return value
+
+    def dp(x: float) -> float:
+        value = 0.0
+        for c in derivative:
+            value = value * x + c
+        return value
+
+    return p, dp
+
+def _batch_solve(request: dict) -> dict:
+    """A "solve" request: Newton-Raphson from "guess". The root is null if it failed."""
+    f, df = _batch_function(request)
+    root, iterations = newton_raphson_find_root(f, df, float(request["guess"]),
+                                                float(request.get("tolerance", TOLERANCE)),
+                                                int(request.get("max_iter", MAX_ITERATIONS)))
+    return {"root": root, "iterations": iterations}
+
+def _batch_solve_bracketed(request: dict) -> dict:
+    """A "solve_bracketed" request: find_root_bracketed between "lower" and "upper"."""
+    f, df = _batch_function(request)
+    return find_root_bracketed(f, df, float(request["lower"]), float(request["upper"]),
+                               float(request.get("tolerance", TOLERANCE)),
+                               int(request.get("max_iter", MAX_ITERATIONS)))._asdict()
+
+# The ops of `python newton_raphson.py --batch`
+BATCH_OPERATIONS: Dict[str, Callable[[dict], object]] = {
+    "solve": _batch_solve,
+    "solve_bracketed": _batch_solve_bracketed,
+}
+
+def run_batch(in_stream: BinaryIO, out_stream: BinaryIO, chunk_size: Optional[int] = None) -> int:
+    """
+    Answers JSON requests for BATCH_OPERATIONS until the input ends, e.g.
+    `python newton_raphson.py --batch < requests.jsonl`, where
+    {"id": 1, "op": "solve", "coefficients": [1, 0, -2], "guess": 1}
+    gets {"id": 1, "result": {"root": 1.41421..., "iterations": 4}}
+    (see common/batch_mode.py). newton_raphson_find_root's failure
+    messages go to stderr, so they can't mix with the responses.
+
+    Returns: The number of requests that failed.
+    """
+    site.addsitedir(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "common"))
+    import batch_mode  # pylint: disable=import-outside-toplevel
+    return batch_mode.run_batch(BATCH_OPERATIONS, in_stream, out_stream, chunk_size)
+
 def get_user_float(prompt_message: str) -> float:
     """
     Prompts the user for a float and validates it.
@@ -120,4 +695,7 @@ def main() -> None:
 
 # --- Entry Point ---
 if __name__ == "__main__":
+    # `python newton_raphson.py --batch` answers JSON requests from stdin
+    if sys.argv[1:] == ["--batch"]:
+        sys.exit(1 if run_batch(sys.stdin.buffer, sys.stdout.buffer) else 0)
     main()
@@ -0,0 +1,302 @@
+import io
+import json
+import math
+import pytest
+from unittest.mock import patch
+
+from newton_raphson import (
+    MAX_ITERATIONS,
+    REASON_CONVERGED,
+    REASON_MAX_ITERATIONS,
+    REASON_NO_SIGN_CHANGE,
+    STATUS_CONVERGED,
+    STATUS_MAX_ITERATIONS,
+    STATUS_ZERO_DERIVATIVE,
+    TOLERANCE,
+    Dual,
+    IterationTrace,
+    cos,
+    deriv,
+    exp,
+    find_root_bracketed,
+    log,
+    sin,
+    sqrt,
+    value_and_derivative,
+    func,
+    newton_raphson_find_root,
+    newton_raphson_find_roots,
+    polyval_with_derivative,
+    run_batch,
+    solve_polynomials,
+)
+
+## ---------------------------------
+## Tests for newton_raphson_find_root()
+## ---------------------------------
+
+def test_find_root_converges():
+    """Test that the scalar solver finds the real root of x^3 - x - 1."""
+    root, iterations = newton_raphson_find_root(func, deriv, 1.5, TOLERANCE, MAX_ITERATIONS)
+    assert abs(func(root)) < TOLERANCE
+    assert 0 < iterations < MAX_ITERATIONS
+
+def test_find_root_zero_derivative():
+    """Test that a horizontal tangent fails instead of dividing by zero."""
+    with patch('builtins.print'):
+        root, iterations = newton_raphson_find_root(
+            lambda x: x * x + 1, lambda x: 2 * x, 0.0, TOLERANCE, MAX_ITERATIONS)
+    assert root is None
+    assert iterations == 0
+
+def test_find_root_autodiff():
+    """Test that df=None gives the same result as the hand-written deriv."""
+    assert newton_raphson_find_root(func, None, 1.5, TOLERANCE, MAX_ITERATIONS) == \
+        newton_raphson_find_root(func, deriv, 1.5, TOLERANCE, MAX_ITERATIONS)
+
+## ---------------------------------
+## Tests for IterationTrace
+## ---------------------------------
+
+def test_trace_records_iterations():
+    """Test that each iteration's x, f(x), f'(x) and step are recorded."""
+    trace = IterationTrace()
+    root, iterations = newton_raphson_find_root(func, deriv, 1.5, TOLERANCE, MAX_ITERATIONS, trace)
+    assert root == newton_raphson_find_root(func, deriv, 1.5, TOLERANCE, MAX_ITERATIONS)[0]
+    records = trace.records()
+    assert len(records) == len(trace) == iterations + 1
+    solve, x, fx, dfx, step = records[0]
+    assert (solve, x, fx, dfx) == (1, 1.5, func(1.5), deriv(1.5))
+    assert step == pytest.approx(-func(1.5) / deriv(1.5))
+    assert records[1][1] == pytest.approx(x + step)
+    assert records[-1][1] == root
+    assert math.isnan(records[-1][4])  # No step after converging
+    assert (trace.solves, trace.converged, trace.iterations) == (1, 1, iterations)
+    assert 0 < trace.max_ns <= trace.total_ns
+
+def test_trace_ring_buffer():
+    """Test that only the last `capacity` iterations are kept, across solves."""
+    trace = IterationTrace(capacity=5)
+    with patch('builtins.print'):
+        newton_raphson_find_root(func, deriv, 1.5, TOLERANCE, MAX_ITERATIONS, trace)
+        newton_raphson_find_root(lambda x: x * x + 1, lambda x: 2 * x, 0.0, TOLERANCE, MAX_ITERATIONS, trace)
+        newton_raphson_find_root(lambda x: x * x + 1, lambda x: 2 * x, 0.5, TOLERANCE, 10, trace)
+    records = trace.records()
+    assert len(records) == 5
+    assert [r[0] for r in records] == [3] * 5
+    assert (trace.solves, trace.converged) == (3, 1)
+    assert trace.count == trace.iterations + 2  # The last solve ran out of iterations
+
+
+@pytest.mark.parametrize("capacity", [0, -1])
+def test_trace_rejects_no_capacity(capacity):
+    """Test that a trace must keep at least one iteration."""
+    with pytest.raises(ValueError, match="at least 1 iteration"):
+        IterationTrace(capacity=capacity)
+
+## ---------------------------------
+## Tests for Dual and value_and_derivative()
+## ---------------------------------
+
+@pytest.mark.parametrize("f, df, x", [
+    (func, deriv, 2.0),
+    (lambda x: 1 / x - x / 4, lambda x: -1 / x**2 - 0.25, 3.0),
+    (lambda x: 5 - 2 * x, lambda x: -2.0, 1.0),
+    (lambda x: x**0.5 * exp(x), lambda x: math.exp(x) * (0.5 / math.sqrt(x) + math.sqrt(x)), 1.7),
+    (lambda x: sin(x) * cos(x) + log(x), lambda x: math.cos(2 * x) + 1 / x, 0.8),
+    (lambda x: sqrt(x) + 2**x + x**x, lambda x: 0.5 / math.sqrt(x) + 2**x * math.log(2) + x**x * (math.log(x) + 1), 1.3),
+    (lambda x: abs(x) if x > 0 else -x, lambda x: -1.0, -2.0),
+])
+def test_value_and_derivative(f, df, x):
+    """Test that autodiff gives the exact value and derivative."""
+    value, derivative = value_and_derivative(f, x)
+    assert value == pytest.approx(f(x))
+    assert derivative == pytest.approx(df(x))
+
+def test_value_and_derivative_constant():
+    """Test that a function that ignores x has derivative 0."""
+    assert value_and_derivative(lambda x: 4.0, 1.0) == (4.0, 0.0)
+
+def test_dual_calls_f_once():
+    """Test that autodiff evaluates f once per iteration."""
+    calls = []
+    def f(x):
+        calls.append(x)
+        return func(x)
+    _, iterations = newton_raphson_find_root(f, None, 1.5, TOLERANCE, MAX_ITERATIONS)
+    assert len(calls) == iterations + 1
+    assert all(isinstance(x, Dual) for x in calls)
+
+## ---------------------------------
+## Tests for find_root_bracketed()
+## ---------------------------------
+
+def test_bracketed_converges_where_newton_fails():
+    """Test that bracketing rescues a start where plain Newton diverges."""
+    with patch('builtins.print'):
+        root, _ = newton_raphson_find_root(math.atan, lambda x: 1 / (1 + x * x), 7.5,
+                                           TOLERANCE, MAX_ITERATIONS)
+    assert root is None or abs(root) > 1
+    result = find_root_bracketed(math.atan, lambda x: 1 / (1 + x * x), -5, 20)
+    assert result.reason == REASON_CONVERGED
+    assert abs(result.root) < TOLERANCE
+    assert result.evaluations < 20
+
+def test_bracketed_autodiff():
+    """Test that df=None works and counts one evaluation per iteration."""
+    result = find_root_bracketed(func, None, -10, 10)
+    assert result.reason == REASON_CONVERGED
+    assert abs(func(result.root)) < TOLERANCE
+    assert result.evaluations == result.iterations + 3
+
+def test_bracketed_endpoint_root():
+    """Test that a root at either end of the bracket is returned at once."""
+    assert find_root_bracketed(lambda x: x - 2, None, 2, 5) == (2, 0, 2, REASON_CONVERGED)
+
+def test_bracketed_no_sign_change():
+    """Test that a bracket without a sign change is rejected, without printing."""
+    with patch('builtins.print') as mock_print:
+        result = find_root_bracketed(lambda x: x * x + 1, None, -1, 1)
+    assert result.root is None
+    assert result.reason == REASON_NO_SIGN_CHANGE
+    mock_print.assert_not_called()
+
+def test_bracketed_max_iterations():
+    """Test that running out of iterations is reported, not printed."""
+    result = find_root_bracketed(lambda x: (x - 1)**3, None, -3, 2.5, max_iter=3)
+    assert result == (None, 3, 5, REASON_MAX_ITERATIONS)
+
+## ---------------------------------
+## Tests for newton_raphson_find_roots()
+## ---------------------------------
+
+def test_find_roots_matches_scalar():
+    """Test that every lane gives the same result as the scalar solver."""
+    np = pytest.importorskip("numpy")
+    guesses = [-10.0, -2.5, -0.3, 0.0, 0.7, 1.0, 1.5, 2.0, 4.0, 10.0]
+    roots, iterations, status = newton_raphson_find_roots(
+        func, deriv, np.array(guesses), TOLERANCE, MAX_ITERATIONS)
+    with patch('builtins.print'):
+        for k, guess in enumerate(guesses):
+            root, its = newton_raphson_find_root(func, deriv, guess, TOLERANCE, MAX_ITERATIONS)
+            assert iterations[k] == its
+            if root is None:
+                assert math.isnan(roots[k])
+                assert status[k] != STATUS_CONVERGED
+            else:
+                assert roots[k] == pytest.approx(root, abs=1e-12)
+                assert status[k] == STATUS_CONVERGED
+
+def test_find_roots_zero_derivative():
+    """Test that a lane starting on a horizontal tangent stops at once."""
+    np = pytest.importorskip("numpy")
+    flat = 1 / math.sqrt(3)  # deriv(flat) == 0 (to within rounding)
+    roots, iterations, status = newton_raphson_find_roots(
+        func, deriv, np.array([flat, 1.5]), TOLERANCE, MAX_ITERATIONS)
+    assert status.tolist() == [STATUS_ZERO_DERIVATIVE, STATUS_CONVERGED]
+    assert iterations[0] == 0
+    assert math.isnan(roots[0])
+
+def test_find_roots_max_iterations():
+    """Test that lanes that never converge are reported as such."""
+    np = pytest.importorskip("numpy")
+    # x^2 + 1 has no real root, so Newton's method wanders forever
+    roots, iterations, status = newton_raphson_find_roots(
+        lambda x: x * x + 1, lambda x: 2 * x, np.array([0.5, 3.0]), TOLERANCE, 20)
+    assert (status == STATUS_MAX_ITERATIONS).all()
+    assert (iterations == 20).all()
+    assert np.isnan(roots).all()
+
+def test_find_roots_keeps_shape():
+    """Test that the outputs have the shape of the input."""
+    np = pytest.importorskip("numpy")
+    guesses = np.linspace(-3, 3, 12).reshape(3, 4)
+    roots, iterations, status = newton_raphson_find_roots(
+        func, deriv, guesses, TOLERANCE, MAX_ITERATIONS)
+    assert roots.shape == iterations.shape == status.shape == (3, 4)
+    converged = status == STATUS_CONVERGED
+    assert converged.any()
+    assert (np.abs(func(roots[converged])) < TOLERANCE).all()
+
+## ---------------------------------
+## Tests for solve_polynomials()
+## ---------------------------------
+
+def test_polyval_with_derivative():
+    """Test Horner evaluation against NumPy's polyval and polyder."""
+    np = pytest.importorskip("numpy")
+    coefficients = np.array([[1.0, 0.0, -1.0, -1.0], [2.0, -3.0, 0.5, 4.0], [0.0, 0.0, 0.0, 7.0]])
+    x = np.array([1.5, -2.0, 3.0])
+    p, dp = polyval_with_derivative(coefficients, x)
+    for k in range(3):
+        assert p[k] == pytest.approx(np.polyval(coefficients[k], x[k]))
+        assert dp[k] == pytest.approx(np.polyval(np.polyder(coefficients[k]), x[k]))
+
+def test_solve_polynomials_matches_scalar():
+    """Test that each row is solved like a newton_raphson_find_root call."""
+    np = pytest.importorskip("numpy")
+    coefficients = np.array([[1.0, 0.0, -1.0, -1.0],  # x^3 - x - 1
+                             [0.0, 1.0, 0.0, -2.0],   # x^2 - 2
+                             [0.0, 1.0, 0.0, 1.0]])   # x^2 + 1: no real root
+    roots, iterations, status = solve_polynomials(coefficients, 1.5)
+    assert roots[0] == pytest.approx(1.324717957, abs=1e-7)
+    assert roots[1] == pytest.approx(math.sqrt(2), abs=1e-7)
+    assert status.tolist() == [STATUS_CONVERGED, STATUS_CONVERGED, STATUS_MAX_ITERATIONS]
+    expected, its = newton_raphson_find_root(func, deriv, 1.5, TOLERANCE, MAX_ITERATIONS)
+    assert roots[0] == pytest.approx(expected)
+    assert iterations[0] == its
+
+def test_solve_polynomials_pool():
+    """Test that the process pool path gives the same results as in-process."""
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(1)
+    coefficients = np.column_stack([np.ones(500), rng.uniform(-5, 5, (500, 3))])
+    guesses = rng.uniform(-3, 3, 500)
+    expected = solve_polynomials(coefficients, guesses, workers=1)
+    results = solve_polynomials(coefficients, guesses, workers=2, chunk_size=64)
+    for got, want in zip(results, expected):
+        np.testing.assert_array_equal(got, want)
+
+def test_solve_polynomials_bad_shape():
+    """Test that coefficients must be one polynomial per row."""
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        solve_polynomials([1.0, 0.0, -1.0], 1.0)
+
+## ---------------------------------
+## Tests for run_batch()
+## ---------------------------------
+
+def test_run_batch(capsys):
+    """Test the JSON batch mode, with requests split across input chunks."""
+    requests = (b'{"id": 1, "op": "solve", "coefficients": [1, 0, -2], "guess": 1}\n'
+                b'{"id": 2, "op": "solve", "guess": 1.5}\n\n'
+                b'{"id": 3, "op": "solve", "coefficients": [1, 0, 1], "guess": 0}\n'
+                b'{"id": 4, "op": "solve_bracketed", "coefficients": [1, -1], "lower": 0, "upper": 3}\n'
+                b'{"id": 5, "op": "solve", "coefficients": [1, 2]}')
+    out = io.BytesIO()
+    assert run_batch(io.BytesIO(requests), out, chunk_size=10) == 1
+    responses = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert responses[0]["result"]["root"] == pytest.approx(math.sqrt(2))
+    assert responses[1]["result"] == dict(zip(("root", "iterations"),
+                                              newton_raphson_find_root(func, deriv, 1.5, TOLERANCE, MAX_ITERATIONS)))
+    assert responses[2] == {"id": 3, "result": {"root": None, "iterations": 0}}
+    assert responses[3]["result"]["root"] == pytest.approx(1.0)
+    assert responses[3]["result"]["reason"] == REASON_CONVERGED
+    assert responses[4] == {"id": 5, "error": "Missing field 'guess'."}
+    # The failure message for id 3 went to stderr, not among the responses
+    captured = capsys.readouterr()
+    assert captured.out == "" and "Derivative was zero" in captured.err
+
+def test_run_batch_overflow():
+    """Test that requests which overflow get errors, and later requests are still answered."""
+    requests = (b'{"id": 1, "op": "solve", "guess": 1e200}\n'
+                b'{"id": 2, "op": "solve", "guess": 1.5, "max_iter": 1e400}\n'
+                b'{"id": 3, "op": "solve", "guess": 1.5}\n')
+    out = io.BytesIO()
+    assert run_batch(io.BytesIO(requests), out) == 2
+    responses = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [response["id"] for response in responses] == [1, 2, 3]
+    assert responses[0]["error"].startswith("OverflowError")
+    assert responses[1]["error"].startswith("OverflowError")
+    assert responses[2]["result"]["root"] == pytest.approx(1.3247179572)
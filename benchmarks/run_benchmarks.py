@@ -0,0 +1,259 @@
+"""
+Benchmark suite for the hot paths of all five exercises, with regression
+tracking against a saved JSON baseline.
+
+Run with `python benchmarks/run_benchmarks.py` from the repository root:
+
+    python benchmarks/run_benchmarks.py --save         # Record a baseline
+    python benchmarks/run_benchmarks.py                # Compare against it
+    python benchmarks/run_benchmarks.py --threshold 0.5 to_roman
+
+Each benchmark is timed in batches sized to take at least MIN_BATCH_SECONDS,
+and the fastest of --repeat batches is kept (the least disturbed by
+other load), as seconds per call. Re-run with a higher --repeat on a
+noisy machine. The run fails (exit status 1) if any
+benchmark is slower than its baseline by more than the threshold, e.g.
+0.25 for 25%. Baselines are machine specific, so record one on the machine
+that runs the comparison. A fixed calibration workload is timed
+alongside, and the baseline is scaled by its change, so a machine that is
+uniformly slower today (e.g. a throttled CPU) doesn't fail the run. The same checks run under pytest with
+RUN_BENCHMARKS=1 (see test_run_benchmarks.py).
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EXERCISES = ("1_hangman", "2_number_guess", "3_roman_numerals", "4_password_generator", "5_newton_raphson")
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_REPEAT = 7
+MIN_BATCH_SECONDS = 0.05
+
+for _exercise in EXERCISES:
+    if os.path.join(ROOT, _exercise) not in sys.path:
+        sys.path.insert(0, os.path.join(ROOT, _exercise))
+
+
+class Result(NamedTuple):
+    """A benchmark compared with its baseline (None if it has none)."""
+    name: str
+    seconds: float  # Per call
+    baseline: Optional[float]
+
+    @property
+    def ratio(self) -> Optional[float]:
+        return None if self.baseline is None else self.seconds / self.baseline
+
+    def regressed(self, threshold: float) -> bool:
+        return self.ratio is not None and self.ratio > 1 + threshold
+
+
+# --- Benchmarks ---
+# Each returns a function that runs the hot path once per call. Setup
+# (imports, data files) happens outside the timed calls.
+
+def _load_words_from_file() -> Callable[[], object]:
+    import hangman as hm  # pylint: disable=import-outside-toplevel
+    path = os.path.join(ROOT, "1_hangman", "hangman_word_list.txt")
+    return lambda: hm.load_words_from_file(path)
+
+
+def _load_words_from_file_100k() -> Callable[[], object]:
+    import random  # pylint: disable=import-outside-toplevel
+    import hangman as hm  # pylint: disable=import-outside-toplevel
+    rng = random.Random(0)
+    handle, path = tempfile.mkstemp(suffix=".txt")
+    with os.fdopen(handle, "w") as word_file:
+        for _ in range(100_000):
+            word_file.write("".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=rng.randint(4, 12))) + "\n")
+    _CLEANUP.append(path)
+    return lambda: hm.load_words_from_file(path)
+
+
+def _get_display_word() -> Callable[[], object]:
+    import hangman as hm  # pylint: disable=import-outside-toplevel
+    correct = set("AEIONRST")
+    return lambda: hm.get_display_word("PROGRAMMING", correct)
+
+
+def _check_win() -> Callable[[], object]:
+    import hangman as hm  # pylint: disable=import-outside-toplevel
+    correct = set("AEIONRSTGMP")
+    return lambda: hm.check_win("PROGRAMMING", correct)
+
+
+def _check_guess() -> Callable[[], object]:
+    import number_guess as ng  # pylint: disable=import-outside-toplevel
+    return lambda: ng.check_guess(250, 500)
+
+
+def _to_roman() -> Callable[[], object]:
+    import roman_numerals as rn  # pylint: disable=import-outside-toplevel
+    return lambda: rn.to_roman(1994)
+
+
+def _from_roman() -> Callable[[], object]:
+    import roman_numerals as rn  # pylint: disable=import-outside-toplevel
+    return lambda: rn.from_roman("MCMXCIV")
+
+
+def _generate_password() -> Callable[[], object]:
+    import password_generator as pg  # pylint: disable=import-outside-toplevel
+    return lambda: pg.generate_password(16, True, True, True, True)
+
+
+def _newton_raphson_find_root() -> Callable[[], object]:
+    import newton_raphson as nr  # pylint: disable=import-outside-toplevel
+    return lambda: nr.newton_raphson_find_root(nr.func, nr.deriv, 1.5, nr.TOLERANCE, nr.MAX_ITERATIONS)
+
+
+def _calibration() -> Callable[[], object]:
+    """Fixed pure-Python work, to measure how fast the machine is right now."""
+    return lambda: sum(i * i for i in range(100))
+
+
+CALIBRATION = "calibration"
+
+BENCHMARKS: Dict[str, Callable[[], Callable[[], object]]] = {
+    "load_words_from_file": _load_words_from_file,
+    "load_words_from_file_100k": _load_words_from_file_100k,
+    "get_display_word": _get_display_word,
+    "check_win": _check_win,
+    "check_guess": _check_guess,
+    "to_roman": _to_roman,
+    "from_roman": _from_roman,
+    "generate_password": _generate_password,
+    "newton_raphson_find_root": _newton_raphson_find_root,
+}
+
+_CLEANUP: List[str] = []  # Temporary files made by benchmark setup
+
+
+# --- Running and Comparing ---
+
+def _batch_size(function: Callable[[], object]) -> int:
+    """Returns how many calls make a batch of at least MIN_BATCH_SECONDS."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_BATCH_SECONDS:
+            return number
+        number *= 2 if elapsed > MIN_BATCH_SECONDS / 10 else 10
+
+
+def _time_batch(function: Callable[[], object], number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        function()
+    return (time.perf_counter() - start) / number
+
+
+def run(names: List[str], repeat: int = DEFAULT_REPEAT) -> Dict[str, float]:
+    """
+    Runs the named benchmarks, plus the calibration workload. Returns the
+    fastest seconds per call over `repeat` batches, by name. The batches
+    are taken in rounds, one per benchmark per round, so a burst of other
+    load slows one batch of several benchmarks rather than every batch
+    of one.
+    """
+    names = [CALIBRATION] + [name for name in names if name != CALIBRATION]
+    try:
+        functions = {name: _calibration() if name == CALIBRATION else BENCHMARKS[name]()
+                     for name in names}
+        sizes = {name: _batch_size(function) for name, function in functions.items()}
+        results = {name: float("inf") for name in names}
+        for _ in range(repeat):
+            for name, function in functions.items():
+                results[name] = min(results[name], _time_batch(function, sizes[name]))
+    finally:
+        while _CLEANUP:
+            os.remove(_CLEANUP.pop())
+    return results
+
+
+def load_baseline(path: str) -> Dict[str, float]:
+    """Returns a saved baseline's seconds per call by name, or {} if there is none."""
+    try:
+        with open(path, encoding="utf-8") as baseline_file:
+            return json.load(baseline_file)["results"]
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(path: str, results: Dict[str, float]) -> None:
+    """Saves results as the baseline, merged into any existing one."""
+    merged = {**load_baseline(path), **results}
+    with open(path, "w", encoding="utf-8") as baseline_file:
+        json.dump({"python": platform.python_version(), "machine": platform.machine(),
+                   "results": dict(sorted(merged.items()))}, baseline_file, indent=2)
+        baseline_file.write("\n")
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float]) -> List[Result]:
+    """
+    Pairs each result with its baseline. If both runs timed the
+    calibration workload, baselines are scaled by how much faster or
+    slower it ran this time, so a machine-wide slowdown (CPU frequency
+    scaling, a busy neighbour) isn't reported as a regression.
+    """
+    scale = 1.0
+    if baseline.get(CALIBRATION) and results.get(CALIBRATION):
+        scale = results[CALIBRATION] / baseline[CALIBRATION]
+    return [Result(name, seconds, None if name not in baseline else baseline[name] * scale)
+            for name, seconds in results.items() if name != CALIBRATION]
+
+
+def report(compared: List[Result], threshold: float) -> Tuple[str, int]:
+    """Formats a results table. Returns (the table, number of regressions)."""
+    lines = [f"{'benchmark':<28} {'per call':>12} {'baseline':>12} {'change':>8}"]
+    regressions = 0
+    for result in compared:
+        baseline = "-" if result.baseline is None else f"{result.baseline * 1e6:.3f} us"
+        change = "" if result.ratio is None else f"{result.ratio - 1:+.1%}"
+        flag = ""
+        if result.regressed(threshold):
+            flag = "  REGRESSION"
+            regressions += 1
+        lines.append(f"{result.name:<28} {result.seconds * 1e6:>9.3f} us {baseline:>12} {change:>8}{flag}")
+    return "\n".join(lines), regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the exercises' hot paths.")
+    parser.add_argument("names", nargs="*", metavar="NAME",
+                        help=f"benchmarks to run (default: all): {', '.join(BENCHMARKS)}")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"allowed slowdown before failing (default {DEFAULT_THRESHOLD})")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--save", action="store_true", help="save the results as the new baseline")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+
+    results = run(args.names or list(BENCHMARKS), args.repeat)
+    table, regressions = report(compare(results, load_baseline(args.baseline)), args.threshold)
+    print(table)
+    if args.save:
+        save_baseline(args.baseline, results)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+    if regressions:
+        print(f"{regressions} benchmark(s) regressed by more than {args.threshold:.0%}.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
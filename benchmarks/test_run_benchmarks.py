@@ -0,0 +1,65 @@
+import json
+import os
+
+import pytest
+
+import run_benchmarks as rb
+
+
+# --- Tests for the harness itself (fast, always run) ---
+
+def test_compare_flags_regressions():
+    """Tests that only slowdowns beyond the threshold count as regressions."""
+    compared = rb.compare({"a": 1.2e-6, "b": 1.3e-6, "new": 5e-6}, {"a": 1e-6, "b": 1e-6})
+    assert [r.name for r in compared if r.regressed(0.25)] == ["b"]
+    assert compared[2].baseline is None and not compared[2].regressed(0.0)
+    table, regressions = rb.report(compared, 0.25)
+    assert regressions == 1
+    assert "REGRESSION" in table.splitlines()[2]
+
+
+def test_compare_scales_by_calibration():
+    """Tests that a uniformly slower machine isn't reported as a regression."""
+    results = {rb.CALIBRATION: 2e-6, "a": 2e-6}
+    assert not rb.compare(results, {rb.CALIBRATION: 1e-6, "a": 1e-6})[0].regressed(0.25)
+    assert rb.compare({rb.CALIBRATION: 1e-6, "a": 2e-6},
+                      {rb.CALIBRATION: 1e-6, "a": 1e-6})[0].regressed(0.25)
+
+
+def test_save_and_load_baseline(tmp_path):
+    """Tests that saving merges into an existing baseline."""
+    path = str(tmp_path / "baseline.json")
+    assert rb.load_baseline(path) == {}
+    rb.save_baseline(path, {"a": 1.0, "b": 2.0})
+    rb.save_baseline(path, {"b": 3.0})
+    assert rb.load_baseline(path) == {"a": 1.0, "b": 3.0}
+    with open(path, encoding="utf-8") as baseline_file:
+        assert "python" in json.load(baseline_file)
+
+
+def test_main_fails_on_regression(tmp_path, capsys):
+    """Tests the exit status against a baseline that is impossibly fast."""
+    path = str(tmp_path / "baseline.json")
+    rb.save_baseline(path, {"check_guess": 1e-12})
+    assert rb.main(["check_guess", "--baseline", path, "--repeat", "1"]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
+    rb.save_baseline(path, {"check_guess": 1.0})
+    assert rb.main(["check_guess", "--baseline", path, "--repeat", "1"]) == 0
+
+
+# --- The benchmarks (slow, only with RUN_BENCHMARKS=1) ---
+
+@pytest.mark.skipif(not os.environ.get("RUN_BENCHMARKS"),
+                    reason="set RUN_BENCHMARKS=1 to run the benchmarks")
+def test_no_regressions():
+    """
+    Runs every benchmark against benchmarks/baseline.json (or the file in
+    BENCHMARK_BASELINE), failing on regressions beyond BENCHMARK_THRESHOLD.
+    """
+    path = os.environ.get("BENCHMARK_BASELINE", rb.DEFAULT_BASELINE)
+    threshold = float(os.environ.get("BENCHMARK_THRESHOLD", rb.DEFAULT_THRESHOLD))
+    baseline = rb.load_baseline(path)
+    if not baseline:
+        pytest.skip(f"no baseline at {path}; record one with run_benchmarks.py --save")
+    table, regressions = rb.report(rb.compare(rb.run(list(rb.BENCHMARKS)), baseline), threshold)
+    assert regressions == 0, "\n" + table
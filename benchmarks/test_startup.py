@@ -0,0 +1,106 @@
+"""
+Startup regression tests for the exercise entry points.
+
+The import checks always run: each module is imported in a fresh
+interpreter with `-X importtime`, and must not pull in any of
+HEAVY_MODULES. The timing check, from launch to each program's first
+prompt, only runs with RUN_BENCHMARKS=1, since it depends on the machine.
+
+The entry points stay under budget in two ways, each noted in one line
+where it applies:
+- A heavy module is imported inside the function that first needs it
+  (marked `# pylint: disable=import-outside-toplevel`).
+- typing, and anything else needed only for annotations, is imported
+  under `TYPE_CHECKING = False` / `if TYPE_CHECKING:`, which type
+  checkers read as true and the interpreter skips. With `from __future__ import annotations`,
+  annotations are never evaluated at runtime, so the names imported
+  there don't have to exist.
+"""
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that take milliseconds to import and that no program needs
+# before its first prompt
+HEAVY_MODULES = ("argparse", "asyncio", "concurrent.futures", "hashlib", "multiprocessing",
+                 "numpy", "re", "secrets", "string", "typing")
+
+# (directory, module, extra arguments, text that marks the first prompt, input to send)
+PROGRAMS = [
+    ("1_hangman", "hangman", ["hangman_word_list.txt"], b"Guess a letter: ", b""),
+    ("2_number_guess", "number_guess", [], b"Enter your guess", b""),
+    ("3_roman_numerals", "roman_numerals", [], b"MCMXCIV", b"1994\n"),  # Filter mode: first reply
+    ("4_password_generator", "password_generator", [], b": ", b""),
+    ("5_newton_raphson", "newton_raphson", [], b"initial guess", b""),
+]
+
+# Launch to first prompt must be under 30 ms on a machine where a bare
+# interpreter starts in ~15 ms, so allow this much over a bare start.
+STARTUP_OVERHEAD_MS = float(os.environ.get("STARTUP_OVERHEAD_MS", 15))
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)  # Time with cached bytecode, as installed code has
+    return env
+
+
+def imported_modules(directory: str, module: str) -> set:
+    """Returns the modules imported by `import module` in a fresh interpreter."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=os.path.join(ROOT, directory), env=_env(),
+                            capture_output=True, text=True, check=True)
+    return {line.rsplit("|", 1)[1].strip() for line in result.stderr.splitlines()
+            if line.startswith("import time:") and "|" in line} - {"imported package"}
+
+
+def time_to_prompt(args: list, directory: str, prompt: bytes, stdin: bytes = b"", runs: int = 7) -> float:
+    """Returns the fastest seconds from launch until prompt appears on stdout."""
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        process = subprocess.Popen(args, cwd=os.path.join(ROOT, directory), env=_env(),
+                                   stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                   stderr=subprocess.DEVNULL)
+        try:
+            if stdin:
+                process.stdin.write(stdin)
+                process.stdin.flush()
+            output = b""
+            while prompt not in output:
+                chunk = process.stdout.read1(4096)
+                if not chunk:
+                    raise AssertionError(f"{args} exited before {prompt!r}: {output!r}")
+                output += chunk
+            best = min(best, time.perf_counter() - start)
+        finally:
+            process.kill()
+            process.wait()
+    return best
+
+
+@pytest.mark.parametrize("directory, module", [(d, m) for d, m, *_ in PROGRAMS])
+def test_no_heavy_imports(directory, module):
+    """Tests that importing an entry point loads none of HEAVY_MODULES."""
+    heavy = imported_modules(directory, module) & set(HEAVY_MODULES)
+    assert not heavy, f"{module} imports {sorted(heavy)} at startup"
+
+
+@pytest.mark.skipif(not os.environ.get("RUN_BENCHMARKS"),
+                    reason="set RUN_BENCHMARKS=1 to time startup")
+@pytest.mark.parametrize("directory, module, extra, prompt, stdin", PROGRAMS)
+def test_time_to_first_prompt(directory, module, extra, prompt, stdin):
+    """Tests launch-to-first-prompt time against a bare interpreter's."""
+    bare = time_to_prompt([sys.executable, "-c", "input('? ')"], directory, b"? ")
+    # -m runs the module from its cached bytecode, unlike `python module.py`
+    args = [sys.executable, "-m", module] + extra
+    time_to_prompt(args, directory, prompt, stdin, runs=1)  # Write the bytecode cache
+    elapsed = time_to_prompt(args, directory, prompt, stdin)
+    overhead_ms = (elapsed - bare) * 1000
+    assert overhead_ms < STARTUP_OVERHEAD_MS, \
+        f"{module}: {elapsed * 1000:.1f} ms to first prompt ({overhead_ms:.1f} ms over a bare start)"
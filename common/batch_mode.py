@@ -0,0 +1,90 @@
+"""
+The JSON batch mode shared by every exercise's `--batch` option.
+
+One long-lived process answers newline-delimited JSON requests on stdin,
+one response line each on stdout, in request order:
+
+    {"id": 1, "op": "to_roman", "number": 1994}
+    -> {"id": 1, "result": "MCMXCIV"}
+
+A request that fails gets {"id": ..., "error": "..."} instead, and the
+requests after it are still answered. Each exercise supplies its own
+operations: a dict from op name to a function that takes the request's
+fields and returns the result.
+
+The exercises are separate directories run as scripts, not an installed
+package, so this directory isn't on sys.path by default. Each entry point
+that needs a module from it (an exercise's run_batch, or a load-test
+script's main) first calls site.addsitedir on ../common, which adds it
+just once however often it is called, and then imports the module.
+"""
+from __future__ import annotations
+
+import json
+import sys
+
+from contextlib import redirect_stdout
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import BinaryIO, Callable, Dict, Optional
+
+CHUNK_SIZE = 1 << 16  # Bytes read from the input at a time
+
+
+def respond(request_line: bytes, operations: Dict[str, Callable[[dict], object]]) -> dict:
+    """Answers one request line with operations. Returns the response."""
+    try:
+        request = json.loads(request_line)
+    except ValueError as e:
+        return {"id": None, "error": f"Invalid JSON: {e}"}
+    except RecursionError:
+        return {"id": None, "error": "Invalid JSON: nested too deeply."}
+    if not isinstance(request, dict):
+        return {"id": None, "error": "A request must be a JSON object."}
+    op = request.get("op")
+    operation = operations.get(op) if isinstance(op, str) else None
+    if operation is None:
+        return {"id": request.get("id"),
+                "error": f"Unknown op {op!r}. Expected one of: {', '.join(operations)}."}
+    try:
+        return {"id": request.get("id"), "result": operation(request)}
+    except KeyError as e:
+        return {"id": request.get("id"), "error": f"Missing field {e}."}
+    except (AttributeError, TypeError, ValueError) as e:
+        return {"id": request.get("id"), "error": str(e)}
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        # Any request can fail (e.g. OverflowError on huge numbers), but
+        # must not end the process or lose the rest of its chunk
+        return {"id": request.get("id"), "error": f"{type(e).__name__}: {e}"}
+
+
+def run_batch(operations: Dict[str, Callable[[dict], object]], in_stream: BinaryIO,
+              out_stream: BinaryIO, chunk_size: Optional[int] = None) -> int:
+    """
+    Answers requests from in_stream with operations until the input ends.
+
+    Input is read in chunks of up to chunk_size (default CHUNK_SIZE)
+    bytes, and each chunk's responses are written and flushed with a
+    single write, so a client can also send one request at a time and
+    wait for its response. Anything an operation prints goes to stderr,
+    so it can't mix with the responses.
+
+    Returns: The number of requests that failed.
+    """
+    read = getattr(in_stream, "read1", in_stream.read)
+    chunk_size = chunk_size or CHUNK_SIZE
+    failures = 0
+    partial = b""
+    with redirect_stdout(sys.stderr):
+        while True:
+            chunk = read(chunk_size)
+            lines = (partial + chunk).split(b"\n")
+            partial = lines.pop() if chunk else b""  # Keep an unfinished last line
+            responses = [respond(line, operations) for line in lines if line.strip()]
+            if responses:
+                failures += sum(1 for response in responses if "error" in response)
+                out_stream.write("".join(json.dumps(response) + "\n" for response in responses).encode())
+                out_stream.flush()
+            if not chunk:
+                return failures
@@ -0,0 +1,93 @@
+"""
+Helpers shared by the load generators for the exercises' server modes
+(1_hangman/hangman_loadtest.py and 2_number_guess/number_guess_loadtest.py),
+which import this module as described in batch_mode.py.
+"""
+import asyncio
+import subprocess
+import sys
+import time
+
+from contextlib import contextmanager
+from typing import Iterator, List, Sequence
+
+SERVER_START_TIMEOUT = 10  # Seconds to wait for a server subprocess to listen
+
+
+def raise_open_file_limit() -> int:
+    """Each session needs a socket; raise the soft limit as far as allowed.
+    A server subprocess started afterwards inherits the new limit.
+    Returns the (new) soft limit.
+    """
+    try:
+        import resource  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return 1024
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if hard == resource.RLIM_INFINITY or hard > soft:
+        target = 1 << 20 if hard == resource.RLIM_INFINITY else hard
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+        except (ValueError, OSError):
+            pass
+    return resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+
+
+def max_concurrency(sessions: int, file_limit: int) -> int:
+    """How many sessions to connect at once: all of them, unless the open
+    file limit (shared with a local server) is lower, leaving some
+    descriptors spare for everything else."""
+    return max(1, min(sessions, file_limit - 256))
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def print_report(sessions: int, concurrency: int, elapsed: float, latencies: List[float],
+                 failures: List[BaseException], fractions: Sequence[float] = (0.50, 0.99),
+                 note: str = "") -> None:
+    """Prints a load test's sessions, guess throughput (plus note) and
+    latency percentiles, and its first failure if there was one."""
+    latencies = sorted(latencies)
+    print(f"sessions: {sessions} ({len(failures)} failed, up to {concurrency} at once)")
+    print(f"guesses:  {len(latencies)} in {elapsed:.2f}s ({len(latencies) / elapsed:,.0f}/s){note}")
+    print("latency:  " + ", ".join(f"p{fraction * 100:g} {percentile(latencies, fraction) * 1000:.2f} ms"
+                                   for fraction in fractions))
+    if failures:
+        print(f"first failure: {failures[0]!r}")
+
+
+def server_is_up(host: str, port: int) -> bool:
+    """Whether something accepts connections on host:port."""
+    async def probe() -> bool:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+        except OSError:
+            return False
+        writer.close()
+        return True
+    return asyncio.run(probe())
+
+
+@contextmanager
+def local_server(command: List[str], host: str, port: int, name: str) -> Iterator[None]:
+    """Runs the server command in a subprocess until the block ends, unless
+    a server is already listening on host:port. Exits if it won't start."""
+    if server_is_up(host, port):
+        yield
+        return
+    server = subprocess.Popen(command, stdout=subprocess.DEVNULL)
+    try:
+        deadline = time.monotonic() + SERVER_START_TIMEOUT
+        while not server_is_up(host, port):
+            if time.monotonic() > deadline or server.poll() is not None:
+                sys.exit(f"Error: The {name} server did not start.")
+            time.sleep(0.05)
+        yield
+    finally:
+        server.terminate()
+        server.wait()
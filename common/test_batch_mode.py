@@ -0,0 +1,67 @@
+import io
+import json
+
+import batch_mode
+
+
+OPERATIONS = {
+    "add": lambda request: request["a"] + request["b"],
+    "int": lambda request: int(request["x"]),
+    "shout": lambda request: print(request["text"]),
+}
+
+
+def responses(requests: bytes, chunk_size: int = 8) -> list:
+    out = io.BytesIO()
+    batch_mode.run_batch(OPERATIONS, io.BytesIO(requests), out, chunk_size)
+    return [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def test_run_batch_answers_in_order():
+    """Tests one response per non-blank line, in order, across input chunks."""
+    requests = b'{"id": 1, "op": "add", "a": 1, "b": 2}\n\n{"op": "add", "a": "x", "b": "y"}\n'
+    assert responses(requests) == [{"id": 1, "result": 3}, {"id": None, "result": "xy"}]
+    assert responses(requests.rstrip(b"\n"), chunk_size=3) == responses(requests)
+
+
+def test_run_batch_reports_errors():
+    """Tests that bad requests get error responses, and the count of them."""
+    requests = (b'not json\n[1]\n{"id": 3, "op": "fly"}\n'
+                b'{"id": 4, "op": "add", "a": 1}\n{"id": 5, "op": "add", "a": 1, "b": "x"}\n')
+    out = io.BytesIO()
+    assert batch_mode.run_batch(OPERATIONS, io.BytesIO(requests), out) == 5
+    got = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [response["id"] for response in got] == [None, None, 3, 4, 5]
+    assert got[0]["error"].startswith("Invalid JSON")
+    assert got[1]["error"] == "A request must be a JSON object."
+    assert got[2]["error"] == "Unknown op 'fly'. Expected one of: add, int, shout."
+    assert got[3]["error"] == "Missing field 'b'."
+    assert "unsupported operand" in got[4]["error"]
+
+
+def test_run_batch_prints_to_stderr(capsys):
+    """Tests that what an operation prints can't mix with the responses."""
+    out = io.BytesIO()
+    batch_mode.run_batch(OPERATIONS, io.BytesIO(b'{"op": "shout", "text": "hi"}'), out)
+    assert out.getvalue() == b'{"id": null, "result": null}\n'
+    assert capsys.readouterr() == ("", "hi\n")
+
+
+def test_run_batch_survives_any_exception():
+    """Tests that a request raising e.g. OverflowError doesn't stop the ones around it."""
+    requests = b'{"id": 1, "op": "int", "x": 1}\n{"id": 2, "op": "int", "x": 1e400}\n{"id": 3, "op": "int", "x": 3}\n'
+    assert responses(requests, chunk_size=len(requests)) == [
+        {"id": 1, "result": 1},
+        {"id": 2, "error": "OverflowError: cannot convert float infinity to integer"},
+        {"id": 3, "result": 3},
+    ]
+
+
+def test_run_batch_survives_bad_op_and_deep_nesting():
+    """Tests that an unhashable op and too deeply nested JSON each get an
+    error, and the requests after them are still answered."""
+    requests = b'{"id": 1, "op": []}\n' + b"[" * 100_000 + b'\n{"id": 3, "op": "add", "a": 1, "b": 1}\n'
+    got = responses(requests, chunk_size=len(requests))
+    assert got[0] == {"id": 1, "error": "Unknown op []. Expected one of: add, int, shout."}
+    assert got[1] == {"id": None, "error": "Invalid JSON: nested too deeply."}
+    assert got[2] == {"id": 3, "result": 2}
@@ -0,0 +1,43 @@
+import loadtest
+
+
+def test_percentile():
+    """Tests nearest-rank percentiles, including the empty list."""
+    values = [float(n) for n in range(1, 101)]
+    assert loadtest.percentile(values, 0.5) == 51.0
+    assert loadtest.percentile(values, 0.99) == 100.0
+    assert loadtest.percentile(values, 1.0) == 100.0
+    assert loadtest.percentile([], 0.5) == 0.0
+
+
+def test_max_concurrency():
+    """Tests that concurrency is capped by the open file limit, but never below 1."""
+    assert loadtest.max_concurrency(10_000, 1 << 20) == 10_000
+    assert loadtest.max_concurrency(50_000, 20_000) == 20_000 - 256
+    assert loadtest.max_concurrency(5, 100) == 1
+
+
+def test_print_report(capsys):
+    """Tests the summary lines, including the optional note and percentiles."""
+    loadtest.print_report(3, 2, 0.5, [0.003, 0.001, 0.002], [], note=", all good")
+    assert capsys.readouterr().out.splitlines() == [
+        "sessions: 3 (0 failed, up to 2 at once)",
+        "guesses:  3 in 0.50s (6/s), all good",
+        "latency:  p50 2.00 ms, p99 3.00 ms",
+    ]
+    loadtest.print_report(2, 2, 1.0, [0.001], [OSError("refused")], (0.999,))
+    assert capsys.readouterr().out.splitlines()[2:] == [
+        "latency:  p99.9 1.00 ms",
+        "first failure: OSError('refused')",
+    ]
+
+
+def test_server_is_up():
+    """Tests the probe against a listening socket and a closed port."""
+    import socket
+    with socket.socket() as listener:
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        port = listener.getsockname()[1]
+        assert loadtest.server_is_up("127.0.0.1", port)
+    assert not loadtest.server_is_up("127.0.0.1", port)